@@ -291,6 +291,68 @@ def diff_snapshots(previous, current):
     }
 
 
+def diff_against_previous(
+    prs_data,
+    ci_data,
+    renovate_data,
+    codecov_data=None,
+    sonar_data=None,
+    *,
+    previous_path=None,
+    output_path=None,
+    snapshot_path=None,
+):
+    """Diff fetch data against the snapshot at ``previous_path`` and return the changes.
+
+    Changes go to ``output_path`` (stdout when unset); the new compact
+    snapshot is written to ``snapshot_path`` when set.
+    """
+    current = build_snapshot(
+        prs_data,
+        ci_data,
+        renovate_data,
+        codecov_data,
+        sonar_data,
+    )
+    previous = load_json_safe(previous_path)
+    if previous is None and previous_path:
+        print(
+            f"INFO: No previous snapshot at {previous_path} — first-run baseline",
+            file=sys.stderr,
+        )
+
+    changes = diff_snapshots(previous, current)
+
+    if output_path:
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)) or ".", exist_ok=True)
+        with open(output_path, "w") as f:
+            json.dump(changes, f, indent=2)
+            f.write("\n")
+        print(f"Changes written to {output_path}", file=sys.stderr)
+    else:
+        json.dump(changes, sys.stdout, indent=2)
+        print(file=sys.stdout)
+
+    if snapshot_path:
+        os.makedirs(os.path.dirname(os.path.abspath(snapshot_path)) or ".", exist_ok=True)
+        with open(snapshot_path, "w") as f:
+            json.dump(current, f, indent=2)
+            f.write("\n")
+        print(f"Snapshot written to {snapshot_path}", file=sys.stderr)
+
+    summary = changes["summary"]
+    total = sum(summary.values())
+    print(
+        f"Delta summary: {total} change(s) "
+        f"(new_failures={summary['new_failures']}, "
+        f"resolved={summary['resolved_failures']}, "
+        f"became_stale={summary['became_stale']}, "
+        f"newly_overdue={summary['newly_overdue']})",
+        file=sys.stderr,
+    )
+    return changes
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Diff Guardian snapshots for since-last-check deltas",
@@ -334,50 +396,15 @@ def main() -> None:
         print("ERROR: No current data files loadable", file=sys.stderr)
         sys.exit(1)
 
-    current = build_snapshot(
+    diff_against_previous(
         prs_data,
         ci_data,
         renovate_data,
         codecov_data,
         sonar_data,
-    )
-    previous = load_json_safe(args.previous)
-    if previous is None and args.previous:
-        print(
-            f"INFO: No previous snapshot at {args.previous} — first-run baseline",
-            file=sys.stderr,
-        )
-
-    changes = diff_snapshots(previous, current)
-
-    out_path = args.output
-    if out_path:
-        os.makedirs(os.path.dirname(os.path.abspath(out_path)) or ".", exist_ok=True)
-        with open(out_path, "w") as f:
-            json.dump(changes, f, indent=2)
-            f.write("\n")
-        print(f"Changes written to {out_path}", file=sys.stderr)
-    else:
-        json.dump(changes, sys.stdout, indent=2)
-        print(file=sys.stdout)
-
-    snapshot_path = args.write_previous or args.snapshot_out
-    if snapshot_path:
-        os.makedirs(os.path.dirname(os.path.abspath(snapshot_path)) or ".", exist_ok=True)
-        with open(snapshot_path, "w") as f:
-            json.dump(current, f, indent=2)
-            f.write("\n")
-        print(f"Snapshot written to {snapshot_path}", file=sys.stderr)
-
-    summary = changes["summary"]
-    total = sum(summary.values())
-    print(
-        f"Delta summary: {total} change(s) "
-        f"(new_failures={summary['new_failures']}, "
-        f"resolved={summary['resolved_failures']}, "
-        f"became_stale={summary['became_stale']}, "
-        f"newly_overdue={summary['newly_overdue']})",
-        file=sys.stderr,
+        previous_path=args.previous,
+        output_path=args.output,
+        snapshot_path=args.write_previous or args.snapshot_out,
     )
 
 
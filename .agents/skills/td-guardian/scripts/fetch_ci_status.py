@@ -6,65 +6,307 @@ identifies failing jobs, and detects flaky workflows (alternating pass/fail).
 Supports filtering by event type (e.g. --event schedule) to track scheduled
 CI health separately, matching the official Ansible DevTools status page.
 
+Batch mode fetches several repos at once (--workers), overlapping each
+repo's run listing with the follow-up failing-job and flaky-run queries.
+Flakiness is computed from the runs already listed when they cover the
+flaky window. With --flaky-history, each workflow's daily alternation
+count is kept in a local JSON store so trends need no re-fetch. With
+--run-store, runs are kept in a local SQLite history and each invocation
+only lists runs created since the repo's last sync, so long lookbacks cost
+about as much as a one-day fetch.
+
 Usage:
     python3 scripts/fetch_ci_status.py ansible ansible-lint
     python3 scripts/fetch_ci_status.py --repos-file config/repos.json
     python3 scripts/fetch_ci_status.py --repos-file config/repos.json --days 3
     python3 scripts/fetch_ci_status.py --repos-file config/repos.json --event schedule
+    python3 scripts/fetch_ci_status.py --repos-file config/repos.json --workers 16
+    python3 scripts/fetch_ci_status.py --repos-file config/repos.json --flaky-history reports/ci-flaky-history.json
+    python3 scripts/fetch_ci_status.py --repos-file config/repos.json --days 30 --run-store reports/ci-runs.sqlite
 """
 
 import argparse
 import json
-import subprocess
+import os
+import sqlite3
 import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from functools import partial
+from itertools import pairwise
+
+from github_client import default_client
 
 FLAKY_WINDOW = 5
+FLAKY_MIN_SAMPLES = 3
+FLAKY_MIN_ALTERNATIONS = 2
+# Days of per-workflow alternation counts kept in the flaky history store.
+FLAKY_HISTORY_DAYS = 30
+# Runs older than this (or than the lookback, if longer) are dropped from the run store.
+RUN_STORE_RETENTION_DAYS = 90
+# Re-list this much before the high-water mark to catch re-runs and late-indexed runs.
+RUN_STORE_OVERLAP = timedelta(days=1)
+# Furthest before the high-water mark a sync reaches back for runs still in progress;
+# older stuck runs keep their stored state rather than forcing full re-listings.
+RUN_STORE_PENDING_LOOKBACK = timedelta(days=3)
+# GitHub lists at most 1,000 runs for a filtered query; a truncated listing is
+# split into halves of its creation range, down to this span.
+RUN_LISTING_MIN_SPAN = timedelta(hours=1)
+# Run fields kept in the run store; everything fetch_repo_ci reads.
+RUN_FIELDS = (
+    "id",
+    "name",
+    "workflow_id",
+    "status",
+    "conclusion",
+    "event",
+    "html_url",
+    "head_sha",
+    "created_at",
+    "updated_at",
+)
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# Repos fetched at once in batch mode; as many follow-up queries run alongside.
+DEFAULT_WORKERS = 8
+
+_log_buffer = threading.local()
+
+
+def log(message) -> None:
+    """Print a progress message to stderr, or buffer it while running as a concurrent task."""
+    lines = getattr(_log_buffer, "lines", None)
+    if lines is None:
+        print(message, file=sys.stderr)
+    else:
+        lines.append(message)
 
 
-def gh_api(endpoint):
-    """Call gh api and return parsed JSON. Returns None on failure."""
-    cmd = ["gh", "api", endpoint]
-    print(f"  gh api {endpoint[:80]}...", file=sys.stderr)
+def _buffered(fn, *args):
+    """Call ``fn`` with its log messages buffered; returns its result and the messages."""
+    _log_buffer.lines = []
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-    except FileNotFoundError:
-        print("ERROR: gh CLI not found", file=sys.stderr)
-        sys.exit(1)
-    except subprocess.TimeoutExpired:
-        print(f"  TIMEOUT: {endpoint}", file=sys.stderr)
+        return fn(*args), _log_buffer.lines
+    finally:
+        _log_buffer.lines = None
+
+
+def _run_now(fn, *args):
+    """Call ``fn`` immediately, wrapped like a task submitted with :func:`_buffered`."""
+    future = Future()
+    future.set_result((fn(*args), []))
+    return future
+
+
+def _result(future):
+    """Wait for a task, replay its log messages in order and return its result."""
+    value, lines = future.result()
+    for line in lines:
+        log(line)
+    return value
+
+
+def gh_api(endpoint, paginate=False):
+    """Call the GitHub API through the pooled client. Returns None on failure."""
+    log(f"  gh api {endpoint[:80]}...")
+    response = default_client().fetch(endpoint, paginate=paginate)
+    if not response.ok:
+        log(f"  WARN: {endpoint} -> {response.error[:100]}")
         return None
+    return response.data
+
+
+class RunStore:
+    """Local SQLite history of workflow runs, keyed by run id.
+
+    For each (repo, branch, event filter) the store records how far back it
+    holds every run (``covered_since``) and when the runs were last listed
+    (``high_water``). A sync then only lists runs created since the
+    high-water mark, less ``RUN_STORE_OVERLAP``. It also reaches back to the
+    oldest stored run that had not completed (up to
+    ``RUN_STORE_PENDING_LOOKBACK``), so late conclusions are picked up. Safe
+    to share between threads.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id INTEGER PRIMARY KEY,
+            repo TEXT NOT NULL,
+            branch TEXT NOT NULL,
+            event TEXT NOT NULL,
+            status TEXT,
+            created_at TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS runs_by_repo ON runs (repo, branch, created_at);
+        CREATE TABLE IF NOT EXISTS syncs (
+            repo TEXT NOT NULL,
+            branch TEXT NOT NULL,
+            event TEXT NOT NULL,
+            covered_since TEXT NOT NULL,
+            high_water TEXT NOT NULL,
+            PRIMARY KEY (repo, branch, event)
+        );
+    """
+
+    def __init__(self, path):
+        """Open (creating if needed) the store at ``path``."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.executescript(self.SCHEMA)
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
+
+    def sync_start(self, repo, branch, event, since):
+        """Earliest creation time to list so the store holds every run since ``since``."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT covered_since, high_water FROM syncs WHERE repo = ? AND branch = ? AND event = ?",
+                (repo, branch, event or ""),
+            ).fetchone()
+            if row is None or since < row[0]:
+                return since
+            high_water = datetime.strptime(row[1], TIMESTAMP_FORMAT).replace(tzinfo=UTC)
+            pending = self.conn.execute(
+                "SELECT MIN(created_at) FROM runs WHERE repo = ? AND branch = ? AND created_at > ? "
+                "AND status != 'completed' AND (? = '' OR event = ?)",
+                (
+                    repo,
+                    branch,
+                    max(since, (high_water - RUN_STORE_PENDING_LOOKBACK).strftime(TIMESTAMP_FORMAT)),
+                    event or "",
+                    event or "",
+                ),
+            ).fetchone()[0]
+        start = (high_water - RUN_STORE_OVERLAP).strftime(TIMESTAMP_FORMAT)
+        if pending and pending < start:
+            start = pending
+        return max(start, since)
+
+    def record(self, repo, branch, event, start, *, listed_at, runs):
+        """Store runs listed from ``start``.
+
+        With ``listed_at``, the listing was complete: the store then covers
+        every run since ``start`` and the high-water mark advances to
+        ``listed_at``. Without it only the runs are stored.
+        """
+        rows = [
+            (
+                run["id"],
+                repo,
+                branch,
+                run.get("event") or "",
+                run.get("status"),
+                run.get("created_at") or "",
+                json.dumps({field: run.get(field) for field in RUN_FIELDS}),
+            )
+            for run in runs
+            if run.get("id")
+        ]
+        with self.lock, self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            if listed_at is None:
+                return
+            self.conn.execute(
+                "INSERT INTO syncs VALUES (?, ?, ?, ?, ?) ON CONFLICT (repo, branch, event) DO UPDATE SET "
+                "covered_since = MIN(covered_since, excluded.covered_since), high_water = excluded.high_water",
+                (repo, branch, event or "", start, listed_at),
+            )
 
-    if result.returncode != 0:
-        stderr_msg = result.stderr.strip()
-        print(f"  WARN: {endpoint} -> {stderr_msg[:100]}", file=sys.stderr)
+    def runs(self, repo, branch, event, since):
+        """Return stored runs created after ``since``, newest first like the API listing."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT data FROM runs WHERE repo = ? AND branch = ? AND created_at > ? "
+                "AND (? = '' OR event = ?) ORDER BY created_at DESC, run_id DESC",
+                (repo, branch, since, event or "", event or ""),
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def prune(self, before):
+        """Drop runs created before ``before`` and stop claiming coverage before it."""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM runs WHERE created_at < ?", (before,))
+            self.conn.execute("UPDATE syncs SET covered_since = ? WHERE covered_since < ?", (before, before))
+
+
+def list_runs(owner, repo, branch, start, end, *, event=None):
+    """List the runs created between ``start`` and ``end``, newest first.
+
+    GitHub truncates filtered listings at 1,000 runs, so while the reported
+    ``total_count`` exceeds the runs listed the range is split in half and
+    each half listed on its own. Returns ``(runs, complete)``, with
+    ``complete`` false when a range of ``RUN_LISTING_MIN_SPAN`` still held
+    more runs than could be listed, or None if a listing failed.
+    """
+    endpoint = f"repos/{owner}/{repo}/actions/runs?branch={branch}&per_page=100&created={start}..{end}"
+    if event:
+        endpoint += f"&event={event}"
+
+    data = gh_api(endpoint, paginate=True)
+    if data is None or "workflow_runs" not in data:
         return None
+    runs = data["workflow_runs"]
+    if data.get("total_count", 0) <= len(runs):
+        return runs, True
+
+    low = datetime.strptime(start, TIMESTAMP_FORMAT).replace(tzinfo=UTC)
+    high = datetime.strptime(end, TIMESTAMP_FORMAT).replace(tzinfo=UTC)
+    if high - low <= RUN_LISTING_MIN_SPAN:
+        log(f"  WARN: {owner}/{repo} lists {len(runs)} of {data['total_count']} runs between {start} and {end}")
+        return runs, False
+    middle = (low + (high - low) / 2).strftime(TIMESTAMP_FORMAT)
+    newer = list_runs(owner, repo, branch, middle, end, event=event)
+    older = list_runs(owner, repo, branch, start, middle, event=event) if newer is not None else None
+    if older is None:
+        return None
+    return newer[0] + older[0], newer[1] and older[1]
 
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
+
+def sync_runs(store, owner, repo, branch, since, *, event=None):
+    """Bring ``store`` up to date for one repo and return its runs created after ``since``.
+
+    A listing the API truncated is stored without claiming coverage, so the
+    next sync lists that range again. Returns None if the listing failed.
+    """
+    slug = f"{owner}/{repo}"
+    start = store.sync_start(slug, branch, event, since)
+    listed_at = datetime.now(UTC).strftime(TIMESTAMP_FORMAT)
+    listed = list_runs(owner, repo, branch, start, listed_at, event=event)
+    if listed is None:
+        return None
+    runs, complete = listed
+    store.record(slug, branch, event, start, listed_at=listed_at if complete else None, runs=runs)
+    return store.runs(slug, branch, event, since)
+
+
+def count_alternations(conclusions):
+    """Count conclusion changes between consecutive runs; None with too few runs to judge."""
+    if len(conclusions) < FLAKY_MIN_SAMPLES:
         return None
+    return sum(1 for previous, current in pairwise(conclusions) if previous != current)
 
 
-def detect_flaky(owner, repo, workflow_id, branch):
-    """Check last N runs of a workflow to detect flaky behavior."""
+def workflow_alternations(owner, repo, workflow_id, branch):
+    """Fetch the last N completed runs of a workflow and count their alternations."""
     data = gh_api(
         f"repos/{owner}/{repo}/actions/workflows/{workflow_id}/runs"
         f"?branch={branch}&per_page={FLAKY_WINDOW}&status=completed",
     )
     if not data or "workflow_runs" not in data:
-        return False
-
-    conclusions = [r.get("conclusion", "") for r in data["workflow_runs"]]
-    if len(conclusions) < 3:
-        return False
+        return None
+    return count_alternations([r.get("conclusion", "") for r in data["workflow_runs"]])
 
-    alternations = 0
-    for i in range(1, len(conclusions)):
-        if conclusions[i] != conclusions[i - 1]:
-            alternations += 1
 
-    return alternations >= 2
+def is_flaky(alternations):
+    """Whether an alternation count marks a workflow as flaky."""
+    return alternations is not None and alternations >= FLAKY_MIN_ALTERNATIONS
 
 
 def get_failing_jobs(owner, repo, run_id):
@@ -112,19 +354,29 @@ def fetch_primary_ci_status(owner, repo, branch, ci_workflow):
     }
 
 
-def fetch_repo_ci(owner, repo, branch, days, event=None, ci_workflow=None):
-    """Fetch CI status for a single repo."""
-    print(f"\nFetching CI for {owner}/{repo}...", file=sys.stderr)
+def fetch_repo_ci(owner, repo, branch, days, *, event=None, ci_workflow=None, executor=None, store=None):
+    """Fetch CI status for a single repo.
 
-    since = (datetime.now(UTC) - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    With ``executor``, the failing-job, flaky-run and primary CI queries are
+    all submitted to it up front and run concurrently instead of one by one.
+    With a :class:`RunStore`, the runs are synced into it incrementally and
+    the status is computed from every stored run in the window.
+    """
+    log(f"\nFetching CI for {owner}/{repo}...")
+    submit = partial(executor.submit, _buffered) if executor is not None else _run_now
 
-    endpoint = f"repos/{owner}/{repo}/actions/runs?branch={branch}&per_page=100&created=%3E{since}"
-    if event:
-        endpoint += f"&event={event}"
+    since = (datetime.now(UTC) - timedelta(days=days)).strftime(TIMESTAMP_FORMAT)
 
-    data = gh_api(endpoint)
+    if store is not None:
+        runs = sync_runs(store, owner, repo, branch, since, event=event)
+    else:
+        endpoint = f"repos/{owner}/{repo}/actions/runs?branch={branch}&per_page=100&created=%3E{since}"
+        if event:
+            endpoint += f"&event={event}"
+        data = gh_api(endpoint)
+        runs = data["workflow_runs"] if data is not None and "workflow_runs" in data else None
 
-    if data is None or "workflow_runs" not in data:
+    if runs is None:
         return {
             "owner": owner,
             "repo": repo,
@@ -135,30 +387,46 @@ def fetch_repo_ci(owner, repo, branch, days, event=None, ci_workflow=None):
             "summary": {"total": 0, "passing": 0, "failing": 0, "flaky": 0},
         }
 
-    runs = data["workflow_runs"]
-
     seen = {}
+    # Conclusions of each workflow's completed runs, newest first. The listing
+    # is newest first, so any workflow with a full window here has its latest
+    # runs here. An event filter narrows the listing, so skip reuse then.
+    completed = {}
     for run in runs:
         wf_name = run.get("name", "unknown")
         if wf_name not in seen:
             seen[wf_name] = run
+        if not event and run.get("status") == "completed":
+            completed.setdefault(run.get("workflow_id"), []).append(run.get("conclusion", ""))
 
     now = datetime.now(UTC)
     workflows = []
 
+    followups = {}
+    for wf_name, run in seen.items():
+        conclusion = run.get("conclusion", "")
+        workflow_id = run.get("workflow_id", 0)
+        jobs_task = flaky_task = None
+        if conclusion == "failure":
+            jobs_task = submit(get_failing_jobs, owner, repo, run.get("id", 0))
+        if workflow_id and conclusion in ("success", "failure"):
+            window = completed.get(workflow_id, [])[:FLAKY_WINDOW]
+            if len(window) == FLAKY_WINDOW:
+                flaky_task = _run_now(count_alternations, window)
+            else:
+                flaky_task = submit(workflow_alternations, owner, repo, workflow_id, branch)
+        followups[wf_name] = (jobs_task, flaky_task)
+    primary_task = submit(fetch_primary_ci_status, owner, repo, branch, ci_workflow)
+
     for wf_name, run in seen.items():
         conclusion = run.get("conclusion", "")
         status = run.get("status", "")
         run_id = run.get("id", 0)
         workflow_id = run.get("workflow_id", 0)
 
-        failing_jobs = []
-        if conclusion == "failure":
-            failing_jobs = get_failing_jobs(owner, repo, run_id)
-
-        is_flaky = False
-        if workflow_id and conclusion in ("success", "failure"):
-            is_flaky = detect_flaky(owner, repo, workflow_id, branch)
+        jobs_task, flaky_task = followups[wf_name]
+        failing_jobs = _result(jobs_task) if jobs_task else []
+        alternations = _result(flaky_task) if flaky_task else None
 
         updated = run.get("updated_at", "")
         age_hours = 0
@@ -181,7 +449,8 @@ def fetch_repo_ci(owner, repo, branch, days, event=None, ci_workflow=None):
                 "updated_at": updated,
                 "age_hours": age_hours,
                 "head_sha": run.get("head_sha", "")[:7],
-                "is_flaky": is_flaky,
+                "is_flaky": is_flaky(alternations),
+                "alternations": alternations,
                 "failing_jobs": failing_jobs,
             },
         )
@@ -190,7 +459,7 @@ def fetch_repo_ci(owner, repo, branch, days, event=None, ci_workflow=None):
     failing = sum(1 for w in workflows if w["conclusion"] == "failure" and not w["is_flaky"])
     flaky = sum(1 for w in workflows if w["is_flaky"])
 
-    primary_ci = fetch_primary_ci_status(owner, repo, branch, ci_workflow)
+    primary_ci = _result(primary_task)
 
     return {
         "owner": owner,
@@ -209,12 +478,144 @@ def fetch_repo_ci(owner, repo, branch, days, event=None, ci_workflow=None):
     }
 
 
+def load_flaky_history(path):
+    """Load the flaky history store, or an empty one if missing or unreadable."""
+    try:
+        with open(path) as f:
+            history = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return history if isinstance(history, dict) else {}
+
+
+def record_flaky_history(path, results, today=None):
+    """Add today's alternation counts to the flaky history store.
+
+    The store maps ``owner/repo`` to workflow id to the workflow name and
+    its alternation count per day (the last run of a day wins), keeping
+    ``FLAKY_HISTORY_DAYS`` days. Each workflow in ``results`` gains
+    ``flaky_days``: the number of stored days on which it was flaky.
+    """
+    today = today or datetime.now(UTC).date()
+    oldest = (today - timedelta(days=FLAKY_HISTORY_DAYS - 1)).isoformat()
+    history = load_flaky_history(path)
+
+    for result in results:
+        repo_history = history.setdefault(f"{result['owner']}/{result['repo']}", {})
+        for workflow in result["workflows"]:
+            entry = repo_history.setdefault(str(workflow["workflow_id"]), {"name": workflow["name"], "days": {}})
+            entry["name"] = workflow["name"]
+            if workflow.get("alternations") is not None:
+                entry["days"][today.isoformat()] = workflow["alternations"]
+            workflow["flaky_days"] = sum(1 for count in entry["days"].values() if is_flaky(count))
+
+    for repo_name in list(history):
+        repo_history = history[repo_name]
+        for workflow_id in list(repo_history):
+            days = {day: count for day, count in repo_history[workflow_id]["days"].items() if day >= oldest}
+            if days:
+                repo_history[workflow_id]["days"] = days
+            else:
+                del repo_history[workflow_id]
+        if not repo_history:
+            del history[repo_name]
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False) as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(f.name, path)
+
+
 def load_repos(path):
     """Load repo list from config file."""
     with open(path) as f:
         return json.load(f).get("repos", [])
 
 
+def fetch_batch(
+    repos,
+    days=3,
+    *,
+    branch=None,
+    event=None,
+    workers=DEFAULT_WORKERS,
+    history_file=None,
+    run_store=None,
+):
+    """Fetch CI status for each repos.json entry and aggregate the results.
+
+    ``branch`` overrides each entry's ``default_branch``. Up to ``workers``
+    repos are fetched at once, with up to as many of their follow-up queries
+    alongside; ``workers=1`` fetches repo by repo. Progress is printed per
+    repo in ``repos`` order either way. With ``history_file``, today's
+    alternation counts are recorded there (see :func:`record_flaky_history`).
+    With ``run_store`` (a SQLite path), runs are synced incrementally into
+    that :class:`RunStore`.
+    """
+    store = RunStore(run_store) if run_store else None
+
+    def fetch(r, executor=None):
+        repo_branch = branch or r.get("default_branch", "main")
+        ci_workflow = r.get("ci_workflow")
+        return fetch_repo_ci(
+            r["owner"],
+            r["repo"],
+            repo_branch,
+            days,
+            event=event,
+            ci_workflow=ci_workflow,
+            executor=executor,
+            store=store,
+        )
+
+    try:
+        if store is not None:
+            oldest = datetime.now(UTC) - timedelta(days=max(days, RUN_STORE_RETENTION_DAYS))
+            store.prune(oldest.strftime(TIMESTAMP_FORMAT))
+        if workers <= 1 or len(repos) <= 1:
+            results = [fetch(r) for r in repos]
+        else:
+            results = []
+            with (
+                ThreadPoolExecutor(max_workers=workers) as followup_pool,
+                ThreadPoolExecutor(max_workers=min(workers, len(repos))) as repo_pool,
+            ):
+                for result, lines in repo_pool.map(partial(_buffered, fetch), repos, [followup_pool] * len(repos)):
+                    for line in lines:
+                        log(line)
+                    results.append(result)
+    finally:
+        if store is not None:
+            store.close()
+
+    if history_file:
+        record_flaky_history(history_file, results)
+
+    primary_passing = sum(1 for r in results if r.get("primary_ci") and r["primary_ci"].get("status") == "success")
+    primary_failing = sum(1 for r in results if r.get("primary_ci") and r["primary_ci"].get("status") == "failure")
+
+    return {
+        "mode": "batch",
+        "total_repos": len(repos),
+        "event_filter": event,
+        "results": results,
+        "aggregate": {
+            "total_workflows": sum(r["summary"]["total"] for r in results),
+            "passing": sum(r["summary"]["passing"] for r in results),
+            "failing": sum(r["summary"]["failing"] for r in results),
+            "flaky": sum(r["summary"]["flaky"] for r in results),
+            "repos_with_errors": sum(1 for r in results if r["error"]),
+            "repos_all_green": sum(
+                1 for r in results if not r["error"] and r["summary"]["failing"] == 0 and r["summary"]["flaky"] == 0
+            ),
+            "primary_ci_passing": primary_passing,
+            "primary_ci_failing": primary_failing,
+        },
+    }
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Fetch GitHub Actions CI status")
     parser.add_argument("owner", nargs="?", help="GitHub org")
@@ -223,41 +624,36 @@ def main() -> None:
     parser.add_argument("--branch", default=None, help="Branch to check (default: from repos.json or main)")
     parser.add_argument("--days", type=int, default=3, help="Days of history to check (default: 3)")
     parser.add_argument("--event", default=None, help="Filter runs by event type (e.g. schedule, push)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Repos to fetch concurrently in batch mode (default: {DEFAULT_WORKERS}, 1 = one at a time)",
+    )
+    parser.add_argument("--flaky-history", help="JSON store of daily per-workflow alternation counts to update")
+    parser.add_argument("--run-store", help="SQLite run history to sync incrementally and compute status from")
     args = parser.parse_args()
 
     if args.repos_file:
-        repos = load_repos(args.repos_file)
-        results = []
-        for r in repos:
-            branch = args.branch or r.get("default_branch", "main")
-            ci_workflow = r.get("ci_workflow")
-            result = fetch_repo_ci(r["owner"], r["repo"], branch, args.days, event=args.event, ci_workflow=ci_workflow)
-            results.append(result)
-
-        primary_passing = sum(1 for r in results if r.get("primary_ci") and r["primary_ci"].get("status") == "success")
-        primary_failing = sum(1 for r in results if r.get("primary_ci") and r["primary_ci"].get("status") == "failure")
-
-        output = {
-            "mode": "batch",
-            "total_repos": len(repos),
-            "event_filter": args.event,
-            "results": results,
-            "aggregate": {
-                "total_workflows": sum(r["summary"]["total"] for r in results),
-                "passing": sum(r["summary"]["passing"] for r in results),
-                "failing": sum(r["summary"]["failing"] for r in results),
-                "flaky": sum(r["summary"]["flaky"] for r in results),
-                "repos_with_errors": sum(1 for r in results if r["error"]),
-                "repos_all_green": sum(
-                    1 for r in results if not r["error"] and r["summary"]["failing"] == 0 and r["summary"]["flaky"] == 0
-                ),
-                "primary_ci_passing": primary_passing,
-                "primary_ci_failing": primary_failing,
-            },
-        }
+        output = fetch_batch(
+            load_repos(args.repos_file),
+            args.days,
+            branch=args.branch,
+            event=args.event,
+            workers=args.workers,
+            history_file=args.flaky_history,
+            run_store=args.run_store,
+        )
     elif args.owner and args.repo:
         branch = args.branch or "main"
-        output = fetch_repo_ci(args.owner, args.repo, branch, args.days, event=args.event)
+        store = RunStore(args.run_store) if args.run_store else None
+        try:
+            output = fetch_repo_ci(args.owner, args.repo, branch, args.days, event=args.event, store=store)
+        finally:
+            if store is not None:
+                store.close()
+        if args.flaky_history and not output["error"]:
+            record_flaky_history(args.flaky_history, [output])
     else:
         parser.error("Provide OWNER REPO or --repos-file")
         return
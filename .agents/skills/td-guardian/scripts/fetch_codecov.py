@@ -102,6 +102,34 @@ def load_codecov_config(path):
     return [(r["owner"], r["repo"]) for r in data.get("repos", [])]
 
 
+def fetch_batch(repos, token=None):
+    """Fetch coverage for each ``(owner, repo)`` pair and aggregate the results."""
+    results = []
+    for owner, repo in repos:
+        result = fetch_repo_coverage(owner, repo, token)
+        results.append(result)
+
+    active = [r for r in results if not r["error"] and r.get("coverage") is not None]
+    coverages = [r["coverage"] for r in active]
+
+    return {
+        "mode": "batch",
+        "total_repos": len(repos),
+        "fetched_at": datetime.now(UTC).isoformat(),
+        "results": results,
+        "aggregate": {
+            "repos_with_coverage": len(active),
+            "repos_without_coverage": len(repos) - len(active),
+            "repos_with_errors": sum(1 for r in results if r["error"]),
+            "average_coverage": round(sum(coverages) / len(coverages), 2) if coverages else 0,
+            "min_coverage": min(coverages) if coverages else 0,
+            "max_coverage": max(coverages) if coverages else 0,
+            "repos_above_80": sum(1 for c in coverages if c >= 80),
+            "repos_below_50": sum(1 for c in coverages if c < 50),
+        },
+    }
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Fetch Codecov coverage data")
     parser.add_argument("owner", nargs="?", help="GitHub org")
@@ -125,30 +153,7 @@ def main() -> None:
     if len(repos) == 1 and not (args.repos_file or args.codecov_config):
         output = fetch_repo_coverage(repos[0][0], repos[0][1], token)
     else:
-        results = []
-        for owner, repo in repos:
-            result = fetch_repo_coverage(owner, repo, token)
-            results.append(result)
-
-        active = [r for r in results if not r["error"] and r.get("coverage") is not None]
-        coverages = [r["coverage"] for r in active]
-
-        output = {
-            "mode": "batch",
-            "total_repos": len(repos),
-            "fetched_at": datetime.now(UTC).isoformat(),
-            "results": results,
-            "aggregate": {
-                "repos_with_coverage": len(active),
-                "repos_without_coverage": len(repos) - len(active),
-                "repos_with_errors": sum(1 for r in results if r["error"]),
-                "average_coverage": round(sum(coverages) / len(coverages), 2) if coverages else 0,
-                "min_coverage": min(coverages) if coverages else 0,
-                "max_coverage": max(coverages) if coverages else 0,
-                "repos_above_80": sum(1 for c in coverages if c >= 80),
-                "repos_below_50": sum(1 for c in coverages if c < 50),
-            },
-        }
+        output = fetch_batch(repos, token)
 
     json.dump(output, sys.stdout, indent=2)
     print(file=sys.stdout)
@@ -19,10 +19,11 @@ python3 scripts/fetch_open_prs.py --repos-file config/repos.json --include-bots
 import argparse
 import contextlib
 import json
-import subprocess
 import sys
 from datetime import UTC, datetime
 
+from github_client import default_client
+
 STALE_THRESHOLD_DAYS = 14
 
 BOT_AUTHORS = {
@@ -38,27 +39,13 @@ BOT_AUTHORS = {
 
 
 def gh_api(endpoint):
-    """Call gh api and return parsed JSON. Returns None on failure."""
-    cmd = ["gh", "api", endpoint]
+    """Call the GitHub API through the pooled client. Returns None on failure."""
     print(f"  gh api {endpoint[:80]}...", file=sys.stderr)
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-    except FileNotFoundError:
-        print("ERROR: gh CLI not found", file=sys.stderr)
-        sys.exit(1)
-    except subprocess.TimeoutExpired:
-        print(f"  TIMEOUT: {endpoint}", file=sys.stderr)
-        return None
-
-    if result.returncode != 0:
-        stderr_msg = result.stderr.strip()
-        print(f"  WARN: {endpoint} -> {stderr_msg[:100]}", file=sys.stderr)
-        return None
-
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
+    response = default_client().fetch(endpoint)
+    if not response.ok:
+        print(f"  WARN: {endpoint} -> {response.error[:100]}", file=sys.stderr)
         return None
+    return response.data
 
 
 def get_review_states(owner, repo, pr_number):
@@ -202,6 +189,31 @@ def load_repos(path):
         return json.load(f).get("repos", [])
 
 
+def fetch_batch(repos, stale_days=14, include_bots=False):
+    """Fetch open PRs for each repos.json entry and aggregate the results."""
+    results = []
+    for r in repos:
+        result = fetch_repo_prs(r["owner"], r["repo"], stale_days, include_bots)
+        results.append(result)
+
+    return {
+        "mode": "batch",
+        "total_repos": len(repos),
+        "results": results,
+        "aggregate": {
+            "total_prs": sum(r["summary"]["total"] for r in results),
+            "ready_to_merge": sum(r["summary"]["ready_to_merge"] for r in results),
+            "needs_review": sum(r["summary"]["needs_review"] for r in results),
+            "changes_requested": sum(r["summary"]["changes_requested"] for r in results),
+            "draft": sum(r["summary"]["draft"] for r in results),
+            "stale": sum(r["summary"]["stale"] for r in results),
+            "blocked": sum(r["summary"]["blocked"] for r in results),
+            "total_bot_prs": sum(r["bot_summary"]["total"] for r in results),
+            "repos_with_errors": sum(1 for r in results if r["error"]),
+        },
+    }
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Fetch open PRs across repos")
     parser.add_argument("owner", nargs="?", help="GitHub org")
@@ -212,28 +224,7 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.repos_file:
-        repos = load_repos(args.repos_file)
-        results = []
-        for r in repos:
-            result = fetch_repo_prs(r["owner"], r["repo"], args.stale_days, args.include_bots)
-            results.append(result)
-
-        output = {
-            "mode": "batch",
-            "total_repos": len(repos),
-            "results": results,
-            "aggregate": {
-                "total_prs": sum(r["summary"]["total"] for r in results),
-                "ready_to_merge": sum(r["summary"]["ready_to_merge"] for r in results),
-                "needs_review": sum(r["summary"]["needs_review"] for r in results),
-                "changes_requested": sum(r["summary"]["changes_requested"] for r in results),
-                "draft": sum(r["summary"]["draft"] for r in results),
-                "stale": sum(r["summary"]["stale"] for r in results),
-                "blocked": sum(r["summary"]["blocked"] for r in results),
-                "total_bot_prs": sum(r["bot_summary"]["total"] for r in results),
-                "repos_with_errors": sum(1 for r in results if r["error"]),
-            },
-        }
+        output = fetch_batch(load_repos(args.repos_file), args.stale_days, args.include_bots)
     elif args.owner and args.repo:
         output = fetch_repo_prs(args.owner, args.repo, args.stale_days, args.include_bots)
     else:
@@ -14,10 +14,11 @@ import argparse
 import contextlib
 import json
 import re
-import subprocess
 import sys
 from datetime import UTC, datetime
 
+from github_client import default_client
+
 BOT_AUTHORS = {
     "renovate[bot]",
     "dependabot[bot]",
@@ -37,27 +38,13 @@ MAJOR_PATTERNS = re.compile(
 
 
 def gh_api(endpoint):
-    """Call gh api and return parsed JSON. Returns None on failure."""
-    cmd = ["gh", "api", endpoint]
+    """Call the GitHub API through the pooled client. Returns None on failure."""
     print(f"  gh api {endpoint[:80]}...", file=sys.stderr)
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-    except FileNotFoundError:
-        print("ERROR: gh CLI not found", file=sys.stderr)
-        sys.exit(1)
-    except subprocess.TimeoutExpired:
-        print(f"  TIMEOUT: {endpoint}", file=sys.stderr)
-        return None
-
-    if result.returncode != 0:
-        stderr_msg = result.stderr.strip()
-        print(f"  WARN: {endpoint} -> {stderr_msg[:100]}", file=sys.stderr)
-        return None
-
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
+    response = default_client().fetch(endpoint)
+    if not response.ok:
+        print(f"  WARN: {endpoint} -> {response.error[:100]}", file=sys.stderr)
         return None
+    return response.data
 
 
 def classify_update(title, labels) -> str:
@@ -177,6 +164,29 @@ def load_repos(path):
         return json.load(f).get("repos", [])
 
 
+def fetch_batch(repos):
+    """Fetch dependency bot PRs for each repos.json entry and aggregate the results."""
+    results = []
+    for r in repos:
+        result = fetch_repo_renovate(r["owner"], r["repo"])
+        results.append(result)
+
+    return {
+        "mode": "batch",
+        "total_repos": len(repos),
+        "results": results,
+        "aggregate": {
+            "total_prs": sum(r["summary"]["total"] for r in results),
+            "overdue": sum(r["summary"]["overdue"] for r in results),
+            "security": sum(r["summary"]["security"] for r in results),
+            "major": sum(r["summary"]["major"] for r in results),
+            "minor": sum(r["summary"]["minor"] for r in results),
+            "oldest_days": max((r["summary"]["oldest_days"] for r in results), default=0),
+            "repos_with_errors": sum(1 for r in results if r["error"]),
+        },
+    }
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Fetch Renovate/dependency bot PRs")
     parser.add_argument("owner", nargs="?", help="GitHub org")
@@ -185,26 +195,7 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.repos_file:
-        repos = load_repos(args.repos_file)
-        results = []
-        for r in repos:
-            result = fetch_repo_renovate(r["owner"], r["repo"])
-            results.append(result)
-
-        output = {
-            "mode": "batch",
-            "total_repos": len(repos),
-            "results": results,
-            "aggregate": {
-                "total_prs": sum(r["summary"]["total"] for r in results),
-                "overdue": sum(r["summary"]["overdue"] for r in results),
-                "security": sum(r["summary"]["security"] for r in results),
-                "major": sum(r["summary"]["major"] for r in results),
-                "minor": sum(r["summary"]["minor"] for r in results),
-                "oldest_days": max((r["summary"]["oldest_days"] for r in results), default=0),
-                "repos_with_errors": sum(1 for r in results if r["error"]),
-            },
-        }
+        output = fetch_batch(load_repos(args.repos_file))
     elif args.owner and args.repo:
         output = fetch_repo_renovate(args.owner, args.repo)
     else:
@@ -32,6 +32,8 @@ METRICS = [
     "sqale_rating",
 ]
 
+DEFAULT_BASE_URL = "https://sonarcloud.io"
+
 RATING_MAP = {"1.0": "A", "2.0": "B", "3.0": "C", "4.0": "D", "5.0": "E"}
 
 
@@ -167,6 +169,50 @@ def load_sonar_config(path):
         return json.load(f)
 
 
+def fetch_batch(config, token=None, base_url=DEFAULT_BASE_URL):
+    """Fetch quality gates for every project in a sonar.json config and aggregate the results.
+
+    The config's ``base_url`` takes precedence over ``base_url``.
+    """
+    now = datetime.now(UTC)
+    base_url = config.get("base_url", base_url)
+    results = []
+    for project in config["projects"]:
+        result = fetch_project(
+            base_url,
+            project["key"],
+            project["owner"],
+            project["repo"],
+            token,
+        )
+        result["fetched_at"] = now.isoformat()
+        results.append(result)
+
+    gate_ok = sum(1 for r in results if r["gate_status"] == "OK")
+    gate_error = sum(1 for r in results if r["gate_status"] == "ERROR")
+    gate_warn = sum(1 for r in results if r["gate_status"] == "WARN")
+    gate_unknown = sum(1 for r in results if r["gate_status"] == "UNKNOWN")
+
+    return {
+        "mode": "batch",
+        "organization": config.get("organization", ""),
+        "total_projects": len(config["projects"]),
+        "fetched_at": now.isoformat(),
+        "results": results,
+        "aggregate": {
+            "gate_ok": gate_ok,
+            "gate_error": gate_error,
+            "gate_warn": gate_warn,
+            "gate_unknown": gate_unknown,
+            "total_bugs": sum(r["metrics"].get("bugs", 0) for r in results if not r["error"]),
+            "total_vulnerabilities": sum(r["metrics"].get("vulnerabilities", 0) for r in results if not r["error"]),
+            "total_code_smells": sum(r["metrics"].get("code_smells", 0) for r in results if not r["error"]),
+            "total_security_hotspots": sum(r["metrics"].get("security_hotspots", 0) for r in results if not r["error"]),
+            "projects_with_errors": sum(1 for r in results if r["error"]),
+        },
+    }
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Fetch SonarCloud quality gate status")
     parser.add_argument("--sonar-config", help="Path to sonar.json config file")
@@ -175,8 +221,8 @@ def main() -> None:
     parser.add_argument("--repo", help="Repo name (for single project mode)")
     parser.add_argument(
         "--base-url",
-        default="https://sonarcloud.io",
-        help="SonarCloud base URL (default: https://sonarcloud.io)",
+        default=DEFAULT_BASE_URL,
+        help=f"SonarCloud base URL (default: {DEFAULT_BASE_URL})",
     )
     args = parser.parse_args()
 
@@ -184,45 +230,7 @@ def main() -> None:
     now = datetime.now(UTC)
 
     if args.sonar_config:
-        config = load_sonar_config(args.sonar_config)
-        base_url = config.get("base_url", args.base_url)
-        results = []
-        for project in config["projects"]:
-            result = fetch_project(
-                base_url,
-                project["key"],
-                project["owner"],
-                project["repo"],
-                token,
-            )
-            result["fetched_at"] = now.isoformat()
-            results.append(result)
-
-        gate_ok = sum(1 for r in results if r["gate_status"] == "OK")
-        gate_error = sum(1 for r in results if r["gate_status"] == "ERROR")
-        gate_warn = sum(1 for r in results if r["gate_status"] == "WARN")
-        gate_unknown = sum(1 for r in results if r["gate_status"] == "UNKNOWN")
-
-        output = {
-            "mode": "batch",
-            "organization": config.get("organization", ""),
-            "total_projects": len(config["projects"]),
-            "fetched_at": now.isoformat(),
-            "results": results,
-            "aggregate": {
-                "gate_ok": gate_ok,
-                "gate_error": gate_error,
-                "gate_warn": gate_warn,
-                "gate_unknown": gate_unknown,
-                "total_bugs": sum(r["metrics"].get("bugs", 0) for r in results if not r["error"]),
-                "total_vulnerabilities": sum(r["metrics"].get("vulnerabilities", 0) for r in results if not r["error"]),
-                "total_code_smells": sum(r["metrics"].get("code_smells", 0) for r in results if not r["error"]),
-                "total_security_hotspots": sum(
-                    r["metrics"].get("security_hotspots", 0) for r in results if not r["error"]
-                ),
-                "projects_with_errors": sum(1 for r in results if r["error"]),
-            },
-        }
+        output = fetch_batch(load_sonar_config(args.sonar_config), token, base_url=args.base_url)
     elif args.project_key:
         owner = args.owner or "unknown"
         repo = args.repo or args.project_key.split("_", 1)[-1] if "_" in args.project_key else args.project_key
@@ -0,0 +1,608 @@
+# Vendored from .agents/skills/td-supply-chain-audit/scripts/github_client.py by
+# tools/vendor_skill_modules.py; edit the source and re-run it.
+"""In-process GitHub API client with a keep-alive connection pool.
+
+Replaces one ``gh api`` subprocess per request with pooled HTTPS
+connections to ``api.github.com``. The token is resolved once per process
+(environment first, then ``gh auth token``) and reused by every caller.
+Used by the supply-chain collector and, through the copy that
+``tools/vendor_skill_modules.py`` keeps in sync, by the guardian fetch
+scripts, so both skills share one rate-limit policy and response cache.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+try:
+    from http_cache import (  # pylint: disable=import-error
+        HTTP_NOT_MODIFIED,
+        STORED_HEADERS,
+        CachedResponse,
+        HttpCache,
+        default_http_cache,
+    )
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from http_cache import (
+        HTTP_NOT_MODIFIED,
+        STORED_HEADERS,
+        CachedResponse,
+        HttpCache,
+        default_http_cache,
+    )
+
+GITHUB_API_HOST = "api.github.com"
+GITHUB_API_VERSION = "2022-11-28"
+DEFAULT_TIMEOUT_SECONDS = 30
+DEFAULT_POOL_SIZE = 16
+GH_AUTH_TOKEN_TIMEOUT_SECONDS = 10
+TOKEN_ENV_VARS = ("GITHUB_AUTH_TOKEN", "GH_TOKEN", "GITHUB_TOKEN")
+USER_AGENT = "team-devtools-github-client/1.0"
+MAX_RATE_LIMIT_RETRIES = 3
+# Fallback wait for secondary limits that send neither Retry-After nor a reset.
+SECONDARY_RATE_LIMIT_BACKOFF_SECONDS = 60
+# Extra margin after X-RateLimit-Reset so the first request lands in the new window.
+RATE_LIMIT_RESET_MARGIN_SECONDS = 1
+# Redirects GitHub sends for renamed (301) or transferred (307) repositories.
+REDIRECT_STATUSES = frozenset({301, 302, 307, 308})
+MAX_REDIRECTS = 5
+# Errors raised when a pooled keep-alive connection was closed by the server.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+@dataclass
+class GitHubResponse:
+    """Result of a GitHub API call.
+
+    Attributes:
+        status: HTTP status code, or ``0`` when the request never completed.
+        headers: Response headers with lower-cased names.
+        data: Parsed JSON body (pages merged when paginating), or ``None``.
+        error: Human-readable failure description for non-2xx responses.
+
+    """
+
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    data: Any = None
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request returned a 2xx status."""
+        return 200 <= self.status < 300  # noqa: PLR2004
+
+
+@cache
+def resolve_github_token() -> str | None:
+    """Resolve a GitHub token once per process.
+
+    Checks ``GITHUB_AUTH_TOKEN``, ``GH_TOKEN`` and ``GITHUB_TOKEN`` before
+    falling back to ``gh auth token``.
+
+    Returns:
+        Token string, or ``None`` if unavailable.
+
+    """
+    for key in TOKEN_ENV_VARS:
+        value = os.environ.get(key, "").strip()
+        if value:
+            return value
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            timeout=GH_AUTH_TOKEN_TIMEOUT_SECONDS,
+            check=False,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    token = (result.stdout or "").strip()
+    return token or None
+
+
+def _resource_for(endpoint: str) -> str:
+    """Map an endpoint to the GitHub rate-limit resource it draws from."""
+    path = endpoint.split("://", 1)[-1]
+    if path.rstrip("/").endswith("graphql"):
+        return "graphql"
+    if "search/" in path:
+        return "search"
+    return "core"
+
+
+class RateLimitGovernor:
+    """Shared, header-driven GitHub rate-limit governor.
+
+    Tracks ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` per resource
+    (``core``, ``graphql``, ``search``) so requests run unthrottled while
+    budget remains, and blocks every caller only once a resource is
+    exhausted or GitHub asks for a pause via ``Retry-After``.
+    Total time spent waiting is kept in :attr:`throttled_seconds`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no known limits."""
+        self._lock = threading.Lock()
+        self._remaining: dict[str, int] = {}
+        self._reset_at: dict[str, float] = {}
+        self._blocked_until: dict[str, float] = {}
+        self.throttled_seconds = 0.0
+
+    def _sleep(self, seconds: float) -> None:
+        """Sleep and account the wait as throttling time."""
+        if seconds <= 0:
+            return
+        time.sleep(seconds)
+        with self._lock:
+            self.throttled_seconds += seconds
+
+    def wait(self, resource: str) -> None:
+        """Block until a request against ``resource`` may be sent."""
+        with self._lock:
+            now = time.time()
+            delay = self._blocked_until.get(resource, 0.0) - now
+            if self._remaining.get(resource, 1) <= 0:
+                delay = max(delay, self._reset_at.get(resource, now) + RATE_LIMIT_RESET_MARGIN_SECONDS - now)
+        self._sleep(delay)
+
+    def observe(self, resource: str, headers: dict[str, str]) -> None:
+        """Record rate-limit headers from a response."""
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        resource = headers.get("x-ratelimit-resource", resource)
+        with self._lock:
+            if remaining is not None and remaining.isdigit():
+                self._remaining[resource] = int(remaining)
+            if reset is not None and reset.isdigit():
+                self._reset_at[resource] = float(reset)
+
+    def backoff(self, resource: str, headers: dict[str, str], attempt: int) -> float:
+        """Compute and register the pause required after a rate-limited response.
+
+        Prefers ``Retry-After``, then ``X-RateLimit-Reset`` when the primary
+        budget is exhausted, then an exponential secondary-limit backoff.
+
+        Args:
+            resource: Rate-limit resource of the request.
+            headers: Lower-cased response headers.
+            attempt: Zero-based retry attempt.
+
+        Returns:
+            Seconds every caller of ``resource`` will wait.
+
+        """
+        self.observe(resource, headers)
+        now = time.time()
+        retry_after = headers.get("retry-after", "")
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        elif headers.get("x-ratelimit-remaining") == "0" and headers.get("x-ratelimit-reset", "").isdigit():
+            delay = float(headers["x-ratelimit-reset"]) + RATE_LIMIT_RESET_MARGIN_SECONDS - now
+        else:
+            delay = float(SECONDARY_RATE_LIMIT_BACKOFF_SECONDS * 2**attempt)
+        delay = max(delay, 0.0)
+        with self._lock:
+            self._blocked_until[resource] = max(self._blocked_until.get(resource, 0.0), now + delay)
+        return delay
+
+
+def _is_rate_limited(status: int, headers: dict[str, str], message: str) -> bool:
+    """Whether a response is a primary or secondary rate-limit rejection."""
+    if status not in {403, 429}:
+        return False
+    if status == 429 or "retry-after" in headers or headers.get("x-ratelimit-remaining") == "0":  # noqa: PLR2004
+        return True
+    return "rate limit" in message.lower()
+
+
+def _next_page_url(link_header: str) -> str | None:
+    """Extract the ``rel="next"`` URL from a GitHub ``Link`` header.
+
+    Args:
+        link_header: Raw ``Link`` header value.
+
+    Returns:
+        Next page URL, or ``None`` on the last page.
+
+    """
+    for part in link_header.split(","):
+        if 'rel="next"' in part:
+            return part.split("<", 1)[1].split(">", 1)[0]
+    return None
+
+
+def _merge_page(merged: list | dict | None, page: list | dict | None) -> list | dict | None:
+    """Merge one page of results into the accumulated payload.
+
+    Arrays are concatenated. For object responses (e.g. ``workflow_runs``
+    or search results) list-valued fields are extended, matching
+    ``gh api --paginate --slurp`` merging.
+
+    Args:
+        merged: Accumulated payload so far (``None`` for the first page).
+        page: Parsed JSON of the current page.
+
+    Returns:
+        Updated merged payload.
+
+    """
+    if merged is None:
+        return page
+    if isinstance(merged, list) and isinstance(page, list):
+        merged.extend(page)
+    elif isinstance(merged, dict) and isinstance(page, dict):
+        for key, value in page.items():
+            if isinstance(value, list) and isinstance(merged.get(key), list):
+                merged[key].extend(value)
+    return merged
+
+
+class GitHubClient:
+    """Thread-safe GitHub API client backed by a keep-alive connection pool."""
+
+    def __init__(
+        self,
+        token: str | None = None,
+        *,
+        host: str = GITHUB_API_HOST,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        http_cache: HttpCache | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            token: Bearer token, or ``None`` for unauthenticated requests.
+            host: API hostname.
+            pool_size: Maximum idle connections kept for reuse.
+            http_cache: Response cache for GET requests, or ``None`` to disable.
+
+        """
+        self.token = token
+        self.host = host
+        self.http_cache = http_cache
+        self._cache_scope = HttpCache.scope_for(token)
+        self.governor = RateLimitGovernor()
+        self._idle: queue.LifoQueue[http.client.HTTPSConnection] = queue.LifoQueue(maxsize=pool_size)
+
+    def _acquire(self, timeout: float) -> http.client.HTTPSConnection:
+        """Take an idle connection from the pool or open a new one."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            return http.client.HTTPSConnection(self.host, timeout=timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _release(self, conn: http.client.HTTPSConnection) -> None:
+        """Return a healthy connection to the pool, closing it if the pool is full."""
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _headers(self, extra: dict[str, str] | None) -> dict[str, str]:
+        """Build request headers including auth and API version."""
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": USER_AGENT,
+            "X-GitHub-Api-Version": GITHUB_API_VERSION,
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def _target(self, endpoint: str) -> str:
+        """Turn an endpoint (``repos/...``) or absolute API URL into a request path."""
+        if endpoint.startswith(("https://", "http://")):
+            parsed = urllib.parse.urlsplit(endpoint)
+            return f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+        return "/" + endpoint.lstrip("/")
+
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        body: dict | list | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> GitHubResponse:
+        """Send one request over a pooled connection.
+
+        GET responses go through the client's :class:`HttpCache`: fresh
+        entries are returned without a request and stale ones are
+        revalidated, a ``304`` yielding the stored payload. Rate-limited
+        responses are retried up to ``MAX_RATE_LIMIT_RETRIES`` times after the
+        pause the :class:`RateLimitGovernor` derives from the response
+        headers. Redirects to the same host (renamed or transferred
+        repositories) are followed, as ``gh api`` does. A connection the
+        server already closed is replaced and the request retried once;
+        other transport failures yield ``status=0``.
+
+        Args:
+            method: HTTP method.
+            endpoint: API path (``repos/org/repo/...``) or absolute API URL.
+            body: JSON-serializable request body.
+            headers: Extra request headers.
+            timeout: Socket timeout in seconds.
+
+        Returns:
+            Response with parsed JSON body.
+
+        """
+        url = f"https://{self.host}{self._target(endpoint)}"
+        cache_key = entry = None
+        if self.http_cache is not None and method == "GET":
+            cache_key = self.http_cache.key(method, url, scope=self._cache_scope)
+            entry = self.http_cache.get(cache_key)
+            if entry is not None:
+                if self.http_cache.is_fresh(entry):
+                    self.http_cache.record("hits")
+                    return self._cached_response(entry)
+                headers = {**(headers or {}), **entry.conditional_headers()}
+
+        response = self._follow_redirects(method, endpoint, body=body, headers=headers, timeout=timeout)
+        if cache_key is None or self.http_cache is None:
+            return response
+        if entry is not None and response.status == HTTP_NOT_MODIFIED:
+            self.http_cache.record("revalidated")
+            self.http_cache.refresh(cache_key, entry)
+            return self._cached_response(entry)
+        if response.ok:
+            self.http_cache.record("misses")
+            fresh = CachedResponse(
+                url=url,
+                status=response.status,
+                headers={name: response.headers[name] for name in STORED_HEADERS if name in response.headers},
+                body=json.dumps(response.data),
+                stored_at=time.time(),
+            )
+            if fresh.has_validators() or self.http_cache.ttl_for(fresh.url) > 0:
+                self.http_cache.put(cache_key, fresh)
+        return response
+
+    @staticmethod
+    def _cached_response(entry: CachedResponse) -> GitHubResponse:
+        """Rebuild a response from a cache entry."""
+        return GitHubResponse(status=entry.status, headers=dict(entry.headers), data=json.loads(entry.body))
+
+    def _follow_redirects(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        body: dict | list | None,
+        headers: dict[str, str] | None,
+        timeout: float,
+    ) -> GitHubResponse:
+        """Send a request, re-sending it to the ``Location`` of same-host redirects."""
+        for _ in range(MAX_REDIRECTS):
+            response = self._request_with_retries(method, endpoint, body=body, headers=headers, timeout=timeout)
+            location = response.headers.get("location", "")
+            if response.status not in REDIRECT_STATUSES or not location:
+                return response
+            if urllib.parse.urlsplit(location).netloc not in {"", self.host}:
+                return response
+            endpoint = location
+        return self._request_with_retries(method, endpoint, body=body, headers=headers, timeout=timeout)
+
+    def _request_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        body: dict | list | None,
+        headers: dict[str, str] | None,
+        timeout: float,
+    ) -> GitHubResponse:
+        """Send a request, waiting out and retrying rate-limit rejections."""
+        resource = _resource_for(endpoint)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self.governor.wait(resource)
+            response = self._send(method, endpoint, body=body, headers=headers, timeout=timeout)
+            self.governor.observe(resource, response.headers)
+            if attempt == MAX_RATE_LIMIT_RETRIES or not _is_rate_limited(
+                response.status,
+                response.headers,
+                response.error,
+            ):
+                return response
+            delay = self.governor.backoff(resource, response.headers, attempt)
+            print(f"  Rate limited on {resource}, waiting {delay:.0f}s...", file=sys.stderr)
+        return response  # pragma: no cover
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        body: dict | list | None,
+        headers: dict[str, str] | None,
+        timeout: float,
+    ) -> GitHubResponse:
+        """Send one request without rate-limit handling."""
+        target = self._target(endpoint)
+        request_headers = self._headers(headers)
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode("utf-8")
+            request_headers["Content-Type"] = "application/json"
+
+        for attempt in range(2):
+            conn = self._acquire(timeout)
+            try:
+                conn.request(method, target, body=payload, headers=request_headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if attempt == 0:
+                    continue
+                return GitHubResponse(status=0, error="connection closed by server")
+            except TimeoutError:
+                conn.close()
+                return GitHubResponse(status=0, error="timeout")
+            except OSError as exc:
+                conn.close()
+                return GitHubResponse(status=0, error=f"{type(exc).__name__}: {exc}")
+
+            response_headers = {k.lower(): v for k, v in resp.getheaders()}
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return self._build_response(resp.status, response_headers, raw)
+        return GitHubResponse(status=0, error="connection closed by server")  # pragma: no cover
+
+    @staticmethod
+    def _build_response(status: int, headers: dict[str, str], raw: bytes) -> GitHubResponse:
+        """Decode a raw HTTP response into a :class:`GitHubResponse`."""
+        try:
+            data = json.loads(raw) if raw else None
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            data = None
+        response = GitHubResponse(status=status, headers=headers, data=data)
+        if not response.ok:
+            message = data.get("message", "") if isinstance(data, dict) else raw[:200].decode("utf-8", "replace")
+            response.error = f"HTTP {status}: {message}"
+            response.data = None
+        return response
+
+    def fetch(
+        self,
+        endpoint: str,
+        *,
+        paginate: bool = False,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> GitHubResponse:
+        """GET an endpoint, optionally following ``Link: rel="next"`` pages.
+
+        Args:
+            endpoint: API path or absolute API URL.
+            paginate: Whether to follow pagination and merge all pages.
+            timeout: Socket timeout in seconds per request.
+
+        Returns:
+            Response of the last request, with ``data`` holding the merged pages.
+
+        """
+        response = self.request("GET", endpoint, timeout=timeout)
+        if not paginate or not response.ok:
+            return response
+
+        merged = response.data
+        next_url = _next_page_url(response.headers.get("link", ""))
+        while next_url:
+            response = self.request("GET", next_url, timeout=timeout)
+            if not response.ok:
+                return response
+            merged = _merge_page(merged, response.data)
+            next_url = _next_page_url(response.headers.get("link", ""))
+        response.data = merged
+        return response
+
+    def graphql(
+        self,
+        query: str,
+        variables: dict[str, Any] | None = None,
+        *,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> GitHubResponse:
+        """Run a GraphQL query against ``/graphql``.
+
+        GraphQL reports query errors with HTTP 200; a reply without ``data``
+        is surfaced as a failed ``422`` response, while partial results keep
+        ``data`` and record the first error. ``RATE_LIMITED`` errors are
+        retried through the :class:`RateLimitGovernor` like REST limits.
+
+        Args:
+            query: GraphQL query document.
+            variables: Query variables.
+            timeout: Socket timeout in seconds.
+
+        Returns:
+            Response whose ``data`` is the GraphQL ``data`` object.
+
+        """
+        body = {"query": query, "variables": variables or {}}
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            response = self.request("POST", "graphql", body=body, timeout=timeout)
+            if not response.ok or not isinstance(response.data, dict):
+                return response
+            errors = response.data.get("errors") or []
+            rate_limited = any(err.get("type") == "RATE_LIMITED" for err in errors)
+            if not rate_limited or attempt == MAX_RATE_LIMIT_RETRIES:
+                break
+            delay = self.governor.backoff("graphql", response.headers, attempt)
+            print(f"  Rate limited on graphql, waiting {delay:.0f}s...", file=sys.stderr)
+
+        data = response.data.get("data")
+        if errors:
+            response.error = f"GraphQL: {errors[0].get('message', 'unknown error')}"
+        if data is None:
+            # Treat a data-less GraphQL reply like an unprocessable request.
+            return GitHubResponse(
+                status=422,
+                headers=response.headers,
+                error=response.error or "GraphQL: empty response",
+            )
+        response.data = data
+        return response
+
+
+@cache
+def default_client() -> GitHubClient:
+    """Return the process-wide client authenticated with :func:`resolve_github_token`."""
+    return GitHubClient(resolve_github_token(), http_cache=default_http_cache())
+
+
+def gh_api(endpoint: str, *, paginate: bool = False) -> list | dict | None:
+    """Call the GitHub REST API through the shared pooled client.
+
+    Drop-in replacement for ``gh api [--paginate] <endpoint>``.
+
+    Args:
+        endpoint: API endpoint path.
+        paginate: Whether to follow pagination.
+
+    Returns:
+        Parsed JSON, or ``None`` on error.
+
+    """
+    response = default_client().fetch(endpoint, paginate=paginate)
+    if not response.ok:
+        print(f"  WARN: {endpoint} -> {response.error[:100]}", file=sys.stderr)
+        return None
+    return response.data  # type: ignore[no-any-return]
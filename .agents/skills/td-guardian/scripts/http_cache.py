@@ -0,0 +1,333 @@
+# Vendored from .agents/skills/td-supply-chain-audit/scripts/http_cache.py by
+# tools/vendor_skill_modules.py; edit the source and re-run it.
+"""Persistent HTTP response cache with conditional revalidation.
+
+Responses are stored on disk keyed by method, URL, request body and auth
+scope, together with their ``ETag``/``Last-Modified`` validators. Entries
+younger than the TTL of the first matching :data:`DEFAULT_TTL_RULES`
+pattern are served without a request; older entries are revalidated with
+``If-None-Match``/``If-Modified-Since`` so unchanged payloads come back as
+cheap ``304 Not Modified`` responses (which GitHub does not count against
+the primary rate limit). The cache is bounded by size and evicts the least
+recently used entries first.
+
+Location defaults to ``~/.cache/team-devtools/http`` and can be changed with
+``TD_HTTP_CACHE_DIR`` (``off`` disables caching); ``TD_HTTP_CACHE_MAX_MB``
+sets the size bound.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from functools import cache
+from pathlib import Path
+from typing import Literal
+
+CACHE_DIR_ENV = "TD_HTTP_CACHE_DIR"
+CACHE_MAX_MB_ENV = "TD_HTTP_CACHE_MAX_MB"
+CACHE_DISABLED_VALUE = "off"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "team-devtools" / "http"
+DEFAULT_MAX_MB = 512
+BYTES_PER_MB = 1024 * 1024
+# After eviction the cache is trimmed to this fraction of its bound.
+EVICTION_TARGET_RATIO = 0.9
+HTTP_NOT_MODIFIED = 304
+HOUR = 3600
+DAY = 24 * HOUR
+# Response headers kept with an entry (validators plus what callers read).
+STORED_HEADERS = ("etag", "last-modified", "link", "content-type")
+
+# (URL pattern, seconds served without revalidation); first match wins.
+# Anything unmatched is revalidated on every use.
+DEFAULT_TTL_RULES: tuple[tuple[re.Pattern[str], int], ...] = (
+    # Git objects and commits addressed by SHA never change.
+    (re.compile(r"api\.github\.com/repos/[^/]+/[^/]+/git/(?:blobs|trees|commits)/[0-9a-f]{40}(?:\?|$)"), 30 * DAY),
+    (re.compile(r"api\.github\.com/repos/[^/]+/[^/]+/commits/[0-9a-f]{40}(?:\?|$)"), 30 * DAY),
+    (re.compile(r"pypi\.org/pypi/[^/]+/[^/]+/json$"), DAY),
+    (re.compile(r"pypi\.org/pypi/[^/]+/json$"), HOUR),
+    (re.compile(r"registry\.npmjs\.org/"), HOUR),
+    (re.compile(r"api\.osv\.dev/"), 6 * HOUR),
+    (re.compile(r"api\.securityscorecards\.dev/"), DAY),
+)
+
+
+@dataclass
+class CachedResponse:
+    """A stored HTTP response.
+
+    Attributes:
+        url: Request URL.
+        status: HTTP status of the original response.
+        headers: Subset of lower-cased response headers (see ``STORED_HEADERS``).
+        body: Decoded response body.
+        stored_at: Epoch seconds of the last fetch or successful revalidation.
+
+    """
+
+    url: str
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: str = ""
+    stored_at: float = 0.0
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build ``If-None-Match``/``If-Modified-Since`` headers for revalidation."""
+        headers = {}
+        if self.headers.get("etag"):
+            headers["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+    def has_validators(self) -> bool:
+        """Whether the response can be revalidated with a conditional request."""
+        return bool(self.headers.get("etag") or self.headers.get("last-modified"))
+
+
+class HttpCache:
+    """Size-bounded, thread-safe on-disk response cache."""
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_MB * BYTES_PER_MB,
+        ttl_rules: tuple[tuple[re.Pattern[str], int], ...] = DEFAULT_TTL_RULES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding cache entries.
+            max_bytes: Size bound; least recently used entries are evicted beyond it.
+            ttl_rules: ``(pattern, seconds)`` pairs matched against the URL.
+
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_rules = ttl_rules
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._size: int | None = None
+
+    @staticmethod
+    def key(method: str, url: str, *, scope: str = "", body: bytes | None = None) -> str:
+        """Derive the cache key for a request.
+
+        Args:
+            method: HTTP method.
+            url: Absolute request URL.
+            scope: Auth scope (e.g. a token fingerprint) so credentials never share entries.
+            body: Request body for POST lookups.
+
+        Returns:
+            Hex digest identifying the request.
+
+        """
+        digest = hashlib.sha256(f"{method.upper()} {url}\n{scope}\n".encode())
+        if body:
+            digest.update(body)
+        return digest.hexdigest()
+
+    @staticmethod
+    def scope_for(secret: str | None) -> str:
+        """Fingerprint a credential for use as a cache scope."""
+        if not secret:
+            return "anonymous"
+        return hashlib.sha256(secret.encode()).hexdigest()[:16]
+
+    def ttl_for(self, url: str) -> int:
+        """Seconds an entry for ``url`` is served without revalidation."""
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(url):
+                return ttl
+        return 0
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Whether ``entry`` may be served without contacting the server."""
+        return time.time() - entry.stored_at < self.ttl_for(entry.url)
+
+    def record(self, outcome: Literal["hits", "revalidated", "misses"]) -> None:
+        """Count one lookup outcome; lookups run concurrently from worker threads.
+
+        Args:
+            outcome: Counter to increment.
+
+        """
+        with self._stats_lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Load an entry and mark it recently used.
+
+        Args:
+            key: Cache key from :meth:`key`.
+
+        Returns:
+            Stored response, or ``None`` if absent or unreadable.
+
+        """
+        path = self._path(key)
+        try:
+            with path.open(encoding="utf-8") as f:
+                entry = CachedResponse(**json.load(f))
+            os.utime(path)
+        except (OSError, json.JSONDecodeError, TypeError):
+            return None
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry atomically and evict old entries if over the bound.
+
+        Args:
+            key: Cache key from :meth:`key`.
+            entry: Response to store.
+
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous = path.stat().st_size if path.exists() else 0
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(asdict(entry), f, ensure_ascii=False, separators=(",", ":"))
+                Path(tmp).replace(path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+            written = path.stat().st_size
+        except OSError:
+            return
+        with self._lock:
+            self._size = self._current_size() + written - previous
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def refresh(self, key: str, entry: CachedResponse) -> None:
+        """Record a successful ``304`` revalidation of ``entry``."""
+        entry.stored_at = time.time()
+        self.put(key, entry)
+
+    def _current_size(self) -> int:
+        """Total bytes on disk, scanned once per process (lock held)."""
+        if self._size is None:
+            self._size = sum(p.stat().st_size for p in self.directory.glob("*/*.json"))
+        return self._size
+
+    def _evict(self) -> None:
+        """Delete least recently used entries down to the eviction target (lock held)."""
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        size = sum(e[1] for e in entries)
+        target = self.max_bytes * EVICTION_TARGET_RATIO
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+        self._size = size
+
+
+@cache
+def default_http_cache() -> HttpCache | None:
+    """Return the process-wide cache, or ``None`` when disabled via the environment."""
+    location = os.environ.get(CACHE_DIR_ENV, "").strip()
+    if location.lower() == CACHE_DISABLED_VALUE:
+        return None
+    try:
+        max_mb = int(os.environ.get(CACHE_MAX_MB_ENV, DEFAULT_MAX_MB))
+    except ValueError:
+        max_mb = DEFAULT_MAX_MB
+    directory = Path(location).expanduser() if location else DEFAULT_CACHE_DIR
+    return HttpCache(directory, max_bytes=max_mb * BYTES_PER_MB)
+
+
+def cached_urlopen(
+    req: urllib.request.Request,
+    *,
+    timeout: float,
+    http_cache: HttpCache | None = None,
+) -> bytes:
+    """Drop-in for ``urlopen(req).read()`` backed by the response cache.
+
+    Fresh entries skip the network; stale ones are revalidated and a ``304``
+    returns the stored body. The ``Authorization`` header, if any, scopes
+    the entry.
+
+    Args:
+        req: Prepared request.
+        timeout: Socket timeout in seconds.
+        http_cache: Cache to use (defaults to :func:`default_http_cache`).
+
+    Returns:
+        Response body.
+
+    Raises:
+        urllib.error.URLError: On network failures or non-2xx responses, as ``urlopen`` does.
+
+    """
+    http_cache = http_cache if http_cache is not None else default_http_cache()
+    if http_cache is None:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:  # noqa: S310
+            return resp.read()  # type: ignore[no-any-return]
+
+    url = req.full_url
+    data = req.data if isinstance(req.data, bytes) else None
+    key = http_cache.key(
+        req.get_method(),
+        url,
+        scope=http_cache.scope_for(req.get_header("Authorization")),
+        body=data,
+    )
+    entry = http_cache.get(key)
+    if entry is not None:
+        if http_cache.is_fresh(entry):
+            http_cache.record("hits")
+            return entry.body.encode("utf-8")
+        for name, value in entry.conditional_headers().items():
+            req.add_header(name, value)
+
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:  # noqa: S310
+            raw: bytes = resp.read()
+            headers = {k.lower(): v for k, v in resp.getheaders()}
+            status = resp.status
+    except urllib.error.HTTPError as exc:
+        if entry is not None and exc.code == HTTP_NOT_MODIFIED:
+            http_cache.record("revalidated")
+            http_cache.refresh(key, entry)
+            return entry.body.encode("utf-8")
+        raise
+
+    http_cache.record("misses")
+    fresh = CachedResponse(
+        url=url,
+        status=status,
+        headers={name: headers[name] for name in STORED_HEADERS if name in headers},
+        body=raw.decode("utf-8", "replace"),
+        stored_at=time.time(),
+    )
+    if fresh.has_validators() or http_cache.ttl_for(url) > 0:
+        http_cache.put(key, fresh)
+    return raw
@@ -6,6 +6,12 @@ Modes:
     weekly  - Daily + SonarCloud quality gates (run Monday for security audit)
     handoff - Weekly + Jira handoff template (run at end of sprint)
 
+The fetchers, snapshot diff and report generators are imported and called
+in-process, passing their data directly; the fetched JSON is still written
+to the reports directory for archival. A fetch that overruns its timeout is
+abandoned and its data dropped. With --isolate-fetches each fetch script runs
+in its own subprocess instead, killed when it overruns.
+
 Usage:
     python3 .agents/skills/td-guardian/scripts/run_guardian_check.py --mode daily
     python3 .agents/skills/td-guardian/scripts/run_guardian_check.py --mode weekly
@@ -18,76 +24,215 @@ import json
 import os
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from typing import NamedTuple
+
+import diff_snapshots
+import fetch_ci_status
+import fetch_codecov
+import fetch_open_prs
+import fetch_renovate_prs
+import fetch_sonar_gates
+import generate_report as reports
 
 SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)))
 REPORTS_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), "reports")
 DEFAULT_REPOS_FILE = os.path.join(os.path.dirname(SCRIPTS_DIR), "config", "repos.json")
 DEFAULT_SONAR_CONFIG = os.path.join(os.path.dirname(SCRIPTS_DIR), "config", "sonar.json")
 DEFAULT_CODECOV_CONFIG = os.path.join(os.path.dirname(SCRIPTS_DIR), "config", "codecov.json")
+FETCH_TIMEOUT = 600
+# Every fetch script runs at once by default; they hit different services.
+DEFAULT_FETCH_JOBS = 5
 
+# Per-source dashboards: (source, report mode, file name prefix).
+SOURCE_REPORTS = [
+    ("prs", "prs", "pr-dashboard"),
+    ("ci", "ci", "ci-dashboard"),
+    ("renovate", "renovate", "dependency-dashboard"),
+    ("codecov", "codecov", "codecov-dashboard"),
+    ("sonar", "sonar", "sonar-dashboard"),
+]
 
-def run_script(script_name, args, output_file) -> bool:
-    """Run a fetch script and save its JSON output to a file."""
-    script_path = os.path.join(SCRIPTS_DIR, script_name)
-    cmd = [sys.executable, script_path, *args]
+_output_lock = threading.Lock()
 
-    print(f"\n{'=' * 60}", file=sys.stderr)
-    print(f"Running: {script_name}", file=sys.stderr)
-    print(f"{'=' * 60}", file=sys.stderr)
 
+class Fetch(NamedTuple):
+    """One fetch script: how to run it as a subprocess and in-process."""
+
+    source: str
+    script_name: str
+    args: list
+    output_file: str
+    fetch: object  # zero-argument callable returning the script's JSON data
+
+
+class _ThreadBufferedStderr:
+    """sys.stderr stand-in that buffers the output of threads running an in-process fetch."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        if buffer is None:
+            return self.stream.write(text)
+        buffer.append(text)
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def emit(lines) -> None:
+    """Print a block of log lines to stderr without interleaving other threads' output."""
+    with _output_lock:
+        print("\n".join(lines), file=sys.stderr, flush=True)
+
+
+def save_json(data, output_file, log) -> None:
+    """Archive fetched data as JSON."""
+    with open(output_file, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    log.append(f"Saved: {output_file}")
+
+
+def run_script(script_name, args, output_file, log):
+    """Run a fetch script as a subprocess and save its JSON output to a file.
+
+    Returns the parsed output, or None if the script failed.
+    """
+    script_path = os.path.join(SCRIPTS_DIR, script_name)
+    cmd = [sys.executable, script_path, *args]
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=FETCH_TIMEOUT)
     except subprocess.TimeoutExpired:
-        print(f"ERROR: {script_name} timed out after 10 minutes", file=sys.stderr)
-        return False
+        log.append(f"ERROR: {script_name} timed out after {FETCH_TIMEOUT // 60} minutes")
+        return None
     except FileNotFoundError:
-        print(f"ERROR: Script not found: {script_path}", file=sys.stderr)
-        return False
+        log.append(f"ERROR: Script not found: {script_path}")
+        return None
 
     if result.returncode != 0:
-        print(f"ERROR: {script_name} failed (exit {result.returncode})", file=sys.stderr)
+        log.append(f"ERROR: {script_name} failed (exit {result.returncode})")
         if result.stderr:
-            print(result.stderr, file=sys.stderr)
-        return False
+            log.append(result.stderr)
+        return None
 
     if result.stderr:
-        print(result.stderr, file=sys.stderr)
+        log.append(result.stderr)
 
     try:
         data = json.loads(result.stdout)
     except json.JSONDecodeError:
-        print(f"ERROR: {script_name} produced invalid JSON", file=sys.stderr)
-        return False
-
-    with open(output_file, "w") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+        log.append(f"ERROR: {script_name} produced invalid JSON")
+        return None
 
-    print(f"Saved: {output_file}", file=sys.stderr)
-    return True
+    save_json(data, output_file, log)
+    return data
 
 
-def generate_report(mode, args, output_file) -> bool:
-    """Run generate_report.py with the given mode and arguments."""
-    script_path = os.path.join(SCRIPTS_DIR, "generate_report.py")
-    cmd = [sys.executable, script_path, mode, *args, "--output", output_file]
+def run_in_process(fetch, stderr, log):
+    """Call a fetcher in this thread, collecting what it prints to stderr into ``log``.
 
+    Returns the fetched data, or None if the fetcher raised.
+    """
+    stderr.local.buffer = []
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-    except subprocess.TimeoutExpired:
-        print("ERROR: Report generation timed out", file=sys.stderr)
-        return False
+        data = fetch.fetch()
+    except Exception as exc:
+        stderr.local.buffer.append(f"ERROR: {fetch.script_name} failed: {type(exc).__name__}: {exc}\n")
+        return None
+    finally:
+        log.append("".join(stderr.local.buffer))
+        stderr.local.buffer = None
+    return data
+
+
+def run_with_deadline(fetch, stderr, log):
+    """Call a fetcher in-process, giving up on it after ``FETCH_TIMEOUT`` seconds.
+
+    A thread cannot be stopped, so a fetcher that overruns is left running in
+    a daemon thread and its data is dropped. Only a fetch that finished in
+    time is saved, so an abandoned one never writes its output file. Returns
+    the fetched data, or None if the fetcher failed or timed out.
+    """
+    result = {}
+    fetch_log = []
+    worker = threading.Thread(
+        target=lambda: result.setdefault("data", run_in_process(fetch, stderr, fetch_log)),
+        name=f"fetch-{fetch.source}",
+        daemon=True,
+    )
+    worker.start()
+    worker.join(FETCH_TIMEOUT)
+    if worker.is_alive():
+        log.append(f"ERROR: {fetch.script_name} timed out after {FETCH_TIMEOUT // 60} minutes")
+        return None
+    log.extend(fetch_log)
+    data = result.get("data")
+    if data is not None:
+        save_json(data, fetch.output_file, log)
+    return data
+
+
+def run_fetch_stage(fetches, jobs, isolate=False):
+    """Run independent fetchers concurrently.
+
+    At most ``jobs`` fetchers run at once, in-process by default or each in
+    its own subprocess with ``isolate``, and each is given ``FETCH_TIMEOUT``
+    seconds. A slow, failing or timed-out fetch only delays or loses its own
+    data, and each fetch's log is printed as one block when
+    it finishes. Returns ``(data, seconds)`` per source, with data None for
+    a failed fetch.
+    """
+    stderr = None if isolate else _ThreadBufferedStderr(sys.stderr)
+
+    def timed(fetch):
+        emit([f"Started: {fetch.script_name}"])
+        log = [f"\n{'=' * 60}", f"Finished: {fetch.script_name}", f"{'=' * 60}"]
+        started = time.monotonic()
+        try:
+            if isolate:
+                data = run_script(fetch.script_name, fetch.args, fetch.output_file, log)
+            else:
+                data = run_with_deadline(fetch, stderr, log)
+        except Exception as exc:
+            log.append(f"ERROR: {fetch.script_name} crashed: {exc}")
+            data = None
+        emit(log)
+        return data, time.monotonic() - started
+
+    if not fetches:
+        return {}
+    if stderr is not None:
+        sys.stderr = stderr
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(fetches)))) as pool:
+            return dict(zip((fetch.source for fetch in fetches), pool.map(timed, fetches), strict=True))
+    finally:
+        if stderr is not None:
+            sys.stderr = stderr.stream
 
-    if result.returncode != 0:
-        print(f"ERROR: Report generation failed for mode '{mode}'", file=sys.stderr)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-        return False
 
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
+def write_report(mode, generate, output_file, *data) -> bool:
+    """Render a markdown report in-process and write it to a file."""
+    try:
+        report = generate(*data)
+    except Exception as exc:
+        print(f"ERROR: Report generation failed for mode '{mode}': {type(exc).__name__}: {exc}", file=sys.stderr)
+        return False
 
+    with open(output_file, "w") as f:
+        f.write(report)
+    print(f"Report written to {output_file}", file=sys.stderr)
     return True
 
 
@@ -105,6 +250,17 @@ def main() -> None:
     parser.add_argument("--reports-dir", default=REPORTS_DIR, help="Directory for output files")
     parser.add_argument("--stale-days", type=int, default=14, help="Days before a PR is considered stale (default: 14)")
     parser.add_argument("--ci-days", type=int, default=3, help="Days of CI history to check (default: 3)")
+    parser.add_argument(
+        "--fetch-jobs",
+        type=int,
+        default=DEFAULT_FETCH_JOBS,
+        help=f"Fetch scripts to run concurrently (default: {DEFAULT_FETCH_JOBS}, 1 = one after another)",
+    )
+    parser.add_argument(
+        "--isolate-fetches",
+        action="store_true",
+        help=f"Run each fetch script in its own subprocess, killed after the {FETCH_TIMEOUT // 60}-minute timeout",
+    )
     args = parser.parse_args()
 
     os.makedirs(args.reports_dir, exist_ok=True)
@@ -117,41 +273,109 @@ def main() -> None:
     print(f"Guardian check: mode={args.mode}, date={date_str}", file=sys.stderr)
     print(f"Reports directory: {args.reports_dir}", file=sys.stderr)
 
-    prs_file = os.path.join(args.reports_dir, f"open-prs-{date_str}.json")
-    ci_file = os.path.join(args.reports_dir, f"ci-status-{date_str}.json")
-    renovate_file = os.path.join(args.reports_dir, f"renovate-prs-{date_str}.json")
-    sonar_file = os.path.join(args.reports_dir, f"sonar-gates-{date_str}.json")
-    codecov_file = os.path.join(args.reports_dir, f"codecov-{date_str}.json")
+    files = {
+        "prs": os.path.join(args.reports_dir, f"open-prs-{date_str}.json"),
+        "ci": os.path.join(args.reports_dir, f"ci-status-{date_str}.json"),
+        "renovate": os.path.join(args.reports_dir, f"renovate-prs-{date_str}.json"),
+        "codecov": os.path.join(args.reports_dir, f"codecov-{date_str}.json"),
+    }
+    if include_sonar:
+        files["sonar"] = os.path.join(args.reports_dir, f"sonar-gates-{date_str}.json")
+
+    # Daily per-workflow flakiness, kept across runs (see fetch_ci_status.record_flaky_history).
+    flaky_history = os.path.join(args.reports_dir, "ci-flaky-history.json")
+    # Workflow runs synced incrementally across runs (see fetch_ci_status.RunStore).
+    run_store = os.path.join(args.reports_dir, "ci-runs.sqlite")
 
     errors = 0
     issues_found = False
 
-    if not run_script(
-        "fetch_open_prs.py",
-        ["--repos-file", args.repos_file, "--stale-days", str(args.stale_days)],
-        prs_file,
-    ):
-        errors += 1
-
-    if not run_script("fetch_ci_status.py", ["--repos-file", args.repos_file, "--days", str(args.ci_days)], ci_file):
-        errors += 1
-
-    if not run_script("fetch_renovate_prs.py", ["--repos-file", args.repos_file], renovate_file):
-        errors += 1
-
+    fetches = [
+        Fetch(
+            "prs",
+            "fetch_open_prs.py",
+            ["--repos-file", args.repos_file, "--stale-days", str(args.stale_days)],
+            files["prs"],
+            lambda: fetch_open_prs.fetch_batch(fetch_open_prs.load_repos(args.repos_file), args.stale_days),
+        ),
+        Fetch(
+            "ci",
+            "fetch_ci_status.py",
+            [
+                "--repos-file",
+                args.repos_file,
+                "--days",
+                str(args.ci_days),
+                "--flaky-history",
+                flaky_history,
+                "--run-store",
+                run_store,
+            ],
+            files["ci"],
+            lambda: fetch_ci_status.fetch_batch(
+                fetch_ci_status.load_repos(args.repos_file),
+                args.ci_days,
+                history_file=flaky_history,
+                run_store=run_store,
+            ),
+        ),
+        Fetch(
+            "renovate",
+            "fetch_renovate_prs.py",
+            ["--repos-file", args.repos_file],
+            files["renovate"],
+            lambda: fetch_renovate_prs.fetch_batch(fetch_renovate_prs.load_repos(args.repos_file)),
+        ),
+    ]
     if os.path.exists(args.codecov_config):
-        if not run_script("fetch_codecov.py", ["--codecov-config", args.codecov_config], codecov_file):
-            errors += 1
+        fetches.append(
+            Fetch(
+                "codecov",
+                "fetch_codecov.py",
+                ["--codecov-config", args.codecov_config],
+                files["codecov"],
+                lambda: fetch_codecov.fetch_batch(
+                    fetch_codecov.load_codecov_config(args.codecov_config),
+                    os.environ.get("CODECOV_TOKEN"),
+                ),
+            ),
+        )
     else:
         print(f"WARN: Codecov config not found: {args.codecov_config}", file=sys.stderr)
 
     if include_sonar:
         if os.path.exists(args.sonar_config):
-            if not run_script("fetch_sonar_gates.py", ["--sonar-config", args.sonar_config], sonar_file):
-                errors += 1
+            fetches.append(
+                Fetch(
+                    "sonar",
+                    "fetch_sonar_gates.py",
+                    ["--sonar-config", args.sonar_config],
+                    files["sonar"],
+                    lambda: fetch_sonar_gates.fetch_batch(
+                        fetch_sonar_gates.load_sonar_config(args.sonar_config),
+                        os.environ.get("SONAR_TOKEN"),
+                    ),
+                ),
+            )
         else:
             print(f"WARN: Sonar config not found: {args.sonar_config}", file=sys.stderr)
 
+    print(f"\n{'=' * 60}", file=sys.stderr)
+    print(f"Fetching ({len(fetches)} scripts, up to {args.fetch_jobs} at once)...", file=sys.stderr)
+    print(f"{'=' * 60}", file=sys.stderr)
+
+    stage_times = {}
+    started = time.monotonic()
+    fetch_results = run_fetch_stage(fetches, args.fetch_jobs, isolate=args.isolate_fetches)
+    stage_times["fetch"] = time.monotonic() - started
+    errors += sum(1 for data, _ in fetch_results.values() if data is None)
+
+    # A source that was not fetched this run falls back to today's earlier output, if any.
+    sources = {}
+    for source, path in files.items():
+        data = fetch_results.get(source, (None, 0))[0]
+        sources[source] = data if data is not None else diff_snapshots.load_json_safe(path)
+
     previous_snapshot = os.path.join(args.reports_dir, "previous-snapshot.json")
     changes_file = os.path.join(args.reports_dir, "changes.json")
 
@@ -159,100 +383,56 @@ def main() -> None:
     print("Diffing against previous snapshot...", file=sys.stderr)
     print(f"{'=' * 60}", file=sys.stderr)
 
-    diff_args = [
-        "--previous",
-        previous_snapshot,
-        "--output",
-        changes_file,
-        "--write-previous",
-        previous_snapshot,
-    ]
-    if os.path.exists(prs_file):
-        diff_args.extend(["--prs", prs_file])
-    if os.path.exists(ci_file):
-        diff_args.extend(["--ci", ci_file])
-    if os.path.exists(renovate_file):
-        diff_args.extend(["--renovate", renovate_file])
-    if os.path.exists(codecov_file):
-        diff_args.extend(["--codecov", codecov_file])
-    if include_sonar and os.path.exists(sonar_file):
-        diff_args.extend(["--sonar", sonar_file])
-
-    # diff_snapshots writes files itself (not stdout JSON like fetch scripts)
-    if any(os.path.exists(f) for f in [prs_file, ci_file, renovate_file]):
-        diff_script = os.path.join(SCRIPTS_DIR, "diff_snapshots.py")
-        diff_cmd = [sys.executable, diff_script, *diff_args]
+    started = time.monotonic()
+    changes = None
+    if any(sources[source] for source in ("prs", "ci", "renovate")):
         try:
-            diff_result = subprocess.run(diff_cmd, capture_output=True, text=True, timeout=60)
-            if diff_result.stderr:
-                print(diff_result.stderr, file=sys.stderr)
-            if diff_result.returncode != 0:
-                print("WARN: Snapshot diff failed", file=sys.stderr)
-                errors += 1
-        except subprocess.TimeoutExpired:
-            print("WARN: Snapshot diff timed out", file=sys.stderr)
+            changes = diff_snapshots.diff_against_previous(
+                sources["prs"],
+                sources["ci"],
+                sources["renovate"],
+                sources["codecov"],
+                sources.get("sonar"),
+                previous_path=previous_snapshot,
+                output_path=changes_file,
+                snapshot_path=previous_snapshot,
+            )
+        except Exception as exc:
+            print(f"WARN: Snapshot diff failed: {type(exc).__name__}: {exc}", file=sys.stderr)
             errors += 1
+    if changes is None:
+        changes = diff_snapshots.load_json_safe(changes_file)
+    stage_times["diff"] = time.monotonic() - started
 
     print(f"\n{'=' * 60}", file=sys.stderr)
     print("Generating reports...", file=sys.stderr)
     print(f"{'=' * 60}", file=sys.stderr)
+    started = time.monotonic()
 
-    if os.path.exists(prs_file):
-        pr_report = os.path.join(args.reports_dir, f"pr-dashboard-{date_str}.md")
-        generate_report("prs", [prs_file], pr_report)
-
-    if os.path.exists(ci_file):
-        ci_report = os.path.join(args.reports_dir, f"ci-dashboard-{date_str}.md")
-        generate_report("ci", [ci_file], ci_report)
-
-    if os.path.exists(renovate_file):
-        dep_report = os.path.join(args.reports_dir, f"dependency-dashboard-{date_str}.md")
-        generate_report("renovate", [renovate_file], dep_report)
-
-    if os.path.exists(codecov_file):
-        cov_report = os.path.join(args.reports_dir, f"codecov-dashboard-{date_str}.md")
-        generate_report("codecov", [codecov_file], cov_report)
-
-    if include_sonar and os.path.exists(sonar_file):
-        sonar_report = os.path.join(args.reports_dir, f"sonar-dashboard-{date_str}.md")
-        generate_report("sonar", [sonar_file], sonar_report)
-
-    guardian_args = []
-    if os.path.exists(prs_file):
-        guardian_args.extend(["--prs", prs_file])
-    if os.path.exists(ci_file):
-        guardian_args.extend(["--ci", ci_file])
-    if os.path.exists(renovate_file):
-        guardian_args.extend(["--renovate", renovate_file])
-    if os.path.exists(codecov_file):
-        guardian_args.extend(["--codecov", codecov_file])
-    if include_sonar and os.path.exists(sonar_file):
-        guardian_args.extend(["--sonar", sonar_file])
-    if os.path.exists(changes_file):
-        guardian_args.extend(["--changes", changes_file])
+    for source, mode, prefix in SOURCE_REPORTS:
+        if sources.get(source) is not None:
+            report_file = os.path.join(args.reports_dir, f"{prefix}-{date_str}.md")
+            write_report(mode, reports.SINGLE_INPUT_MODES[mode], report_file, sources[source])
 
+    guardian_data = (sources["prs"], sources["ci"], sources["renovate"], sources.get("sonar"), sources["codecov"])
     guardian_report = os.path.join(args.reports_dir, f"guardian-{args.mode}-{date_str}.md")
-    generate_report("guardian", guardian_args, guardian_report)
+    write_report("guardian", reports.generate_guardian_report, guardian_report, *guardian_data, changes)
 
     if include_handoff:
         handoff_report = os.path.join(args.reports_dir, f"handoff-{date_str}.md")
-        generate_report("handoff", guardian_args, handoff_report)
+        write_report("handoff", reports.generate_handoff_report, handoff_report, *guardian_data)
+    stage_times["reports"] = time.monotonic() - started
 
-    for json_file in [prs_file, ci_file, renovate_file, sonar_file, codecov_file]:
-        if not os.path.exists(json_file):
+    for data in sources.values():
+        if not isinstance(data, dict):
             continue
-        try:
-            with open(json_file) as f:
-                data = json.load(f)
-            agg = data.get("aggregate", data.get("summary", {}))
-            if agg.get("failing", 0) > 0 or agg.get("gate_error", 0) > 0:
-                issues_found = True
-            if agg.get("overdue", 0) > 0:
-                issues_found = True
-            if agg.get("stale", 0) > 0 or agg.get("blocked", 0) > 0:
-                issues_found = True
-        except (json.JSONDecodeError, KeyError):
-            pass
+        agg = data.get("aggregate", data.get("summary", {}))
+        if agg.get("failing", 0) > 0 or agg.get("gate_error", 0) > 0:
+            issues_found = True
+        if agg.get("overdue", 0) > 0:
+            issues_found = True
+        if agg.get("stale", 0) > 0 or agg.get("blocked", 0) > 0:
+            issues_found = True
 
     print(f"\n{'=' * 60}", file=sys.stderr)
     print("Guardian check complete!", file=sys.stderr)
@@ -262,6 +442,12 @@ def main() -> None:
     print(f"Main report: guardian-{args.mode}-{date_str}.md", file=sys.stderr)
     if include_handoff:
         print(f"Handoff: handoff-{date_str}.md", file=sys.stderr)
+    print("Timings:", file=sys.stderr)
+    for fetch in fetches:
+        data, seconds = fetch_results[fetch.source]
+        print(f"  {fetch.script_name}: {seconds:.1f}s{'' if data is not None else ' (failed)'}", file=sys.stderr)
+    for stage, seconds in stage_times.items():
+        print(f"  {stage} stage: {seconds:.1f}s", file=sys.stderr)
     if errors > 0:
         print(f"Errors: {errors} script(s) failed", file=sys.stderr)
     print(file=sys.stderr)
@@ -9,9 +9,15 @@ integrity, known vulnerabilities, and OpenSSF Scorecard posture.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import multiprocessing
 import sys
+import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -19,6 +25,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 try:
+    from audit_dataset import AuditDataset  # pylint: disable=import-error
     from audit_models import (  # pylint: disable=import-error
         SCORECARD_CRITICAL_CHECKS,
         SCORECARD_HIGH_THRESHOLD,
@@ -27,21 +34,12 @@ try:
         FindingCategory,
         RiskLevel,
     )
-    from cache_utils import (  # pylint: disable=import-error
-        get_all_cached_checks,
-        get_all_cached_commits,
-        get_all_cached_deps,
-        get_all_cached_pr_audits,
-        get_all_cached_protection,
-        get_all_cached_prs,
-        get_all_cached_renovate,
-        get_all_cached_scorecard,
-        get_all_cached_vulns,
-        read_manifest,
-        write_findings,
-    )
+    from cache_utils import cache_file_digests, read_analysis_state, read_manifest, write_analysis_state, write_findings  # pylint: disable=import-error
+    from instrumentation import StageProfile, measure  # pylint: disable=import-error
+    from near_duplicates import find_earliest_near_duplicates  # pylint: disable=import-error
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from audit_dataset import AuditDataset
     from audit_models import (
         SCORECARD_CRITICAL_CHECKS,
         SCORECARD_HIGH_THRESHOLD,
@@ -50,25 +48,23 @@ except ImportError:
         FindingCategory,
         RiskLevel,
     )
-    from cache_utils import (
-        get_all_cached_checks,
-        get_all_cached_commits,
-        get_all_cached_deps,
-        get_all_cached_pr_audits,
-        get_all_cached_protection,
-        get_all_cached_prs,
-        get_all_cached_renovate,
-        get_all_cached_scorecard,
-        get_all_cached_vulns,
-        read_manifest,
-        write_findings,
-    )
+    from cache_utils import cache_file_digests, read_analysis_state, read_manifest, write_analysis_state, write_findings
+    from instrumentation import StageProfile, measure
+    from near_duplicates import find_earliest_near_duplicates
 
 GITHUB_NOREPLY_EMAILS = {"noreply@github.com", "github@users.noreply.github.com"}
 JACCARD_THRESHOLD = 0.95
 MIN_COMMIT_MESSAGE_LENGTH = 20
-REPLICATED_MESSAGE_LOOKBACK = 50
 FALLBACK_COOLDOWN_DAYS = 3
+DEFAULT_ANALYZE_WORKERS = 1
+# State key of fleet-wide passes, whose inputs are fingerprinted once for all repos.
+FLEET_SCOPE = "*"
+# Modules whose source is part of the analysis state fingerprint.
+ANALYSIS_SOURCES = ("analyze.py", "audit_dataset.py", "audit_models.py", "cache_utils.py", "near_duplicates.py")
+# Stage measurements of the last run, written next to findings.json.
+ANALYSIS_PROFILE_FILE = "analysis_profile.json"
+# Cache subdirectory receiving per-pass cProfile dumps with --profile.
+PROFILE_DIR = "profile"
 
 
 def tokenize(text: str) -> set[str]:
@@ -84,64 +80,41 @@ def tokenize(text: str) -> set[str]:
     return set(text.lower().split())
 
 
-def jaccard_similarity(a: str, b: str) -> float:
-    """Compute Jaccard similarity between two strings.
-
-    Args:
-        a: First string.
-        b: Second string.
-
-    Returns:
-        Jaccard coefficient (0.0 to 1.0).
-
-    """
-    tokens_a = tokenize(a)
-    tokens_b = tokenize(b)
-    if not tokens_a or not tokens_b:
-        return 0.0
-    intersection = tokens_a & tokens_b
-    union = tokens_a | tokens_b
-    return len(intersection) / len(union)
-
-
-def detect_unsigned_commits(commits: list[dict]) -> list[Finding]:
+def detect_unsigned_commits(dataset: AuditDataset) -> list[Finding]:
     """Detect commits without valid GPG/SSH signatures.
 
     Args:
-        commits: All audited commits.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for unsigned commits.
 
     """
-    findings = []
-    for commit in commits:
-        verification = commit.get("verification", {})
-        if not verification.get("verified", False):
-            findings.append(
-                Finding(
-                    category=FindingCategory.UNSIGNED_COMMIT,
-                    risk_level=RiskLevel.MEDIUM,
-                    repo=commit["repo"],
-                    summary=f"Unsigned commit by {commit.get('author_login', 'unknown')}",
-                    details=(
-                        f"Commit {commit['sha'][:8]} is not cryptographically signed. "
-                        f"Reason: {verification.get('reason', 'unsigned')}. "
-                        f"Author: {commit.get('author_login', 'unknown')} "
-                        f"({commit.get('author_email', '')})"
-                    ),
-                    commit_sha=commit["sha"],
-                    date=commit.get("date"),
-                    evidence={
-                        "author": commit.get("author_login"),
-                        "reason": verification.get("reason"),
-                    },
-                ),
-            )
-    return findings
+    return [
+        Finding(
+            category=FindingCategory.UNSIGNED_COMMIT,
+            risk_level=RiskLevel.MEDIUM,
+            repo=commit.repo,
+            summary=f"Unsigned commit by {commit.author_login}",
+            details=(
+                f"Commit {commit.sha[:8]} is not cryptographically signed. "
+                f"Reason: {commit.verification_reason}. "
+                f"Author: {commit.author_login} "
+                f"({commit.author_email})"
+            ),
+            commit_sha=commit.sha,
+            date=commit.date,
+            evidence={
+                "author": commit.author_login,
+                "reason": commit.verification_reason,
+            },
+        )
+        for commit in dataset.commits
+        if not commit.verified
+    ]
 
 
-def detect_github_web_signed(commits: list[dict], prs: list[dict]) -> list[Finding]:
+def detect_github_web_signed(dataset: AuditDataset) -> list[Finding]:
     """Detect commits signed by GitHub that are NOT squash/merge commits from PRs.
 
     Squash merges and regular merges via the GitHub merge button are expected
@@ -149,23 +122,19 @@ def detect_github_web_signed(commits: list[dict], prs: list[dict]) -> list[Findi
     be attributed to a PR merge operation (i.e., direct web UI edits).
 
     Args:
-        commits: All audited commits.
-        prs: All audited PRs.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for non-merge GitHub-signed commits.
 
     """
-    pr_merge_shas = {pr.get("merge_commit_sha") for pr in prs if pr.get("merged") and pr.get("merge_commit_sha")}
-
     findings = []
-    for commit in commits:
-        verification = commit.get("verification", {})
-        if not verification.get("verified", False):
+    for commit in dataset.commits:
+        if not commit.verified:
             continue
 
-        committer_email = commit.get("committer_email", "")
-        committer_login = commit.get("committer_login", "")
+        committer_email = commit.committer_email
+        committer_login = commit.committer_login
 
         is_github_signed = (
             committer_email in GITHUB_NOREPLY_EMAILS
@@ -177,31 +146,32 @@ def detect_github_web_signed(commits: list[dict], prs: list[dict]) -> list[Findi
             continue
 
         # Squash/merge commits from PRs are expected to be GitHub-signed
-        if commit["sha"] in pr_merge_shas:
+        merged_pr = dataset.prs_by_merge_sha.get(commit.sha)
+        if merged_pr is not None and merged_pr.merged:
             continue
 
         # Also skip if the commit is associated with a PR (it's the merge result)
-        if commit.get("associated_prs"):
+        if commit.associated_prs:
             continue
 
         findings.append(
             Finding(
                 category=FindingCategory.GITHUB_WEB_SIGNED,
                 risk_level=RiskLevel.MEDIUM,
-                repo=commit["repo"],
-                summary=f"GitHub-web-signed commit (not a PR merge) by {commit.get('author_login', 'unknown')}",
+                repo=commit.repo,
+                summary=f"GitHub-web-signed commit (not a PR merge) by {commit.author_login}",
                 details=(
-                    f"Commit {commit['sha'][:8]} is signed by GitHub but is NOT the "
+                    f"Commit {commit.sha[:8]} is signed by GitHub but is NOT the "
                     f"merge commit of any known PR. This suggests a direct web UI edit. "
-                    f"Author: {commit.get('author_login', 'unknown')}, "
+                    f"Author: {commit.author_login}, "
                     f"Committer: {committer_login} ({committer_email}). "
                     f"A compromised GitHub account can create verified commits via "
                     f"the web editor without needing the author's signing key."
                 ),
-                commit_sha=commit["sha"],
-                date=commit.get("date"),
+                commit_sha=commit.sha,
+                date=commit.date,
                 evidence={
-                    "author": commit.get("author_login"),
+                    "author": commit.author_login,
                     "committer": committer_login,
                     "committer_email": committer_email,
                     "is_pr_merge": False,
@@ -211,41 +181,37 @@ def detect_github_web_signed(commits: list[dict], prs: list[dict]) -> list[Findi
     return findings
 
 
-def detect_orphan_commits(commits: list[dict], prs: list[dict]) -> list[Finding]:
+def detect_orphan_commits(dataset: AuditDataset) -> list[Finding]:
     """Detect commits with no associated pull request.
 
     Args:
-        commits: All audited commits.
-        prs: All audited PRs.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for orphan commits.
 
     """
-    pr_merge_shas = {pr.get("merge_commit_sha") for pr in prs if pr.get("merge_commit_sha")}
-
     findings = []
-    for commit in commits:
-        associated = commit.get("associated_prs", [])
-        sha = commit["sha"]
+    for commit in dataset.commits:
+        sha = commit.sha
 
-        if not associated and sha not in pr_merge_shas:
-            msg_first_line = commit.get("message", "").split("\n")[0][:80]
+        if not commit.associated_prs and sha not in dataset.prs_by_merge_sha:
+            msg_first_line = commit.message.split("\n")[0][:80]
             findings.append(
                 Finding(
                     category=FindingCategory.ORPHAN_COMMIT,
                     risk_level=RiskLevel.HIGH,
-                    repo=commit["repo"],
+                    repo=commit.repo,
                     summary=f"Commit without PR: {msg_first_line}",
                     details=(
-                        f"Commit {sha[:8]} by {commit.get('author_login', 'unknown')} "
+                        f"Commit {sha[:8]} by {commit.author_login} "
                         f"has no associated pull request. Direct pushes to protected branches "
                         f"bypass code review. Message: '{msg_first_line}'"
                     ),
                     commit_sha=sha,
-                    date=commit.get("date"),
+                    date=commit.date,
                     evidence={
-                        "author": commit.get("author_login"),
+                        "author": commit.author_login,
                         "message_preview": msg_first_line,
                     },
                 ),
@@ -253,12 +219,7 @@ def detect_orphan_commits(commits: list[dict], prs: list[dict]) -> list[Finding]
     return findings
 
 
-def detect_bypassed_ci(
-    _commits: list[dict],
-    prs: list[dict],
-    checks: dict[str, list[dict]],
-    protection: dict[str, dict],
-) -> list[Finding]:
+def detect_bypassed_ci(dataset: AuditDataset) -> list[Finding]:
     """Detect PRs merged with failing REQUIRED CI checks.
 
     Only flags failures of checks listed in the repo's branch protection
@@ -266,44 +227,39 @@ def detect_bypassed_ci(
     when not required, etc.) are ignored.
 
     Args:
-        _commits: All audited commits (unused, kept for API consistency).
-        prs: All audited PRs.
-        checks: Check suites keyed by commit SHA.
-        protection: Branch protection data keyed by repo.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for bypassed CI.
 
     """
-    merged_prs = {pr["number"]: pr for pr in prs if pr.get("merged", False)}
-
     findings = []
-    for pr in merged_prs.values():
-        merge_sha = pr.get("merge_commit_sha")
-        if not merge_sha:
+    for pr in dataset.prs_by_key.values():
+        merge_sha = pr.merge_commit_sha
+        if not pr.merged or not merge_sha:
             continue
 
-        repo = pr["repo"]
-        repo_protection = protection.get(repo, {})
+        repo = pr.repo
+        repo_protection = dataset.protection.get(repo, {})
         required_checks = set(
             repo_protection.get("rules", {}).get("required_checks", []),
         )
 
-        suites = checks.get(merge_sha, [])
+        suites = dataset.checks.get(merge_sha, [])
         if not suites:
             continue
 
         failed_required = []
         failed_advisory = []
         for suite in suites:
-            conclusion = suite.get("conclusion")
+            conclusion = suite.conclusion
             # Only flag actual failures — "skipped" means a job's `if:` condition
             # was false (e.g., publish jobs that only run on tags). This is normal
             # workflow control, not a CI bypass.
             if conclusion not in ("failure", "action_required", "timed_out"):
                 continue
 
-            app_name = suite.get("app_name", "unknown")
+            app_name = suite.app_name
 
             is_required = False
             if required_checks:
@@ -323,20 +279,20 @@ def detect_bypassed_ci(
                     category=FindingCategory.BYPASSED_CI,
                     risk_level=RiskLevel.CRITICAL,
                     repo=repo,
-                    summary=f"PR #{pr['number']} merged with REQUIRED check failing",
+                    summary=f"PR #{pr.number} merged with REQUIRED check failing",
                     details=(
-                        f"PR #{pr['number']} ('{pr.get('title', '')}') was merged despite "
+                        f"PR #{pr.number} ('{pr.title}') was merged despite "
                         f"required check failures: {'; '.join(failed_required)}. "
                         f"Advisory failures (non-blocking): {'; '.join(failed_advisory) or 'none'}. "
-                        f"Author: {pr.get('author_login', 'unknown')}, "
-                        f"Merged at: {pr.get('merged_at', 'unknown')}"
+                        f"Author: {pr.author_login}, "
+                        f"Merged at: {pr.merged_at}"
                     ),
                     commit_sha=merge_sha,
-                    pr_number=pr["number"],
-                    date=pr.get("merged_at"),
+                    pr_number=pr.number,
+                    date=pr.merged_at,
                     evidence={
-                        "pr_title": pr.get("title"),
-                        "author": pr.get("author_login"),
+                        "pr_title": pr.title,
+                        "author": pr.author_login,
                         "failed_required": failed_required,
                         "failed_advisory": failed_advisory,
                         "required_checks_configured": list(required_checks),
@@ -349,18 +305,18 @@ def detect_bypassed_ci(
     return findings
 
 
-def detect_protection_changes(protection: dict[str, dict]) -> list[Finding]:
+def detect_protection_changes(dataset: AuditDataset) -> list[Finding]:
     """Detect branch protection rule modifications and weak posture.
 
     Args:
-        protection: Branch protection data keyed by repo.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for protection changes and weak posture.
 
     """
     findings = []
-    for repo, data in protection.items():
+    for repo, data in dataset.protection.items():
         changes = data.get("changes", [])
         findings.extend(
             Finding(
@@ -430,40 +386,32 @@ def detect_protection_changes(protection: dict[str, dict]) -> list[Finding]:
     return findings
 
 
-def detect_post_merge_pushes(commits: list[dict], prs: list[dict]) -> list[Finding]:
+def detect_post_merge_pushes(dataset: AuditDataset) -> list[Finding]:
     """Detect commits pushed to branches after their PR was merged/closed.
 
     Args:
-        commits: All audited commits.
-        prs: All audited PRs.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for post-merge pushes.
 
     """
-    pr_index: dict[tuple[str, int], dict] = {}
-    for pr in prs:
-        if pr.get("merged") or pr.get("state") == "closed":
-            pr_index[(pr["repo"], pr["number"])] = pr
-
     findings = []
-    for commit in commits:
-        repo = commit["repo"]
-        commit_date = commit.get("date", "")
+    for commit in dataset.commits:
+        repo = commit.repo
+        commit_date = commit.date
 
-        for pr_num in commit.get("associated_prs", []):
-            matching_pr = pr_index.get((repo, pr_num))
+        for pr_num in commit.associated_prs:
+            matching_pr = dataset.prs_by_key.get((repo, pr_num))
 
-            if not matching_pr:
+            if not matching_pr or not (matching_pr.merged or matching_pr.state == "closed"):
                 continue
 
-            merged_at = matching_pr.get("merged_at")
+            merged_at = matching_pr.merged_at
             if not merged_at:
                 continue
 
-            if commit_date > merged_at and commit["sha"] != matching_pr.get(
-                "merge_commit_sha",
-            ):
+            if commit_date > merged_at and commit.sha != matching_pr.merge_commit_sha:
                 findings.append(
                     Finding(
                         category=FindingCategory.POST_MERGE_PUSH,
@@ -471,31 +419,36 @@ def detect_post_merge_pushes(commits: list[dict], prs: list[dict]) -> list[Findi
                         repo=repo,
                         summary=f"Post-merge commit on PR #{pr_num} branch",
                         details=(
-                            f"Commit {commit['sha'][:8]} was pushed to branch "
-                            f"'{matching_pr.get('head_ref', '')}' AFTER PR #{pr_num} was merged "
+                            f"Commit {commit.sha[:8]} was pushed to branch "
+                            f"'{matching_pr.head_ref}' AFTER PR #{pr_num} was merged "
                             f"at {merged_at}. Commit date: {commit_date}. "
-                            f"Author: {commit.get('author_login', 'unknown')}. "
+                            f"Author: {commit.author_login}. "
                             f"This could indicate branch tampering."
                         ),
-                        commit_sha=commit["sha"],
+                        commit_sha=commit.sha,
                         pr_number=pr_num,
                         date=commit_date,
                         evidence={
-                            "branch": matching_pr.get("head_ref"),
+                            "branch": matching_pr.head_ref,
                             "merged_at": merged_at,
                             "commit_date": commit_date,
-                            "author": commit.get("author_login"),
+                            "author": commit.author_login,
                         },
                     ),
                 )
     return findings
 
 
-def detect_replicated_messages(commits: list[dict]) -> list[Finding]:
+def detect_replicated_messages(dataset: AuditDataset) -> list[Finding]:
     """Detect commit messages that are near-duplicates of earlier commits.
 
+    Every message in the window, across all repos, is tokenized once and
+    indexed by its rarest tokens (see :mod:`near_duplicates`); candidate
+    pairs are confirmed with exact Jaccard similarity. Each commit is
+    reported against its earliest near-duplicate.
+
     Args:
-        commits: All audited commits.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for replicated messages.
@@ -503,101 +456,116 @@ def detect_replicated_messages(commits: list[dict]) -> list[Finding]:
     """
     findings = []
 
-    commits_by_repo: dict[str, list[dict]] = {}
-    for commit in commits:
-        commits_by_repo.setdefault(commit["repo"], []).append(commit)
-
-    for repo, repo_commits in commits_by_repo.items():
-        sorted_commits = sorted(repo_commits, key=lambda c: c.get("date", ""))
+    ordered = sorted(dataset.commits_by_sha.values(), key=lambda c: (c.date, c.repo, c.sha))
+    token_sets = [
+        frozenset(tokenize(commit.message)) if len(commit.message) >= MIN_COMMIT_MESSAGE_LENGTH else frozenset()
+        for commit in ordered
+    ]
+    matches = find_earliest_near_duplicates(token_sets, JACCARD_THRESHOLD)
 
-        for i, commit in enumerate(sorted_commits):
-            msg = commit.get("message", "")
-            if len(msg) < MIN_COMMIT_MESSAGE_LENGTH:
-                continue
+    for idx, (earlier_idx, similarity) in sorted(matches.items()):
+        commit = ordered[idx]
+        earlier = ordered[earlier_idx]
+        risk = RiskLevel.HIGH if commit.author_login != earlier.author_login else RiskLevel.LOW
 
-            for j in range(max(0, i - REPLICATED_MESSAGE_LOOKBACK), i):
-                earlier = sorted_commits[j]
-                earlier_msg = earlier.get("message", "")
-                if len(earlier_msg) < MIN_COMMIT_MESSAGE_LENGTH:
-                    continue
-
-                if commit["sha"] == earlier["sha"]:
-                    continue
-
-                similarity = jaccard_similarity(msg, earlier_msg)
-                if similarity >= JACCARD_THRESHOLD:
-                    if commit.get("author_login") != earlier.get("author_login"):
-                        risk = RiskLevel.HIGH
-                    else:
-                        risk = RiskLevel.LOW
-
-                    msg_preview = msg.split("\n")[0][:60]
-                    findings.append(
-                        Finding(
-                            category=FindingCategory.REPLICATED_MESSAGE,
-                            risk_level=risk,
-                            repo=repo,
-                            summary=f"Replicated commit message: '{msg_preview}'",
-                            details=(
-                                f"Commit {commit['sha'][:8]} has a message nearly identical "
-                                f"(similarity: {similarity:.2f}) to earlier commit {earlier['sha'][:8]}. "
-                                f"New author: {commit.get('author_login', 'unknown')}, "
-                                f"Original author: {earlier.get('author_login', 'unknown')}."
-                            ),
-                            commit_sha=commit["sha"],
-                            date=commit.get("date"),
-                            evidence={
-                                "similarity": round(similarity, 3),
-                                "original_sha": earlier["sha"],
-                                "original_author": earlier.get("author_login"),
-                                "new_author": commit.get("author_login"),
-                            },
-                        ),
-                    )
-                    break
+        origin = "" if earlier.repo == commit.repo else f" in {earlier.repo}"
+        msg_preview = commit.message.split("\n")[0][:60]
+        findings.append(
+            Finding(
+                category=FindingCategory.REPLICATED_MESSAGE,
+                risk_level=risk,
+                repo=commit.repo,
+                summary=f"Replicated commit message: '{msg_preview}'",
+                details=(
+                    f"Commit {commit.sha[:8]} has a message nearly identical "
+                    f"(similarity: {similarity:.2f}) to earlier commit {earlier.sha[:8]}{origin}. "
+                    f"New author: {commit.author_login}, "
+                    f"Original author: {earlier.author_login}."
+                ),
+                commit_sha=commit.sha,
+                date=commit.date,
+                evidence={
+                    "similarity": round(similarity, 3),
+                    "original_sha": earlier.sha,
+                    "original_repo": earlier.repo,
+                    "original_author": earlier.author_login,
+                    "new_author": commit.author_login,
+                },
+            ),
+        )
 
     return findings
 
 
-def detect_suspicious_dep_timing(
-    deps: list[dict],
-    renovate_configs: dict[str, dict],
-) -> list[Finding]:
+def _is_major_update(old_ver: str | None, new_ver: str | None) -> bool:
+    """Whether the leading version component changed (``False`` if either side is missing)."""
+    if not old_ver or not new_ver:
+        return False
+    return old_ver.split(".", 1)[0] != new_ver.split(".", 1)[0]
+
+
+def _cooldown_limits(renovate_configs: dict[str, dict]) -> dict[str, int]:
+    """Resolve, once per repo, the largest cooldown any of its dep changes can be held to.
+
+    A change adopted at or after this many days can be skipped without
+    looking at its versions; repos without a Renovate config fall back to
+    ``FALLBACK_COOLDOWN_DAYS``.
+
+    Args:
+        renovate_configs: Renovate configs keyed by repo.
+
+    Returns:
+        Upper bound on the applicable cooldown per configured repo.
+
+    """
+    limits = {}
+    for repo, config in renovate_configs.items():
+        default_cooldown = config.get("default_cooldown_days")
+        major_cooldown = config.get("major_cooldown_days")
+        limits[repo] = max(
+            major_cooldown or 0,
+            FALLBACK_COOLDOWN_DAYS if default_cooldown is None else default_cooldown,
+        )
+    return limits
+
+
+def detect_suspicious_dep_timing(dataset: AuditDataset) -> list[Finding]:
     """Detect dependencies that violate the configured renovate cooldown period.
 
     Compares each dep's days_since_release against the repo's configured
     minimumReleaseAge. Violations are CRITICAL (policy breach). Deps with no
     configured cooldown fall back to a 3-day heuristic at LOW severity.
 
+    Cooldowns are resolved once per repo, and a single filtering pass
+    compares every change's age against its repo's largest cooldown, so
+    version parsing and finding construction only happen for the changes
+    that can violate a threshold.
+
     Args:
-        deps: All dependency changes.
-        renovate_configs: Renovate configs keyed by repo.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for cooldown violations and suspicious timing.
 
     """
-    findings = []
-    for dep in deps:
-        days = dep.get("days_since_release")
-        if days is None or days < 0:
-            continue
+    limit_for = _cooldown_limits(dataset.renovate_configs).get
+    candidates = [
+        (dep, days)
+        for dep in dataset.deps
+        if (days := dep.get("days_since_release")) is not None
+        and 0 <= days < limit_for(dep["repo"], FALLBACK_COOLDOWN_DAYS)
+    ]
 
+    findings = []
+    for dep, days in candidates:
         repo = dep["repo"]
-        config = renovate_configs.get(repo, {})
+        config = dataset.renovate_configs.get(repo, {})
         default_cooldown = config.get("default_cooldown_days")
         major_cooldown = config.get("major_cooldown_days")
 
         # Determine which cooldown applies
-        old_ver = dep.get("old_version", "")
         new_ver = dep.get("new_version", "")
-
-        is_major = False
-        if old_ver and new_ver:
-            old_major = old_ver.split(".")[0] if "." in old_ver else old_ver
-            new_major = new_ver.split(".")[0] if "." in new_ver else new_ver
-            is_major = old_major != new_major
-
+        is_major = _is_major_update(dep.get("old_version", ""), new_ver)
         effective_cooldown = major_cooldown if is_major and major_cooldown else default_cooldown
 
         if effective_cooldown is not None and days < effective_cooldown:
@@ -660,11 +628,11 @@ def detect_suspicious_dep_timing(
     return findings
 
 
-def detect_yanked_versions(deps: list[dict]) -> list[Finding]:
+def detect_yanked_versions(dataset: AuditDataset) -> list[Finding]:
     """Detect dependencies using yanked or deleted versions.
 
     Args:
-        deps: All dependency changes.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for yanked versions.
@@ -692,12 +660,12 @@ def detect_yanked_versions(deps: list[dict]) -> list[Finding]:
                 "ecosystem": dep.get("ecosystem"),
             },
         )
-        for dep in deps
+        for dep in dataset.deps
         if dep.get("yanked")
     ]
 
 
-def detect_post_approval_commits(pr_audits: list[dict]) -> list[Finding]:
+def detect_post_approval_commits(dataset: AuditDataset) -> list[Finding]:
     """Detect commits pushed to a PR branch after the last approval.
 
     Attack scenario: PR gets approved, attacker pushes additional commit
@@ -705,14 +673,14 @@ def detect_post_approval_commits(pr_audits: list[dict]) -> list[Finding]:
     with unapproved code.
 
     Args:
-        pr_audits: PR audit data (commits + reviews per PR).
+        dataset: Loaded audit data.
 
     Returns:
         Findings for post-approval commits.
 
     """
     findings = []
-    for audit in pr_audits:
+    for audit in dataset.pr_audits:
         approvals = audit.get("approvals", [])
         commits = audit.get("commits", [])
         repo = audit.get("repo", "")
@@ -815,18 +783,18 @@ def detect_post_approval_commits(pr_audits: list[dict]) -> list[Finding]:
     return findings
 
 
-def detect_known_vulnerabilities(vulns: dict[str, list[dict]]) -> list[Finding]:
+def detect_known_vulnerabilities(dataset: AuditDataset) -> list[Finding]:
     """Flag packages with known CVEs/advisories from OSV.dev.
 
     Args:
-        vulns: Vulnerability results keyed by repo.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for known vulnerabilities.
 
     """
     findings = []
-    for repo, pkg_vulns in vulns.items():
+    for repo, pkg_vulns in dataset.vulns.items():
         for entry in pkg_vulns:
             pkg_name = entry["name"]
             version = entry["version"]
@@ -895,15 +863,14 @@ def _is_bot_account(login: str) -> bool:
     return login in BOT_ACCOUNTS or login.endswith("[bot]")
 
 
-def detect_bot_only_approval(pr_audits: list[dict], prs: list[dict]) -> list[Finding]:
+def detect_bot_only_approval(dataset: AuditDataset) -> list[Finding]:
     """Detect merged PRs where all approvals came from bots (no human review).
 
     A PR merged with only bot approvals means no human examined the code diff
     before it landed on main.
 
     Args:
-        pr_audits: PR audit data (commits + reviews per PR).
-        prs: All audited PRs.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for bot-only approved PRs.
@@ -911,12 +878,7 @@ def detect_bot_only_approval(pr_audits: list[dict], prs: list[dict]) -> list[Fin
     """
     findings = []
 
-    pr_files_info: dict[tuple[str, int], dict] = {}
-    for pr in prs:
-        if pr.get("merged"):
-            pr_files_info[(pr.get("repo", ""), pr.get("number", 0))] = pr
-
-    for audit in pr_audits:
+    for audit in dataset.pr_audits:
         approvals = audit.get("approvals", [])
         repo = audit.get("repo", "")
         pr_num = audit.get("pr_number", 0)
@@ -1254,14 +1216,14 @@ def _scorecard_score_findings(
     return findings
 
 
-def detect_scorecard_issues(scorecards: dict[str, dict]) -> list[Finding]:
+def detect_scorecard_issues(dataset: AuditDataset) -> list[Finding]:
     """Detect weak OpenSSF Scorecard scores and workflow hygiene issues.
 
     Missing Scorecard workflows are reported in the Scorecard table only,
     not as anomaly findings.
 
     Args:
-        scorecards: Scorecard payloads keyed by repo.
+        dataset: Loaded audit data.
 
     Returns:
         Findings for low aggregate scores, weak checks, and workflow gaps
@@ -1270,7 +1232,7 @@ def detect_scorecard_issues(scorecards: dict[str, dict]) -> list[Finding]:
     """
     findings: list[Finding] = []
 
-    for repo, data in sorted(scorecards.items()):
+    for repo, data in sorted(dataset.scorecards.items()):
         workflow = data.get("workflow") or {}
         score_data = data.get("scorecard") or {}
         findings.extend(_scorecard_workflow_findings(repo, workflow))
@@ -1279,7 +1241,7 @@ def detect_scorecard_issues(scorecards: dict[str, dict]) -> list[Finding]:
     return findings
 
 
-def detect_self_approval(pr_audits: list[dict]) -> list[Finding]:
+def detect_self_approval(dataset: AuditDataset) -> list[Finding]:
     """Detect PRs where the author approved their own PR with no independent review.
 
     GitHub allows self-approval when branch protection doesn't enforce
@@ -1287,7 +1249,7 @@ def detect_self_approval(pr_audits: list[dict]) -> list[Finding]:
     a serious process violation — the author is reviewing their own code.
 
     Args:
-        pr_audits: PR audit data (commits + reviews per PR).
+        dataset: Loaded audit data.
 
     Returns:
         Findings for self-approved PRs.
@@ -1295,7 +1257,7 @@ def detect_self_approval(pr_audits: list[dict]) -> list[Finding]:
     """
     findings = []
 
-    for audit in pr_audits:
+    for audit in dataset.pr_audits:
         approvals = audit.get("approvals", [])
         pr_author = audit.get("pr_author", "")
         repo = audit.get("repo", "")
@@ -1361,42 +1323,44 @@ def detect_self_approval(pr_audits: list[dict]) -> list[Finding]:
     return findings
 
 
-def _print_cache_stats(  # pylint: disable=too-many-positional-arguments,too-many-arguments
-    commits: list[dict],
-    prs: list[dict],
-    checks: dict[str, list[dict]],
-    deps: list[dict],
-    protection: dict[str, dict],
-    pr_audits: list[dict],
-    renovate_configs: dict[str, dict],
-    vulns: dict[str, list[dict]],
-    scorecards: dict[str, dict],
-) -> None:
-    """Print summary statistics for loaded cache data.
+def _print_cache_stats(dataset: AuditDataset, cache_dir: Path, repos: list[str], *, loaded: bool) -> None:
+    """Print summary statistics for the cache and the data loaded from it.
+
+    Only the inputs of stale (pass, repo) pairs are loaded, so the cache
+    totals come from the manifest and the remaining counts are labelled
+    as covering just the data loaded for recomputation.
 
     Args:
-        commits: All audited commits.
-        prs: All audited PRs.
-        checks: Check suites keyed by commit SHA.
-        deps: All dependency changes.
-        protection: Branch protection data keyed by repo.
-        pr_audits: PR audit data.
-        renovate_configs: Renovate configs keyed by repo.
-        vulns: Vulnerability results keyed by repo.
-        scorecards: Scorecard payloads keyed by repo.
+        dataset: Audit data loaded for recomputation.
+        cache_dir: Root cache directory.
+        repos: All repos with cached data.
+        loaded: Whether any inputs were loaded.
 
     """
-    print(f"  Commits on main: {len(commits)}")
-    print(f"  PRs: {len(prs)}")
-    print(f"  PR branch commits: {sum(a.get('commit_count', 0) for a in pr_audits)}")
-    print(f"  Check suites: {sum(len(v) for v in checks.values())}")
-    print(f"  Dep changes: {len(deps)}")
-    print(f"  Repos with protection data: {len(protection)}")
+    manifest = read_manifest(cache_dir) or {}
+    print(
+        f"  Cache: {len(repos)} repos, {manifest.get('total_commits', 0)} commits, {manifest.get('total_prs', 0)} PRs",
+    )
+    if not loaded:
+        print("  Loaded for recomputation: nothing")
+        return
+    checks = dataset.checks
+    protection = dataset.protection
+    renovate_configs = dataset.renovate_configs
+    vulns = dataset.vulns
+    scorecards = dataset.scorecards
+    print("  Loaded for recomputation:")
+    print(f"    Commits on main: {len(dataset.commits)}")
+    print(f"    PRs: {len(dataset.prs)}")
+    print(f"    PR branch commits: {sum(a.get('commit_count', 0) for a in dataset.pr_audits)}")
+    print(f"    Check suites: {sum(len(v) for v in checks.values())}")
+    print(f"    Dep changes: {len(dataset.deps)}")
+    print(f"    Repos with protection data: {len(protection)}")
     print(
-        f"  Repos with renovate config: {sum(1 for c in renovate_configs.values() if c.get('source') != 'none')}",
+        f"    Repos with renovate config: {sum(1 for c in renovate_configs.values() if c.get('source') != 'none')}",
     )
     print(
-        f"  Repos with vulnerability data: {len(vulns)} ({sum(len(v) for v in vulns.values())} affected packages)",
+        f"    Repos with vulnerability data: {len(vulns)} ({sum(len(v) for v in vulns.values())} affected packages)",
     )
     workflows_present = sum(1 for s in scorecards.values() if (s.get("workflow") or {}).get("present"))
     scores_api = sum(
@@ -1410,232 +1374,454 @@ def _print_cache_stats(  # pylint: disable=too-many-positional-arguments,too-man
         if (s.get("scorecard") or {}).get("available") and (s.get("scorecard") or {}).get("source") == "cli"
     )
     print(
-        f"  Repos with Scorecard data: {len(scorecards)} "
+        f"    Repos with Scorecard data: {len(scorecards)} "
         f"({workflows_present} workflows, {scores_api} API scores, {scores_cli} CLI scores)",
     )
 
 
-def _run_detection_pass(
-    step: str,
-    description: str,
-    detector: Callable[[], list[Finding]],
-    result_message: Callable[[list[Finding]], str],
-) -> list[Finding]:
-    """Run a single detection pass and print its progress.
+@dataclass(frozen=True)
+class DetectionPass:
+    """A detection pass and the cache inputs it reads.
 
-    Args:
-        step: Step label (e.g. ``[1/12]``).
+    Attributes:
+        name: Stable identifier used in the incremental analysis state.
         description: Human-readable pass description.
-        detector: Callable that returns findings.
-        result_message: Callable that formats the result count.
+        detector: Produces findings from the audit dataset.
+        inputs: Cache subdirectories the detector reads.
+        result_message: Formats the result count.
+        fleet_wide: Whether a repo's findings also depend on other repos' inputs.
 
-    Returns:
-        Findings from this detection pass.
+    """
+
+    name: str
+    description: str
+    detector: Callable[[AuditDataset], list[Finding]]
+    inputs: tuple[str, ...]
+    result_message: Callable[[list[Finding]], str]
+    fleet_wide: bool = False
+
+
+# Findings are merged in this order.
+DETECTION_PASSES: tuple[DetectionPass, ...] = (
+    DetectionPass(
+        name="unsigned_commits",
+        description="Unsigned commits",
+        detector=detect_unsigned_commits,
+        inputs=("commits",),
+        result_message=lambda findings: f"Found {len(findings)} unsigned commits",
+    ),
+    DetectionPass(
+        name="github_web_signed",
+        description="GitHub-web-signed commits (excluding PR merges)",
+        detector=detect_github_web_signed,
+        inputs=("commits", "prs"),
+        result_message=lambda findings: f"Found {len(findings)} GitHub-web-signed commits (non-merge)",
+    ),
+    DetectionPass(
+        name="orphan_commits",
+        description="Orphan commits (no PR)",
+        detector=detect_orphan_commits,
+        inputs=("commits", "prs"),
+        result_message=lambda findings: f"Found {len(findings)} orphan commits",
+    ),
+    DetectionPass(
+        name="bypassed_ci",
+        description="Bypassed CI (required checks only)",
+        detector=detect_bypassed_ci,
+        inputs=("prs", "checks", "protection"),
+        result_message=lambda findings: f"Found {len(findings)} bypassed CI instances",
+    ),
+    DetectionPass(
+        name="post_merge_pushes",
+        description="Post-merge pushes",
+        detector=detect_post_merge_pushes,
+        inputs=("commits", "prs"),
+        result_message=lambda findings: f"Found {len(findings)} post-merge pushes",
+    ),
+    DetectionPass(
+        name="replicated_messages",
+        description="Replicated commit messages",
+        detector=detect_replicated_messages,
+        inputs=("commits",),
+        result_message=lambda findings: f"Found {len(findings)} replicated messages",
+        fleet_wide=True,
+    ),
+    DetectionPass(
+        name="suspicious_dep_timing",
+        description="Dependency cooldown policy check",
+        detector=detect_suspicious_dep_timing,
+        inputs=("deps", "renovate"),
+        result_message=lambda findings: (
+            f"Found {sum(1 for f in findings if f.category == FindingCategory.COOLDOWN_VIOLATED)} "
+            f"cooldown violations, "
+            f"{len(findings) - sum(1 for f in findings if f.category == FindingCategory.COOLDOWN_VIOLATED)} "
+            f"heuristic flags"
+        ),
+    ),
+    DetectionPass(
+        name="yanked_versions",
+        description="Yanked/deleted versions",
+        detector=detect_yanked_versions,
+        inputs=("deps",),
+        result_message=lambda findings: f"Found {len(findings)} yanked versions",
+    ),
+    DetectionPass(
+        name="protection_changes",
+        description="Branch protection changes",
+        detector=detect_protection_changes,
+        inputs=("protection",),
+        result_message=lambda findings: f"Found {len(findings)} protection findings",
+    ),
+    DetectionPass(
+        name="post_approval_commits",
+        description="Post-approval commits in PRs",
+        detector=detect_post_approval_commits,
+        inputs=("pr_audits",),
+        result_message=lambda findings: f"Found {len(findings)} PRs with post-approval commits",
+    ),
+    DetectionPass(
+        name="bot_only_approval",
+        description="Bot-only approvals (no human review)",
+        detector=detect_bot_only_approval,
+        inputs=("pr_audits",),
+        result_message=lambda findings: f"Found {len(findings)} PRs with bot-only approval",
+    ),
+    DetectionPass(
+        name="self_approval",
+        description="Self-approved PRs",
+        detector=detect_self_approval,
+        inputs=("pr_audits",),
+        result_message=lambda findings: f"Found {len(findings)} self-approved PRs",
+    ),
+    DetectionPass(
+        name="known_vulnerabilities",
+        description="Known vulnerabilities (OSV.dev)",
+        detector=detect_known_vulnerabilities,
+        inputs=("vulns",),
+        result_message=lambda findings: f"Found {len(findings)} known vulnerabilities",
+    ),
+    DetectionPass(
+        name="scorecard_issues",
+        description="OpenSSF Scorecard workflow and scores",
+        detector=detect_scorecard_issues,
+        inputs=("scorecard",),
+        result_message=lambda findings: f"Found {len(findings)} Scorecard findings",
+    ),
+)
+
+# Dataset attribute holding each cache input, for reporting pass input sizes.
+_DATASET_INPUTS = {
+    "commits": "commits",
+    "prs": "prs",
+    "checks": "checks",
+    "deps": "deps",
+    "protection": "protection",
+    "pr_audits": "pr_audits",
+    "renovate": "renovate_configs",
+    "vulns": "vulns",
+    "scorecard": "scorecards",
+}
+
+# Dataset visible to detection worker processes: inherited from the parent
+# when workers are forked, otherwise loaded once per worker by the initializer.
+_worker_dataset: AuditDataset | None = None
+
+
+def _init_detection_worker(cache_dir: Path, inputs: dict[str, list[str] | None] | None) -> None:
+    """Make the audit dataset available in a detection worker process.
+
+    Args:
+        cache_dir: Cache directory to load from when not inherited via fork.
+        inputs: Cache inputs to load (see :meth:`AuditDataset.load`).
 
     """
-    print(f"  {step} {description}...")
-    findings = detector()
-    print(f"          {result_message(findings)}")
-    return findings
+    global _worker_dataset  # noqa: PLW0603  # pylint: disable=global-statement
+    if _worker_dataset is None:
+        _worker_dataset = AuditDataset.load(cache_dir, inputs)
 
 
-def _run_detection_passes(  # pylint: disable=too-many-positional-arguments,too-many-arguments
-    commits: list[dict],
-    prs: list[dict],
-    checks: dict[str, list[dict]],
-    deps: list[dict],
-    protection: dict[str, dict],
-    pr_audits: list[dict],
-    renovate_configs: dict[str, dict],
-    vulns: dict[str, list[dict]],
-    scorecards: dict[str, dict],
-) -> list[Finding]:
-    """Execute all detection passes and return combined findings.
+def _run_detector(
+    index: int,
+    dataset: AuditDataset | None = None,
+    profile_dir: Path | None = None,
+) -> tuple[list[Finding], StageProfile]:
+    """Run one entry of ``DETECTION_PASSES`` and measure it.
 
     Args:
-        commits: All audited commits.
-        prs: All audited PRs.
-        checks: Check suites keyed by commit SHA.
-        deps: All dependency changes.
-        protection: Branch protection data keyed by repo.
-        pr_audits: PR audit data.
-        renovate_configs: Renovate configs keyed by repo.
-        vulns: Vulnerability results keyed by repo.
-        scorecards: Scorecard payloads keyed by repo.
+        index: Position in ``DETECTION_PASSES``.
+        dataset: Audit data; defaults to the worker process dataset.
+        profile_dir: Also run the pass under ``cProfile`` and write
+            ``<pass name>.pstats`` and ``.txt`` here.
 
     Returns:
-        Combined findings from all passes.
+        Findings and the pass's stage profile.
 
     """
-    print("\nRunning detection passes...")
+    data = dataset if dataset is not None else _worker_dataset
+    if data is None:
+        msg = "detection worker has no dataset"
+        raise RuntimeError(msg)
+    spec = DETECTION_PASSES[index]
+    input_sizes = {}
+    for subdir in spec.inputs:
+        loaded = getattr(data, _DATASET_INPUTS[subdir])
+        input_sizes[subdir] = len(loaded) if hasattr(loaded, "__len__") else None
+    profile_path = profile_dir / spec.name if profile_dir is not None else None
+    with measure(spec.name, input_sizes=input_sizes, profile_path=profile_path) as stage:
+        findings = spec.detector(data)
+        stage.output_size = len(findings)
+    return findings, stage
+
+
+def _run_detection_passes(  # pylint: disable=too-many-arguments
+    dataset: AuditDataset,
+    cache_dir: Path,
+    indexes: list[int],
+    *,
+    inputs: dict[str, list[str] | None] | None = None,
+    workers: int = 1,
+    profile_dir: Path | None = None,
+) -> tuple[dict[int, list[Finding]], list[StageProfile]]:
+    """Execute the selected detection passes.
+
+    With ``workers > 1`` the passes run in a process pool. Workers are
+    forked where supported so they share the already loaded dataset
+    copy-on-write; elsewhere each worker loads it once from ``cache_dir``.
+    The dataset is never pickled per task. Progress is printed in
+    ``DETECTION_PASSES`` order either way.
 
-    pass_specs: list[tuple[str, str, Callable[[], list[Finding]], Callable[[list[Finding]], str]]] = [
-        (
-            "[1/14]",
-            "Unsigned commits",
-            lambda: detect_unsigned_commits(commits),
-            lambda findings: f"Found {len(findings)} unsigned commits",
-        ),
-        (
-            "[2/14]",
-            "GitHub-web-signed commits (excluding PR merges)",
-            lambda: detect_github_web_signed(commits, prs),
-            lambda findings: f"Found {len(findings)} GitHub-web-signed commits (non-merge)",
-        ),
-        (
-            "[3/14]",
-            "Orphan commits (no PR)",
-            lambda: detect_orphan_commits(commits, prs),
-            lambda findings: f"Found {len(findings)} orphan commits",
-        ),
-        (
-            "[4/14]",
-            "Bypassed CI (required checks only)",
-            lambda: detect_bypassed_ci(commits, prs, checks, protection),
-            lambda findings: f"Found {len(findings)} bypassed CI instances",
-        ),
-        (
-            "[5/14]",
-            "Post-merge pushes",
-            lambda: detect_post_merge_pushes(commits, prs),
-            lambda findings: f"Found {len(findings)} post-merge pushes",
-        ),
-        (
-            "[6/14]",
-            "Replicated commit messages",
-            lambda: detect_replicated_messages(commits),
-            lambda findings: f"Found {len(findings)} replicated messages",
-        ),
-        (
-            "[7/14]",
-            "Dependency cooldown policy check",
-            lambda: detect_suspicious_dep_timing(deps, renovate_configs),
-            lambda findings: (
-                f"Found {sum(1 for f in findings if f.category == FindingCategory.COOLDOWN_VIOLATED)} "
-                f"cooldown violations, "
-                f"{len(findings) - sum(1 for f in findings if f.category == FindingCategory.COOLDOWN_VIOLATED)} "
-                f"heuristic flags"
-            ),
-        ),
-        (
-            "[8/14]",
-            "Yanked/deleted versions",
-            lambda: detect_yanked_versions(deps),
-            lambda findings: f"Found {len(findings)} yanked versions",
-        ),
-        (
-            "[9/14]",
-            "Branch protection changes",
-            lambda: detect_protection_changes(protection),
-            lambda findings: f"Found {len(findings)} protection findings",
-        ),
-        (
-            "[10/14]",
-            "Post-approval commits in PRs",
-            lambda: detect_post_approval_commits(pr_audits),
-            lambda findings: f"Found {len(findings)} PRs with post-approval commits",
-        ),
-        (
-            "[11/14]",
-            "Bot-only approvals (no human review)",
-            lambda: detect_bot_only_approval(pr_audits, prs),
-            lambda findings: f"Found {len(findings)} PRs with bot-only approval",
-        ),
-        (
-            "[12/14]",
-            "Self-approved PRs",
-            lambda: detect_self_approval(pr_audits),
-            lambda findings: f"Found {len(findings)} self-approved PRs",
-        ),
-        (
-            "[13/14]",
-            "Known vulnerabilities (OSV.dev)",
-            lambda: detect_known_vulnerabilities(vulns),
-            lambda findings: f"Found {len(findings)} known vulnerabilities",
-        ),
-        (
-            "[14/14]",
-            "OpenSSF Scorecard workflow and scores",
-            lambda: detect_scorecard_issues(scorecards),
-            lambda findings: f"Found {len(findings)} Scorecard findings",
-        ),
-    ]
+    Args:
+        dataset: Loaded audit data.
+        cache_dir: Cache directory the dataset was loaded from.
+        indexes: Positions in ``DETECTION_PASSES`` to run.
+        inputs: Cache inputs ``dataset`` was loaded with.
+        workers: Number of worker processes (1 runs in-process).
+        profile_dir: Directory for per-pass ``cProfile`` dumps, if wanted.
 
-    all_findings: list[Finding] = []
-    for step, description, detector, result_message in pass_specs:
-        all_findings.extend(
-            _run_detection_pass(step, description, detector, result_message),
-        )
+    Returns:
+        Findings per pass index, and the stage profile of each pass run.
 
-    return all_findings
+    """
+    global _worker_dataset  # noqa: PLW0603  # pylint: disable=global-statement
+    total = len(DETECTION_PASSES)
+    results: dict[int, tuple[list[Finding], StageProfile]] = {}
+    if workers <= 1 or len(indexes) <= 1:
+        for index in indexes:
+            spec = DETECTION_PASSES[index]
+            print(f"  [{index + 1}/{total}] {spec.description}...")
+            findings, stage = results[index] = _run_detector(index, dataset, profile_dir)
+            print(f"          {spec.result_message(findings)} ({stage.wall_seconds:.2f}s)")
+    else:
+        fork = "fork" in multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if fork else "spawn")
+        _worker_dataset = dataset if fork else None
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(indexes)),
+                mp_context=context,
+                initializer=_init_detection_worker,
+                initargs=(cache_dir, inputs),
+            ) as pool:
+                run = partial(_run_detector, profile_dir=profile_dir)
+                results = dict(zip(indexes, pool.map(run, indexes), strict=True))
+        finally:
+            _worker_dataset = None
+        for index in indexes:
+            spec = DETECTION_PASSES[index]
+            findings, stage = results[index]
+            print(
+                f"  [{index + 1}/{total}] {spec.description}: "
+                f"{spec.result_message(findings)} ({stage.wall_seconds:.2f}s)",
+            )
 
+    return (
+        {index: findings for index, (findings, _) in results.items()},
+        [results[index][1] for index in indexes],
+    )
 
-def _print_risk_summary(all_findings: list[Finding]) -> None:
-    """Print finding counts grouped by risk level.
+
+def _analysis_code_fingerprint() -> str:
+    """Hash the analysis sources so detector changes invalidate stored findings."""
+    digest = hashlib.sha256()
+    scripts_dir = Path(__file__).resolve().parent
+    for name in ANALYSIS_SOURCES:
+        path = scripts_dir / name
+        digest.update(name.encode())
+        digest.update(path.read_bytes() if path.exists() else b"")
+    return digest.hexdigest()
+
+
+def _pass_fingerprints(spec: DetectionPass, digests: dict[str, dict[str, str]], repos: list[str]) -> dict[str, str]:
+    """Fingerprint a pass's inputs per repo (or once for a fleet-wide pass).
 
     Args:
-        all_findings: Combined findings from all passes.
+        spec: Detection pass.
+        digests: Cache file digests per subdirectory and repo.
+        repos: All repos with cached data.
+
+    Returns:
+        Input fingerprint per repo, or under ``FLEET_SCOPE`` for fleet-wide passes.
 
     """
-    print(f"\nTotal findings: {len(all_findings)}")
 
-    by_risk: dict[str, int] = {}
-    for finding in all_findings:
-        by_risk.setdefault(finding.risk_level.value, 0)
-        by_risk[finding.risk_level.value] += 1
-    for risk, count in sorted(by_risk.items()):
-        print(f"  {risk}: {count}")
+    def fingerprint(scope: list[str]) -> str:
+        digest = hashlib.sha256()
+        for subdir in spec.inputs:
+            for repo in scope:
+                digest.update(f"{subdir}/{repo}:{digests[subdir].get(repo, '-')}\n".encode())
+        return digest.hexdigest()
+
+    if spec.fleet_wide:
+        return {FLEET_SCOPE: fingerprint(repos)}
+    return {repo: fingerprint([repo]) for repo in repos}
+
+
+def _group_by_repo(findings: list[Finding]) -> dict[str, list[dict]]:
+    grouped: dict[str, list[dict]] = {}
+    for finding in findings:
+        grouped.setdefault(finding.repo, []).append(finding.to_dict())
+    return grouped
+
 
+def run_analysis(cache_dir: Path, workers: int = 1, *, full: bool = False, profile: bool = False) -> list[Finding]:
+    """Run the detection passes and return combined findings.
 
-def run_analysis(cache_dir: Path) -> list[Finding]:
-    """Run all detection passes and return combined findings.
+    Each pass's inputs are fingerprinted per repo, and findings are kept
+    per pass and repo in the analysis state. On a rerun only the
+    (pass, repo) pairs whose inputs changed are recomputed, with just the
+    inputs they need loaded; everything else is reused. Fleet-wide passes
+    are recomputed whenever any repo's inputs change. A change to the
+    analysis code invalidates the whole state.
+
+    Every cache load and detection pass is measured (wall and CPU time,
+    peak memory growth, input and output sizes) and the measurements are
+    written to ``analysis_profile.json`` next to the findings.
 
     Args:
         cache_dir: Root cache directory.
+        workers: Number of processes running detection passes concurrently.
+        full: Ignore stored results and recompute every pass.
+        profile: Also run each pass under ``cProfile``, writing its
+            statistics to ``profile/<pass name>.pstats`` and ``.txt``.
 
     Returns:
         Combined findings from all passes.
 
     """
+    digests = cache_file_digests(cache_dir, sorted({subdir for spec in DETECTION_PASSES for subdir in spec.inputs}))
+    repos = sorted({repo for per_repo in digests.values() for repo in per_repo})
+    code = _analysis_code_fingerprint()
+    state = None if full else read_analysis_state(cache_dir)
+    previous = state.get("passes", {}) if state and state.get("code") == code else {}
+
+    fingerprints = [_pass_fingerprints(spec, digests, repos) for spec in DETECTION_PASSES]
+    stale: dict[int, set[str]] = {}
+    for index, spec in enumerate(DETECTION_PASSES):
+        known = previous.get(spec.name, {}).get("fingerprints", {})
+        changed = {scope for scope, fp in fingerprints[index].items() if known.get(scope) != fp}
+        if changed:
+            stale[index] = set(repos) if spec.fleet_wide else changed
+
+    inputs: dict[str, set[str] | None] = {}
+    for index, stale_repos in stale.items():
+        spec = DETECTION_PASSES[index]
+        for subdir in spec.inputs:
+            if spec.fleet_wide:
+                inputs[subdir] = None
+            elif subdir not in inputs or inputs[subdir] is not None:
+                inputs[subdir] = (inputs.get(subdir) or set()) | stale_repos
+    load_inputs = {subdir: None if scope is None else sorted(scope) for subdir, scope in inputs.items()}
+
     print("Loading cached data...")
-    commits = get_all_cached_commits(cache_dir)
-    prs = get_all_cached_prs(cache_dir)
-    checks = get_all_cached_checks(cache_dir)
-    deps = get_all_cached_deps(cache_dir)
-    protection = get_all_cached_protection(cache_dir)
-    pr_audits = get_all_cached_pr_audits(cache_dir)
-    renovate_configs = get_all_cached_renovate(cache_dir)
-    vulns = get_all_cached_vulns(cache_dir)
-    scorecards = get_all_cached_scorecard(cache_dir)
-
-    _print_cache_stats(
-        commits,
-        prs,
-        checks,
-        deps,
-        protection,
-        pr_audits,
-        renovate_configs,
-        vulns,
-        scorecards,
-    )
+    load_stages: list[StageProfile] = []
+    dataset = AuditDataset.load(cache_dir, load_inputs, stages=load_stages)
+    _print_cache_stats(dataset, cache_dir, repos, loaded=bool(load_inputs))
 
-    all_findings = _run_detection_passes(
-        commits,
-        prs,
-        checks,
-        deps,
-        protection,
-        pr_audits,
-        renovate_configs,
-        vulns,
-        scorecards,
+    print("\nRunning detection passes...")
+    reused = sum(len(fp) for fp in fingerprints) - sum(
+        1 if DETECTION_PASSES[index].fleet_wide else len(stale_repos) for index, stale_repos in stale.items()
+    )
+    print(f"  Reusing stored results for {reused} of {sum(len(fp) for fp in fingerprints)} (pass, repo) inputs")
+    started = time.perf_counter()
+    fresh, pass_stages = _run_detection_passes(
+        dataset,
+        cache_dir,
+        sorted(stale),
+        inputs=load_inputs,
+        workers=workers,
+        profile_dir=cache_dir / PROFILE_DIR if profile else None,
     )
+    detection_seconds = time.perf_counter() - started
+    print(f"  Detection wall time: {detection_seconds:.2f}s")
+    _write_analysis_profile(
+        cache_dir,
+        {
+            "workers": workers,
+            "full": full,
+            "reused_inputs": reused,
+            "total_inputs": sum(len(fp) for fp in fingerprints),
+            "detection_wall_seconds": round(detection_seconds, 6),
+            "loads": [stage.to_dict() for stage in load_stages],
+            "passes": [stage.to_dict() for stage in pass_stages],
+        },
+    )
+    if profile:
+        print(f"  Pass profiles written to: {cache_dir / PROFILE_DIR}")
+
+    all_findings: list[Finding] = []
+    passes_state: dict[str, dict] = {}
+    for index, spec in enumerate(DETECTION_PASSES):
+        by_repo = {
+            repo: findings
+            for repo, findings in previous.get(spec.name, {}).get("findings", {}).items()
+            if repo in repos and repo not in stale.get(index, set())
+        }
+        if index in fresh:
+            # Other passes may have loaded shared inputs for more repos; only
+            # the stale repos had all of this pass's inputs loaded.
+            recomputed = _group_by_repo(fresh[index])
+            scope = recomputed.keys() if spec.fleet_wide else stale[index]
+            by_repo.update({repo: recomputed.get(repo, []) for repo in scope})
+        by_repo = {repo: findings for repo, findings in sorted(by_repo.items()) if findings}
+        passes_state[spec.name] = {"fingerprints": fingerprints[index], "findings": by_repo}
+        for findings in by_repo.values():
+            all_findings.extend(Finding.from_dict(f) for f in findings)
+
+    write_analysis_state(cache_dir, {"code": code, "passes": passes_state})
     _print_risk_summary(all_findings)
 
     return all_findings
 
 
+def _write_analysis_profile(cache_dir: Path, data: dict) -> None:
+    """Write stage measurements of the run to ``analysis_profile.json``.
+
+    Args:
+        cache_dir: Root cache directory.
+        data: Profile data to write.
+
+    """
+    with (cache_dir / ANALYSIS_PROFILE_FILE).open("w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2)
+
+
+def _print_risk_summary(all_findings: list[Finding]) -> None:
+    """Print finding counts grouped by risk level.
+
+    Args:
+        all_findings: Combined findings from all passes.
+
+    """
+    print(f"\nTotal findings: {len(all_findings)}")
+
+    by_risk: dict[str, int] = {}
+    for finding in all_findings:
+        by_risk.setdefault(finding.risk_level.value, 0)
+        by_risk[finding.risk_level.value] += 1
+    for risk, count in sorted(by_risk.items()):
+        print(f"  {risk}: {count}")
+
+
 def _build_findings_summary(findings: list[dict], manifest: dict) -> dict:
     """Build a compact summary of findings for the agent to reason about.
 
@@ -1724,6 +1910,22 @@ def main() -> None:
         required=True,
         help="Cache directory from collect.py",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_ANALYZE_WORKERS,
+        help=f"Processes running detection passes concurrently (default: {DEFAULT_ANALYZE_WORKERS})",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Recompute every detection pass instead of reusing unchanged results",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"Run each detection pass under cProfile and write its statistics to {PROFILE_DIR}/ in the cache",
+    )
     args = parser.parse_args()
 
     cache_path = Path(args.cache_dir)
@@ -1754,7 +1956,7 @@ def main() -> None:
     repos_display = ", ".join(str(r) for r in manifest_repos) if isinstance(manifest_repos, list) else ""
     print(f"Repos: {repos_display}")
 
-    findings = run_analysis(cache_dir)
+    findings = run_analysis(cache_dir, workers=args.workers, full=args.full, profile=args.profile)
     serialized = [f.to_dict() for f in findings]
     write_findings(cache_dir, serialized)
 
@@ -1766,6 +1968,7 @@ def main() -> None:
 
     print(f"\nFindings written to: {cache_dir / 'findings.json'}")
     print(f"Summary written to: {summary_path}")
+    print(f"Stage profile written to: {cache_dir / ANALYSIS_PROFILE_FILE}")
 
 
 if __name__ == "__main__":
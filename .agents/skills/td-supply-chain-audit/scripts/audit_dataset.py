@@ -0,0 +1,396 @@
+"""In-memory audit dataset shared by all analysis passes.
+
+The cache is loaded once per run. Commits, PRs and check suites are
+converted into compact ``__slots__`` records with interned repo, login and
+status strings, and the lookup tables the detectors need (by SHA, by
+``(repo, number)``, by merge SHA) are built once instead of per pass.
+Records are built while the cache is streamed, so the raw dicts are never
+all held at once. PR audits, the bulkiest input and only ever scanned
+sequentially, stay on disk and are streamed again by each pass that reads
+them. The remaining inputs (dependency changes, protection, Renovate,
+vulnerability and Scorecard data) are kept as loaded.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable, Mapping
+
+try:
+    from cache_utils import (  # pylint: disable=import-error
+        CachedRecords,
+        cache_file_stats,
+        get_all_cached_deps,
+        get_all_cached_protection,
+        get_all_cached_renovate,
+        get_all_cached_scorecard,
+        get_all_cached_vulns,
+        iter_cached_checks,
+        iter_cached_records,
+    )
+    from instrumentation import StageProfile, measure  # pylint: disable=import-error
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from cache_utils import (
+        CachedRecords,
+        cache_file_stats,
+        get_all_cached_deps,
+        get_all_cached_protection,
+        get_all_cached_renovate,
+        get_all_cached_scorecard,
+        get_all_cached_vulns,
+        iter_cached_checks,
+        iter_cached_records,
+    )
+    from instrumentation import StageProfile, measure
+
+
+def _intern(value: Any) -> Any:  # noqa: ANN401
+    """Intern strings that repeat across records; pass anything else through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
+class CommitRecord:  # pylint: disable=too-many-instance-attributes
+    """A cached commit on the default branch.
+
+    Attributes:
+        sha: Full commit SHA.
+        repo: Repository name (org/repo).
+        date: ISO 8601 commit timestamp.
+        message: Commit message text.
+        author_login: GitHub login of the author.
+        author_email: Email of the author.
+        committer_login: GitHub login of the committer.
+        committer_email: Email of the committer.
+        verified: Whether the signature is valid.
+        verification_reason: Verification status reason.
+        associated_prs: Linked pull request numbers.
+
+    """
+
+    sha: str
+    repo: str
+    date: str
+    message: str
+    author_login: str
+    author_email: str
+    committer_login: str
+    committer_email: str
+    verified: bool
+    verification_reason: str
+    associated_prs: tuple[int, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CommitRecord:
+        """Build from a cached commit dict.
+
+        Args:
+            data: Commit dict as written by ``collect.py``.
+
+        Returns:
+            Compact commit record.
+
+        """
+        verification = data.get("verification") or {}
+        return cls(
+            sha=data["sha"],
+            repo=_intern(data["repo"]),
+            date=data.get("date", ""),
+            message=data.get("message", ""),
+            author_login=_intern(data.get("author_login", "unknown")),
+            author_email=_intern(data.get("author_email", "")),
+            committer_login=_intern(data.get("committer_login", "")),
+            committer_email=_intern(data.get("committer_email", "")),
+            verified=bool(verification.get("verified", False)),
+            verification_reason=_intern(verification.get("reason", "unsigned")),
+            associated_prs=tuple(data.get("associated_prs") or ()),
+        )
+
+
+@dataclass(slots=True)
+class PullRequestRecord:  # pylint: disable=too-many-instance-attributes
+    """A cached pull request.
+
+    Attributes:
+        repo: Repository name (org/repo).
+        number: PR number in the repository.
+        title: Pull request title.
+        state: Current state (open/closed).
+        merged: Whether the PR was merged.
+        merged_at: ISO 8601 merge timestamp.
+        merge_commit_sha: SHA of the merge commit.
+        author_login: GitHub login of the author.
+        head_ref: Source branch name.
+
+    """
+
+    repo: str
+    number: int
+    title: str
+    state: str
+    merged: bool
+    merged_at: str | None
+    merge_commit_sha: str | None
+    author_login: str
+    head_ref: str
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PullRequestRecord:
+        """Build from a cached PR dict.
+
+        Args:
+            data: PR dict as written by ``collect.py``.
+
+        Returns:
+            Compact PR record.
+
+        """
+        return cls(
+            repo=_intern(data["repo"]),
+            number=data["number"],
+            title=data.get("title", ""),
+            state=_intern(data.get("state", "")),
+            merged=bool(data.get("merged", False)),
+            merged_at=data.get("merged_at"),
+            merge_commit_sha=data.get("merge_commit_sha"),
+            author_login=_intern(data.get("author_login", "unknown")),
+            head_ref=data.get("head_ref", ""),
+        )
+
+
+@dataclass(slots=True)
+class CheckSuiteRecord:
+    """A cached check suite, reduced to what the detectors read.
+
+    Attributes:
+        app_name: Name of the CI app.
+        conclusion: Final result, if completed.
+
+    """
+
+    app_name: str
+    conclusion: str | None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CheckSuiteRecord:
+        """Build from a cached check suite dict.
+
+        Args:
+            data: Check suite dict as written by ``collect.py``.
+
+        Returns:
+            Compact check suite record.
+
+        """
+        return cls(
+            app_name=_intern(data.get("app_name", "unknown")),
+            conclusion=_intern(data.get("conclusion")),
+        )
+
+
+class AuditDataset:  # pylint: disable=too-many-instance-attributes
+    """All cached audit inputs plus the indexes shared by the detectors.
+
+    Attributes:
+        commits: Commits on the default branch, in cache order.
+        prs: Pull requests, in cache order.
+        checks: Check suites keyed by commit SHA.
+        deps: Dependency change dicts.
+        protection: Branch protection data keyed by repo.
+        pr_audits: PR audit dicts (commits + reviews per PR); iterate only,
+            as a loaded dataset streams them from the cache on each pass.
+        renovate_configs: Renovate configs keyed by repo.
+        vulns: Vulnerability results keyed by repo.
+        scorecards: Scorecard payloads keyed by repo.
+        commits_by_sha: First cached commit for each SHA.
+        prs_by_key: PRs keyed by ``(repo, number)``.
+        prs_by_merge_sha: PRs keyed by merge commit SHA (merged PRs win).
+
+    """
+
+    __slots__ = (
+        "checks",
+        "commits",
+        "commits_by_sha",
+        "deps",
+        "pr_audits",
+        "protection",
+        "prs",
+        "prs_by_key",
+        "prs_by_merge_sha",
+        "renovate_configs",
+        "scorecards",
+        "vulns",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        commits: list[CommitRecord],
+        prs: list[PullRequestRecord],
+        checks: dict[str, list[CheckSuiteRecord]],
+        deps: list[dict[str, Any]],
+        protection: dict[str, dict[str, Any]],
+        pr_audits: Iterable[dict[str, Any]],
+        renovate_configs: dict[str, dict[str, Any]],
+        vulns: dict[str, list[dict[str, Any]]],
+        scorecards: dict[str, dict[str, Any]],
+    ) -> None:
+        """Store the inputs and build the shared indexes.
+
+        Args:
+            commits: Commit records.
+            prs: PR records.
+            checks: Check suite records keyed by commit SHA.
+            deps: Dependency change dicts.
+            protection: Branch protection data keyed by repo.
+            pr_audits: PR audit dicts, or a re-iterable stream of them.
+            renovate_configs: Renovate configs keyed by repo.
+            vulns: Vulnerability results keyed by repo.
+            scorecards: Scorecard payloads keyed by repo.
+
+        """
+        self.commits = commits
+        self.prs = prs
+        self.checks = checks
+        self.deps = deps
+        self.protection = protection
+        self.pr_audits = pr_audits
+        self.renovate_configs = renovate_configs
+        self.vulns = vulns
+        self.scorecards = scorecards
+
+        self.commits_by_sha: dict[str, CommitRecord] = {}
+        for commit in commits:
+            self.commits_by_sha.setdefault(commit.sha, commit)
+
+        self.prs_by_key: dict[tuple[str, int], PullRequestRecord] = {}
+        self.prs_by_merge_sha: dict[str, PullRequestRecord] = {}
+        for pr in prs:
+            self.prs_by_key[pr.repo, pr.number] = pr
+            if pr.merge_commit_sha:
+                existing = self.prs_by_merge_sha.get(pr.merge_commit_sha)
+                if existing is None or (pr.merged and not existing.merged):
+                    self.prs_by_merge_sha[pr.merge_commit_sha] = pr
+
+    @classmethod
+    def from_records(  # pylint: disable=too-many-arguments
+        cls,
+        *,
+        commits: list[dict[str, Any]],
+        prs: list[dict[str, Any]],
+        checks: dict[str, list[dict[str, Any]]],
+        deps: list[dict[str, Any]],
+        protection: dict[str, dict[str, Any]],
+        pr_audits: list[dict[str, Any]],
+        renovate_configs: dict[str, dict[str, Any]],
+        vulns: dict[str, list[dict[str, Any]]],
+        scorecards: dict[str, dict[str, Any]],
+    ) -> AuditDataset:
+        """Build a dataset from cached dicts.
+
+        Args:
+            commits: Commit dicts.
+            prs: PR dicts.
+            checks: Check suite dicts keyed by commit SHA.
+            deps: Dependency change dicts.
+            protection: Branch protection data keyed by repo.
+            pr_audits: PR audit dicts.
+            renovate_configs: Renovate configs keyed by repo.
+            vulns: Vulnerability results keyed by repo.
+            scorecards: Scorecard payloads keyed by repo.
+
+        Returns:
+            Dataset with compact records and indexes.
+
+        """
+        return cls(
+            commits=[CommitRecord.from_dict(c) for c in commits],
+            prs=[PullRequestRecord.from_dict(p) for p in prs],
+            checks={sha: [CheckSuiteRecord.from_dict(s) for s in suites] for sha, suites in checks.items()},
+            deps=deps,
+            protection=protection,
+            pr_audits=pr_audits,
+            renovate_configs=renovate_configs,
+            vulns=vulns,
+            scorecards=scorecards,
+        )
+
+    @classmethod
+    def load(
+        cls,
+        cache_dir: Path,
+        inputs: Mapping[str, Collection[str] | None] | None = None,
+        *,
+        stages: list[StageProfile] | None = None,
+    ) -> AuditDataset:
+        """Load cached inputs for one audit window.
+
+        Commits, PRs and check suites are converted into records as they are
+        streamed from the cache, so their raw dicts never accumulate. PR
+        audits are not read here at all; the dataset holds a view that
+        streams them on iteration.
+
+        Args:
+            cache_dir: Cache directory holding ``manifest.json``.
+            inputs: Cache subdirectories to load, each mapped to the repos to
+                read (``None`` for all). Subdirectories left out stay empty.
+                Defaults to everything.
+            stages: When given, each subdirectory load is measured and its
+                profile (named ``load:<subdir>``) appended here.
+
+        Returns:
+            Dataset with compact records and indexes.
+
+        """
+
+        def wanted(subdir: str) -> tuple[bool, Collection[str] | None]:
+            if inputs is None:
+                return True, None
+            return subdir in inputs, inputs.get(subdir)
+
+        def measured(subdir: str, load: Callable[[Collection[str] | None], Any], empty: Any) -> Any:  # noqa: ANN401
+            include, repos = wanted(subdir)
+            if not include:
+                return empty
+            if stages is None:
+                return load(repos)
+            files = cache_file_stats(cache_dir, [subdir])[subdir]
+            sizes = [size for repo, (_, size) in files.items() if repos is None or repo in repos]
+            with measure(f"load:{subdir}", input_sizes={"files": len(sizes), "bytes": sum(sizes)}) as stage:
+                loaded = load(repos)
+                stage.output_size = len(loaded) if hasattr(loaded, "__len__") else None
+            stages.append(stage)
+            return loaded
+
+        def load_checks(repos: Collection[str] | None) -> dict[str, list[CheckSuiteRecord]]:
+            checks: dict[str, list[CheckSuiteRecord]] = {}
+            for sha, suites in iter_cached_checks(cache_dir, repos):
+                checks.setdefault(sha, []).extend(CheckSuiteRecord.from_dict(s) for s in suites)
+            return checks
+
+        return cls(
+            commits=measured(
+                "commits",
+                lambda repos: [CommitRecord.from_dict(c) for c in iter_cached_records(cache_dir, "commits", repos)],
+                [],
+            ),
+            prs=measured(
+                "prs",
+                lambda repos: [PullRequestRecord.from_dict(p) for p in iter_cached_records(cache_dir, "prs", repos)],
+                [],
+            ),
+            checks=measured("checks", load_checks, {}),
+            deps=measured("deps", lambda repos: get_all_cached_deps(cache_dir, repos), []),
+            protection=measured("protection", lambda repos: get_all_cached_protection(cache_dir, repos), {}),
+            pr_audits=measured("pr_audits", lambda repos: CachedRecords(cache_dir, "pr_audits", repos), []),
+            renovate_configs=measured("renovate", lambda repos: get_all_cached_renovate(cache_dir, repos), {}),
+            vulns=measured("vulns", lambda repos: get_all_cached_vulns(cache_dir, repos), {}),
+            scorecards=measured("scorecard", lambda repos: get_all_cached_scorecard(cache_dir, repos), {}),
+        )
@@ -113,10 +113,12 @@ class Commit:  # pylint: disable=too-many-instance-attributes
         committer_login: GitHub login of committer.
         committer_email: Email of the committer.
         message: Commit message text.
-        date: ISO 8601 commit timestamp.
+        date: ISO 8601 author timestamp.
         verification: Signature verification details.
         associated_prs: Linked pull request numbers.
         url: GitHub web URL for commit.
+        committed_date: ISO 8601 committer timestamp (when the commit was
+            applied, e.g. by a rebase or cherry-pick).
 
     """
 
@@ -131,6 +133,7 @@ class Commit:  # pylint: disable=too-many-instance-attributes
     verification: CommitVerification
     associated_prs: list[int] = field(default_factory=list)
     url: str = ""
+    committed_date: str = ""
 
     @classmethod
     def from_api(cls, data: dict[str, Any], repo: str) -> Commit:
@@ -166,6 +169,7 @@ class Commit:  # pylint: disable=too-many-instance-attributes
                 signer_email=commit_data.get("committer", {}).get("email", ""),
             ),
             url=data.get("html_url", ""),
+            committed_date=commit_data.get("committer", {}).get("date", ""),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -193,6 +197,7 @@ class Commit:  # pylint: disable=too-many-instance-attributes
             },
             "associated_prs": self.associated_prs,
             "url": self.url,
+            "committed_date": self.committed_date,
         }
 
     @classmethod
@@ -225,6 +230,7 @@ class Commit:  # pylint: disable=too-many-instance-attributes
             ),
             associated_prs=data.get("associated_prs", []),
             url=data.get("url", ""),
+            committed_date=data.get("committed_date", ""),
         )
 
 
@@ -244,6 +250,7 @@ class PullRequest:  # pylint: disable=too-many-instance-attributes
         base_ref: Target branch name.
         head_ref: Source branch name.
         url: GitHub web URL for PR.
+        updated_at: ISO 8601 last-update timestamp (content key in the object store).
 
     """
 
@@ -258,6 +265,7 @@ class PullRequest:  # pylint: disable=too-many-instance-attributes
     base_ref: str
     head_ref: str
     url: str = ""
+    updated_at: str | None = None
 
     @classmethod
     def from_api(cls, data: dict[str, Any], repo: str) -> PullRequest:
@@ -286,6 +294,7 @@ class PullRequest:  # pylint: disable=too-many-instance-attributes
             base_ref=base.get("ref", ""),
             head_ref=head.get("ref", ""),
             url=data.get("html_url", ""),
+            updated_at=data.get("updated_at"),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -307,6 +316,7 @@ class PullRequest:  # pylint: disable=too-many-instance-attributes
             "base_ref": self.base_ref,
             "head_ref": self.head_ref,
             "url": self.url,
+            "updated_at": self.updated_at,
         }
 
     @classmethod
@@ -332,6 +342,7 @@ class PullRequest:  # pylint: disable=too-many-instance-attributes
             base_ref=data.get("base_ref", ""),
             head_ref=data.get("head_ref", ""),
             url=data.get("url", ""),
+            updated_at=data.get("updated_at"),
         )
 
 
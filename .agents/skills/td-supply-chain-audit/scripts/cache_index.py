@@ -0,0 +1,338 @@
+"""SQLite index over the supply-chain audit cache.
+
+The per-repo JSON files written by ``collect.py`` remain the source of
+truth. This module mirrors the dependency changes, together with the
+commits and PRs they link to, into ``cache_index.sqlite`` next to them,
+indexed by package, date and SHA, so package lookups ("which repos
+changed package X between two dates, and in which PRs") become one
+indexed query instead of a full cache load.
+
+The index is synced per cache file: only files whose size or modification
+time changed since the last sync, or that reference an object rewritten
+since, are read again, and rows of files that disappeared are dropped.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, Self, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable, Iterator
+    from types import TracebackType
+
+try:
+    from cache_utils import (  # pylint: disable=import-error
+        cache_file_stats,
+        iter_cached_records,
+        referenced_object_files,
+    )
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from cache_utils import (
+        cache_file_stats,
+        iter_cached_records,
+        referenced_object_files,
+    )
+
+CACHE_INDEX_FILE = "cache_index.sqlite"
+# Bump when the schema changes; an index with another version is rebuilt.
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE files (
+    subdir TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (subdir, repo)
+);
+CREATE TABLE objects (subdir TEXT NOT NULL, repo TEXT NOT NULL, path TEXT NOT NULL, mtime_ns INTEGER, size INTEGER);
+CREATE INDEX objects_file ON objects (subdir, repo);
+CREATE TABLE commits (repo TEXT NOT NULL, sha TEXT NOT NULL, data TEXT NOT NULL);
+CREATE INDEX commits_sha ON commits (sha);
+CREATE TABLE prs (repo TEXT NOT NULL, number INTEGER NOT NULL, merge_commit_sha TEXT);
+CREATE INDEX prs_merge_commit_sha ON prs (merge_commit_sha);
+CREATE TABLE deps (
+    repo TEXT NOT NULL,
+    package TEXT NOT NULL,
+    commit_sha TEXT,
+    commit_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX deps_package_date ON deps (package, commit_date);
+"""
+
+
+def _dump(data: object) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _package_key(name: object) -> str:
+    """Case-insensitive package key, matching ``check_package`` comparisons."""
+    return str(name or "").lower()
+
+
+def _day_after(day: str) -> str:
+    """Exclusive upper bound for an inclusive ``YYYY-MM-DD`` ``until`` filter."""
+    return (date.fromisoformat(day[:10]) + timedelta(days=1)).isoformat()
+
+
+def _stat(path: Path) -> tuple[int | None, int | None]:
+    """``(mtime_ns, size)`` of a file, or ``(None, None)`` if it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None, None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _commit_rows(cache_dir: Path, repo: str) -> Iterator[tuple[object, ...]]:
+    for commit in iter_cached_records(cache_dir, "commits", [repo]):
+        yield repo, commit.get("sha", ""), _dump(commit)
+
+
+def _pr_rows(cache_dir: Path, repo: str) -> Iterator[tuple[object, ...]]:
+    for pr in iter_cached_records(cache_dir, "prs", [repo]):
+        yield repo, pr.get("number", 0), pr.get("merge_commit_sha")
+
+
+def _dep_rows(cache_dir: Path, repo: str) -> Iterator[tuple[object, ...]]:
+    for dep in iter_cached_records(cache_dir, "deps", [repo]):
+        yield (
+            repo,
+            _package_key(dep.get("package_name")),
+            dep.get("commit_sha"),
+            dep.get("commit_date"),
+            _dump(dep),
+        )
+
+
+@dataclass(frozen=True)
+class _Partition:
+    """How one cache subdirectory maps onto an index table.
+
+    Attributes:
+        table: Table holding the subdirectory's records.
+        columns: Number of columns per row.
+        rows: Produces the rows of one repo's cache file.
+
+    """
+
+    table: str
+    columns: int
+    rows: Callable[[Path, str], Iterable[tuple[object, ...]]]
+
+
+# Cache subdirectory -> index table, in sync order.
+_PARTITIONS: dict[str, _Partition] = {
+    "commits": _Partition("commits", 3, _commit_rows),
+    "prs": _Partition("prs", 3, _pr_rows),
+    "deps": _Partition("deps", 5, _dep_rows),
+}
+
+
+@dataclass
+class PackageUsage:
+    """Where one package was changed in the cached dependency history.
+
+    Attributes:
+        package: Package key (lower-cased name).
+        changes: Dependency change dicts, ordered by repo and commit date.
+        pull_requests: Numbers of the PRs that merged or contain each change,
+            keyed by ``(repo, commit SHA)``.
+
+    """
+
+    package: str
+    changes: list[dict[str, Any]] = field(default_factory=list)
+    pull_requests: dict[tuple[str, str], list[int]] = field(default_factory=dict)
+
+    @property
+    def repos(self) -> list[str]:
+        """Repos that changed the package."""
+        return sorted({str(change.get("repo", "")) for change in self.changes})
+
+    @property
+    def versions(self) -> list[str]:
+        """Versions the package was changed to."""
+        return sorted({str(change["new_version"]) for change in self.changes if change.get("new_version")})
+
+
+class CacheIndex:
+    """Queryable SQLite mirror of one audit cache window."""
+
+    def __init__(self, cache_dir: Path, connection: sqlite3.Connection) -> None:
+        """Wrap an open index database.
+
+        Args:
+            cache_dir: Cache directory the index mirrors.
+            connection: Connection to its ``cache_index.sqlite``.
+
+        """
+        self.cache_dir = cache_dir
+        self._conn = connection
+
+    def __enter__(self) -> Self:
+        """Return the index for use in a ``with`` block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def sync(self) -> int:
+        """Bring the index up to date with the cache files.
+
+        Stored objects are rewritten when a later collect changes them, so a
+        file whose own stat is unchanged is still re-indexed when one of the
+        objects it references changed.
+
+        Returns:
+            Number of ``(subdirectory, repo)`` files re-indexed or dropped.
+
+        """
+        stats = cache_file_stats(self.cache_dir, _PARTITIONS)
+        known: dict[tuple[str, str], tuple[int, int]] = {
+            (subdir, repo): (mtime_ns, size)
+            for subdir, repo, mtime_ns, size in self._conn.execute("SELECT subdir, repo, mtime_ns, size FROM files")
+        }
+        objects: dict[tuple[str, str], list[tuple[str, int | None, int | None]]] = {}
+        for subdir, repo, path, mtime_ns, size in self._conn.execute(
+            "SELECT subdir, repo, path, mtime_ns, size FROM objects",
+        ):
+            objects.setdefault((subdir, repo), []).append((path, mtime_ns, size))
+        changed = 0
+        with self._conn:
+            for subdir, partition in _PARTITIONS.items():
+                current = stats[subdir]
+                for known_subdir, repo in known:
+                    if known_subdir == subdir and repo not in current:
+                        self._drop(subdir, partition, repo)
+                        changed += 1
+                for repo, stat in current.items():
+                    if known.get((subdir, repo)) == stat and all(
+                        _stat(Path(path)) == (mtime_ns, size)
+                        for path, mtime_ns, size in objects.get((subdir, repo), [])
+                    ):
+                        continue
+                    self._drop(subdir, partition, repo)
+                    # Stat the objects before reading them, so one rewritten
+                    # in between is picked up by the next sync.
+                    referenced = [
+                        (subdir, repo, str(path), *_stat(path))
+                        for path in referenced_object_files(self.cache_dir, subdir, repo)
+                    ]
+                    placeholders = ", ".join("?" * partition.columns)
+                    self._conn.executemany(
+                        f"INSERT INTO {partition.table} VALUES ({placeholders})",  # noqa: S608
+                        partition.rows(self.cache_dir, repo),
+                    )
+                    self._conn.execute("INSERT INTO files VALUES (?, ?, ?, ?)", (subdir, repo, *stat))
+                    self._conn.executemany("INSERT INTO objects VALUES (?, ?, ?, ?, ?)", referenced)
+                    changed += 1
+        return changed
+
+    def _drop(self, subdir: str, partition: _Partition, repo: str) -> None:
+        self._conn.execute(f"DELETE FROM {partition.table} WHERE repo = ?", (repo,))  # noqa: S608
+        self._conn.execute("DELETE FROM files WHERE subdir = ? AND repo = ?", (subdir, repo))
+        self._conn.execute("DELETE FROM objects WHERE subdir = ? AND repo = ?", (subdir, repo))
+
+    def package_usage(
+        self,
+        packages: Collection[str],
+        *,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> dict[str, PackageUsage]:
+        """Look up several packages in the dependency history with one indexed query.
+
+        Each change is linked to the PRs that merged its commit (by merge
+        commit SHA) or list it among their commits (the commit's
+        ``associated_prs``).
+
+        Args:
+            packages: Package names (case-insensitive).
+            since: Only changes committed on or after this day (YYYY-MM-DD).
+            until: Only changes committed on or before this day (YYYY-MM-DD).
+
+        Returns:
+            Usage per package key, including packages that were never changed.
+
+        """
+        usage = {_package_key(name): PackageUsage(_package_key(name)) for name in packages}
+        if not usage:
+            return usage
+        sql = (
+            "SELECT deps.package, deps.repo, deps.commit_sha, deps.data,"  # noqa: S608
+            " (SELECT group_concat(prs.number) FROM prs"
+            "  WHERE prs.merge_commit_sha = deps.commit_sha AND prs.repo = deps.repo),"
+            " (SELECT commits.data FROM commits"
+            "  WHERE commits.sha = deps.commit_sha AND commits.repo = deps.repo LIMIT 1)"
+            f" FROM deps WHERE deps.package IN ({', '.join('?' * len(usage))})"
+        )
+        params: list[object] = list(usage)
+        if since:
+            sql += " AND deps.commit_date >= ?"
+            params.append(since)
+        if until:
+            sql += " AND deps.commit_date < ?"
+            params.append(_day_after(until))
+        sql += " ORDER BY deps.package, deps.repo, deps.commit_date, deps.rowid"
+        for package, repo, commit_sha, data, merged_prs, commit_data in self._conn.execute(sql, params):
+            entry = usage[package]
+            entry.changes.append(json.loads(data))
+            numbers = {int(n) for n in merged_prs.split(",")} if merged_prs else set()
+            if commit_data:
+                numbers.update(json.loads(commit_data).get("associated_prs") or ())
+            if numbers:
+                entry.pull_requests[repo, commit_sha] = sorted(numbers)
+        return usage
+
+
+@overload
+def open_cache_index(cache_dir: Path, *, create: Literal[True]) -> CacheIndex: ...
+
+
+@overload
+def open_cache_index(cache_dir: Path, *, create: bool = False) -> CacheIndex | None: ...
+
+
+def open_cache_index(cache_dir: Path, *, create: bool = False) -> CacheIndex | None:
+    """Open the SQLite index of a cache window and sync it with the cache files.
+
+    Args:
+        cache_dir: Cache directory holding ``manifest.json``.
+        create: Build the index if it does not exist yet.
+
+    Returns:
+        Synced index, or ``None`` when there is none and ``create`` is false.
+
+    """
+    path = cache_dir / CACHE_INDEX_FILE
+    if not path.exists() and not create:
+        return None
+    connection = sqlite3.connect(path)
+    if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        connection.close()
+        path.unlink(missing_ok=True)
+        connection = sqlite3.connect(path)
+        connection.executescript(_SCHEMA)
+        connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    index = CacheIndex(cache_dir, connection)
+    index.sync()
+    return index
@@ -6,10 +6,17 @@ repeat runs with the same time frame produce identical output.
 
 from __future__ import annotations
 
+import gzip
 import hashlib
 import json
-from datetime import UTC, datetime
+import os
+import tempfile
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator
 
 TARGET_REPOS = [
     "ansible/ansible-builder",
@@ -35,6 +42,58 @@ TARGET_REPOS = [
 # Default org when a bare repo name is passed (e.g. via --repos).
 GITHUB_ORG = "ansible"
 
+# Shared per-day segment store, a sibling of the per-window cache dirs.
+SEGMENTS_DIRNAME = "segments"
+SEGMENT_COVERAGE_FILE = "coverage.json"
+# Bumped when the way objects are bucketed into days changes; coverage
+# recorded under another version is ignored, so those days are refetched.
+SEGMENT_LAYOUT_VERSION = 2
+
+# Shared content-addressed object store, a sibling of the per-window cache dirs.
+OBJECTS_DIRNAME = "objects"
+# Marker key of a reference document that points into the object store.
+OBJECT_REFS_KEY = "$objects"
+ANALYSIS_STATE_FILE = "analysis_state.json"
+SHA1_HEX_LEN = 40
+
+# Serializers for per-repo cache files and day segments. Objects in the
+# store stay plain JSON: they are small enough that compressing them costs
+# more on load than it saves. Readers detect the format from the file
+# contents, so a cache written in either format, or a mix of both, stays
+# readable under the same file names.
+JSON_FORMAT = "json"
+JSON_GZIP_FORMAT = "json-gz"
+CACHE_FORMATS = (JSON_FORMAT, JSON_GZIP_FORMAT)
+DEFAULT_CACHE_FORMAT = JSON_FORMAT
+GZIP_MAGIC = b"\x1f\x8b"
+# Cache files are rewritten on every collection, so favour speed over ratio.
+GZIP_COMPRESS_LEVEL = 1
+
+# Format used for cache data written by this process (see set_cache_format).
+_cache_format = DEFAULT_CACHE_FORMAT
+
+
+def set_cache_format(name: str) -> None:
+    """Select the serializer for cache data written by this process.
+
+    Args:
+        name: One of ``CACHE_FORMATS``.
+
+    Raises:
+        ValueError: If ``name`` is not a known format.
+
+    """
+    global _cache_format  # noqa: PLW0603  # pylint: disable=global-statement
+    if name not in CACHE_FORMATS:
+        msg = f"unknown cache format {name!r} (expected one of: {', '.join(CACHE_FORMATS)})"
+        raise ValueError(msg)
+    _cache_format = name
+
+
+def get_cache_format() -> str:
+    """Return the serializer selected for cache data written by this process."""
+    return _cache_format
+
 
 def normalize_repo(repo: str) -> str:
     """Return a canonical ``org/repo`` slug.
@@ -119,12 +178,390 @@ def ensure_cache_structure(cache_dir: Path) -> None:
         "protection",
         "renovate",
         "vulns",
+        "inventory",
         "pr_audits",
     ]
     for sub in subdirs:
         (cache_dir / sub).mkdir(parents=True, exist_ok=True)
 
 
+def get_objects_dir(cache_dir: Path) -> Path:
+    """Return the shared object store directory for a window or segment dir.
+
+    Args:
+        cache_dir: Window cache directory (``<base>/<key>``) or segment dir (``<base>/segments``).
+
+    Returns:
+        ``<base>/objects``.
+
+    """
+    return cache_dir.parent / OBJECTS_DIRNAME
+
+
+def repo_object_kind(kind: str, repo: str) -> str:
+    """Object kind scoped to one repo, for objects keyed by commit SHA.
+
+    A SHA can exist in several repos (forks, mirrors) with different
+    repo-specific data, so those objects are stored per repo.
+    """
+    return f"{kind}/{repo_cache_name(repo)}"
+
+
+def pr_object_key(pr: dict[str, object]) -> str:
+    """Content key of a PR: ``org/repo#number@updated_at``."""
+    return f"{pr.get('repo', '')}#{pr.get('number', 0)}@{pr.get('updated_at') or ''}"
+
+
+def _object_path(objects_dir: Path, kind: str, key: str) -> Path:
+    """Map an object key to its file; commit SHAs are used as-is, other keys are hashed."""
+    is_sha = len(key) == SHA1_HEX_LEN and all(c in "0123456789abcdef" for c in key)
+    digest = key if is_sha else hashlib.sha256(key.encode()).hexdigest()
+    return objects_dir / kind / digest[:2] / f"{digest}.json"
+
+
+def has_object(objects_dir: Path, kind: str, key: str) -> bool:
+    """Check whether the object store holds ``key`` of ``kind``.
+
+    Args:
+        objects_dir: Object store directory.
+        kind: Object kind (``commits``, ``prs``, ``checks``, ...).
+        key: Object key.
+
+    Returns:
+        ``True`` if the object is stored.
+
+    """
+    return _object_path(objects_dir, kind, key).exists()
+
+
+def read_object(objects_dir: Path, kind: str, key: str) -> object | None:
+    """Read one object from the store.
+
+    Args:
+        objects_dir: Object store directory.
+        kind: Object kind.
+        key: Object key.
+
+    Returns:
+        Stored data, or ``None`` if absent.
+
+    """
+    path = _object_path(objects_dir, kind, key)
+    if not path.exists():
+        return None
+    return _read_json(path)
+
+
+def write_objects(objects_dir: Path, kind: str, objects: dict[str, object]) -> int:
+    """Store objects by key, leaving stored objects whose content is unchanged untouched.
+
+    Objects can carry data that a later collect corrects (e.g. a commit's
+    associated PRs), so a stored object with different content is replaced.
+
+    Args:
+        objects_dir: Object store directory.
+        kind: Object kind.
+        objects: Data per object key.
+
+    Returns:
+        Number of objects written.
+
+    """
+    written = 0
+    for key, data in objects.items():
+        path = _object_path(objects_dir, kind, key)
+        if path.exists() and path.read_text(encoding="utf-8") == json.dumps(data, indent=0, ensure_ascii=False):
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(path, data, indent=0)
+        written += 1
+    return written
+
+
+def object_refs(
+    objects_dir: Path,
+    kind: str,
+    objects: dict[str, object],
+    *,
+    shape: str = "list",
+    inline: dict[str, object] | None = None,
+) -> dict[str, object]:
+    """Store objects and return a reference document pointing at them.
+
+    Args:
+        objects_dir: Object store directory.
+        kind: Object kind.
+        objects: Data per object key, in the order to restore.
+        shape: How :func:`resolve_object_refs` rebuilds the data: ``list``
+            (values in order), ``mapping`` (``{key: value}``) or ``single``.
+        inline: For ``mapping`` documents, entries that are not yet final
+            and are kept in the document instead of the store.
+
+    Returns:
+        Reference document to store in place of the data.
+
+    """
+    write_objects(objects_dir, kind, objects)
+    refs: dict[str, object] = {OBJECT_REFS_KEY: kind, "shape": shape, "keys": list(objects)}
+    if inline:
+        refs["inline"] = inline
+    return refs
+
+
+def resolve_object_refs(objects_dir: Path, data: object) -> object:
+    """Replace reference documents (top level or one level down) with stored objects.
+
+    Args:
+        objects_dir: Object store directory.
+        data: Parsed cache file content.
+
+    Returns:
+        Data with references resolved; anything else is returned unchanged.
+
+    """
+    if not isinstance(data, dict):
+        return data
+    if OBJECT_REFS_KEY not in data:
+        if any(isinstance(v, dict) and OBJECT_REFS_KEY in v for v in data.values()):
+            return {k: resolve_object_refs(objects_dir, v) for k, v in data.items()}
+        return data
+    kind = str(data[OBJECT_REFS_KEY])
+    keys = [str(k) for k in data.get("keys", [])]
+    values = {key: read_object(objects_dir, kind, key) for key in keys}
+    if data.get("shape") == "mapping":
+        resolved = {key: value for key, value in values.items() if value is not None}
+        inline = data.get("inline")
+        if isinstance(inline, dict):
+            resolved.update(inline)
+        return resolved
+    if data.get("shape") == "single":
+        return next(iter(values.values()), None)
+    return [value for value in values.values() if value is not None]
+
+
+def get_segments_dir(cache_dir: Path) -> Path:
+    """Return the shared per-day segment directory for a window cache dir.
+
+    Args:
+        cache_dir: Window cache directory (``<base>/<key>``).
+
+    Returns:
+        ``<base>/segments``.
+
+    """
+    return cache_dir.parent / SEGMENTS_DIRNAME
+
+
+def iter_days(start_date: str, end_date: str) -> list[str]:
+    """List every day in an inclusive ``YYYY-MM-DD`` range.
+
+    Args:
+        start_date: First day.
+        end_date: Last day.
+
+    Returns:
+        ISO day strings in ascending order.
+
+    """
+    first = date.fromisoformat(start_date)
+    last = date.fromisoformat(end_date)
+    return [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+
+
+def contiguous_ranges(days: list[str]) -> list[tuple[str, str]]:
+    """Group sorted ISO days into inclusive ``(start, end)`` runs of consecutive days.
+
+    Args:
+        days: Ascending ISO day strings.
+
+    Returns:
+        Consecutive-day ranges.
+
+    """
+    ranges: list[tuple[str, str]] = []
+    for day in days:
+        if ranges and date.fromisoformat(day) - date.fromisoformat(ranges[-1][1]) == timedelta(days=1):
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
+
+
+def read_segment_coverage(segments_dir: Path, repo: str) -> set[str]:
+    """Return the days whose segments for ``repo`` are complete.
+
+    Args:
+        segments_dir: Shared segment directory.
+        repo: Repository name.
+
+    Returns:
+        Covered ISO days (none if the coverage predates ``SEGMENT_LAYOUT_VERSION``).
+
+    """
+    path = segments_dir / repo_cache_name(repo) / SEGMENT_COVERAGE_FILE
+    if not path.exists():
+        return set()
+    with path.open(encoding="utf-8") as f:
+        coverage = json.load(f)
+    if not isinstance(coverage, dict) or coverage.get("version") != SEGMENT_LAYOUT_VERSION:
+        return set()
+    return set(coverage.get("days", []))
+
+
+def write_day_segments(
+    segments_dir: Path,
+    repo: str,
+    segments: dict[str, dict[str, object]],
+    *,
+    complete: set[str],
+) -> None:
+    """Store per-day segments for a repo and extend its coverage record.
+
+    Args:
+        segments_dir: Shared segment directory.
+        repo: Repository name.
+        segments: Segment payload per ISO day.
+        complete: Days that may be marked covered (days still in progress are
+            written but refetched next time).
+
+    """
+    repo_dir = segments_dir / repo_cache_name(repo)
+    repo_dir.mkdir(parents=True, exist_ok=True)
+    for day, payload in segments.items():
+        _write_json_atomic(repo_dir / f"{day}.json", payload, indent=0, cache_format=_cache_format)
+    covered = read_segment_coverage(segments_dir, repo) | (complete & set(segments))
+    _write_json_atomic(repo_dir / SEGMENT_COVERAGE_FILE, {"version": SEGMENT_LAYOUT_VERSION, "days": sorted(covered)})
+
+
+def read_day_segment(segments_dir: Path, repo: str, day: str) -> dict[str, object] | None:
+    """Read one day's segment for a repo.
+
+    Args:
+        segments_dir: Shared segment directory.
+        repo: Repository name.
+        day: ISO day.
+
+    Returns:
+        Segment payload, or ``None`` if not stored.
+
+    """
+    path = segments_dir / repo_cache_name(repo) / f"{day}.json"
+    if not path.exists():
+        return None
+    return _load_cache_json(path, get_objects_dir(segments_dir))  # type: ignore[return-value]
+
+
+def _write_json_atomic(
+    path: Path,
+    data: object,
+    *,
+    indent: int | None = 2,
+    cache_format: str = JSON_FORMAT,
+) -> None:
+    """Write JSON to ``path`` via a temp file and rename so readers never see partial data.
+
+    Args:
+        path: Destination file path.
+        data: Data to serialize.
+        indent: JSON indentation level (ignored for compressed output).
+        cache_format: One of ``CACHE_FORMATS``; ``json-gz`` writes compact,
+            gzip-compressed JSON with a fixed header timestamp so output
+            stays reproducible.
+
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        if cache_format == JSON_GZIP_FORMAT:
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(payload, compresslevel=GZIP_COMPRESS_LEVEL, mtime=0))
+        else:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=indent, ensure_ascii=False)
+        Path(tmp_name).replace(path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _read_json(path: Path) -> object:
+    """Parse a JSON file written in any of ``CACHE_FORMATS``."""
+    raw = path.read_bytes()
+    if raw.startswith(GZIP_MAGIC):
+        raw = gzip.decompress(raw)
+    return json.loads(raw)
+
+
+def _load_cache_json(path: Path, objects_dir: Path) -> object:
+    """Load a cache JSON file, resolving object-store references.
+
+    Args:
+        path: JSON file path.
+        objects_dir: Object store directory.
+
+    Returns:
+        Parsed and resolved data.
+
+    """
+    return resolve_object_refs(objects_dir, _read_json(path))
+
+
+def _iter_cache_list(path: Path, objects_dir: Path) -> Iterator[object]:
+    """Yield the entries of a list-shaped cache file one at a time.
+
+    Reference documents are resolved one object per step, so only the key
+    list and the current record are held in memory. Inline lists are parsed
+    per file.
+
+    Args:
+        path: JSON file path.
+        objects_dir: Object store directory.
+
+    Yields:
+        Entries in stored order.
+
+    """
+    data = _read_json(path)
+    if isinstance(data, dict) and OBJECT_REFS_KEY in data and data.get("shape", "list") == "list":
+        kind = str(data[OBJECT_REFS_KEY])
+        for key in data.get("keys", []):
+            value = read_object(objects_dir, kind, str(key))
+            if value is not None:
+                yield value
+        return
+    data = resolve_object_refs(objects_dir, data)
+    if isinstance(data, list):
+        yield from data
+
+
+def _iter_cache_mapping(path: Path, objects_dir: Path) -> Iterator[tuple[str, object]]:
+    """Yield the ``(key, value)`` entries of a mapping-shaped cache file one at a time.
+
+    Args:
+        path: JSON file path.
+        objects_dir: Object store directory.
+
+    Yields:
+        Stored entries, followed by entries kept inline.
+
+    """
+    data = _read_json(path)
+    if not isinstance(data, dict):
+        return
+    if OBJECT_REFS_KEY not in data:
+        yield from resolve_object_refs(objects_dir, data).items()  # type: ignore[union-attr]
+        return
+    kind = str(data[OBJECT_REFS_KEY])
+    inline = data.get("inline") if isinstance(data.get("inline"), dict) else {}
+    for key in data.get("keys", []):
+        if key in inline:
+            continue
+        value = read_object(objects_dir, kind, str(key))
+        if value is not None:
+            yield str(key), value
+    yield from inline.items()
+
+
 def read_cache_file(
     cache_dir: Path,
     subdir: str,
@@ -144,8 +581,7 @@ def read_cache_file(
     path = cache_dir / subdir / filename
     if not path.exists():
         return None
-    with path.open(encoding="utf-8") as f:
-        return json.load(f)  # type: ignore[no-any-return]
+    return _load_cache_json(path, get_objects_dir(cache_dir))  # type: ignore[return-value]
 
 
 def write_cache_file(
@@ -154,7 +590,7 @@ def write_cache_file(
     filename: str,
     data: dict[str, object] | list[object],
 ) -> Path:
-    """Write data as JSON to cache.
+    """Write data to cache atomically in the selected cache format.
 
     Args:
         cache_dir: Root cache directory.
@@ -168,8 +604,7 @@ def write_cache_file(
     """
     (cache_dir / subdir).mkdir(parents=True, exist_ok=True)
     path = cache_dir / subdir / filename
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _write_json_atomic(path, data, cache_format=_cache_format)
     return path
 
 
@@ -237,10 +672,9 @@ def write_manifest(
         "gh_version": gh_version,
         "total_commits": total_commits,
         "total_prs": total_prs,
+        "cache_format": _cache_format,
     }
-    manifest_path = cache_dir / "manifest.json"
-    with manifest_path.open("w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
+    _write_json_atomic(cache_dir / "manifest.json", manifest)
 
 
 def read_findings(cache_dir: Path) -> list[dict[str, object]]:
@@ -322,209 +756,362 @@ def is_cache_complete(cache_dir: Path, repos: list[str] | None = None) -> bool:
     return all(has_cached_data(cache_dir, repo, "commits") for repo in repos)
 
 
-def get_all_cached_commits(cache_dir: Path) -> list[dict[str, object]]:
+def _repo_cache_files(cache_dir: Path, subdir: str, repos: Collection[str] | None = None) -> list[Path]:
+    """Per-repo JSON files of a cache subdirectory, in name order.
+
+    Args:
+        cache_dir: Root cache directory.
+        subdir: Subdirectory name (e.g. ``commits``).
+        repos: Only return files for these repos (default: all).
+
+    Returns:
+        Matching file paths.
+
+    """
+    directory = cache_dir / subdir
+    if not directory.exists():
+        return []
+    wanted = None if repos is None else {repo_cache_name(repo) for repo in repos}
+    return [f for f in sorted(directory.iterdir()) if f.suffix == ".json" and (wanted is None or f.stem in wanted)]
+
+
+def _referenced_object_paths(objects_dir: Path, data: object) -> Iterator[Path]:
+    """Yield the object files referenced by a cache document (top level or one level down)."""
+    if not isinstance(data, dict):
+        return
+    if OBJECT_REFS_KEY in data:
+        documents = [data]
+    else:
+        documents = [v for v in data.values() if isinstance(v, dict) and OBJECT_REFS_KEY in v]
+    for document in documents:
+        kind = str(document[OBJECT_REFS_KEY])
+        for key in document.get("keys", []):
+            yield _object_path(objects_dir, kind, str(key))
+
+
+def referenced_object_files(cache_dir: Path, subdir: str, repo: str) -> list[Path]:
+    """List the object files a repo's cache file references.
+
+    Args:
+        cache_dir: Root cache directory.
+        subdir: Subdirectory name (e.g. ``commits``).
+        repo: Repository name.
+
+    Returns:
+        Referenced object paths (empty when the file is missing or inline).
+
+    """
+    path = cache_dir / subdir / f"{repo_cache_name(repo)}.json"
+    if not path.exists():
+        return []
+    return list(_referenced_object_paths(get_objects_dir(cache_dir), _read_json(path)))
+
+
+def cache_file_digests(cache_dir: Path, subdirs: Iterable[str]) -> dict[str, dict[str, str]]:
+    """Fingerprint the per-repo cache files of each subdirectory.
+
+    Files reference the object store by key, and a stored object is
+    rewritten when a later collect changes it, so each file's digest also
+    covers the ``(mtime_ns, size)`` of every object it references.
+
+    Args:
+        cache_dir: Root cache directory.
+        subdirs: Subdirectory names to fingerprint.
+
+    Returns:
+        SHA-256 hex digest per subdirectory and repo name.
+
+    """
+    objects_dir = get_objects_dir(cache_dir)
+    digests: dict[str, dict[str, str]] = {}
+    for subdir in subdirs:
+        digests[subdir] = {}
+        for f in _repo_cache_files(cache_dir, subdir):
+            raw = f.read_bytes()
+            digest = hashlib.sha256(raw)
+            text = gzip.decompress(raw) if raw.startswith(GZIP_MAGIC) else raw
+            if OBJECT_REFS_KEY.encode() in text:
+                for path in _referenced_object_paths(objects_dir, json.loads(text)):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        digest.update(b"-\n")
+                        continue
+                    digest.update(f"{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+            digests[subdir][repo_from_cache_name(f.stem)] = digest.hexdigest()
+    return digests
+
+
+def cache_file_stats(cache_dir: Path, subdirs: Iterable[str]) -> dict[str, dict[str, tuple[int, int]]]:
+    """Stat the per-repo cache files of each subdirectory without reading them.
+
+    Cache files are replaced atomically on every write, so a changed
+    ``(mtime_ns, size)`` pair reliably marks a rewritten file.
+
+    Args:
+        cache_dir: Root cache directory.
+        subdirs: Subdirectory names to stat.
+
+    Returns:
+        ``(mtime_ns, size)`` per subdirectory and repo name.
+
+    """
+    stats: dict[str, dict[str, tuple[int, int]]] = {}
+    for subdir in subdirs:
+        stats[subdir] = {}
+        for f in _repo_cache_files(cache_dir, subdir):
+            stat = f.stat()
+            stats[subdir][repo_from_cache_name(f.stem)] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+def read_analysis_state(cache_dir: Path) -> dict[str, object] | None:
+    """Read the incremental analysis state written by the previous run.
+
+    Args:
+        cache_dir: Root cache directory.
+
+    Returns:
+        State dict, or ``None`` if absent or unreadable.
+
+    """
+    path = cache_dir / ANALYSIS_STATE_FILE
+    if not path.exists():
+        return None
+    try:
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def write_analysis_state(cache_dir: Path, state: dict[str, object]) -> None:
+    """Persist the incremental analysis state.
+
+    Args:
+        cache_dir: Root cache directory.
+        state: Input fingerprints and per-repo findings per detection pass.
+
+    """
+    _write_json_atomic(cache_dir / ANALYSIS_STATE_FILE, state, indent=None)
+
+
+def iter_cached_records(
+    cache_dir: Path,
+    subdir: str,
+    repos: Collection[str] | None = None,
+) -> Iterator[dict[str, object]]:
+    """Stream the records of a list-shaped cache subdirectory across repos.
+
+    Records are read one at a time (see :func:`_iter_cache_list`), so a
+    single pass over the result runs in memory bounded by the largest
+    record rather than the whole history.
+
+    Args:
+        cache_dir: Root cache directory.
+        subdir: Subdirectory name (``commits``, ``prs``, ``deps`` or ``pr_audits``).
+        repos: Only read these repos (default: all cached repos).
+
+    Yields:
+        Record dicts, repo by repo in name order.
+
+    """
+    objects_dir = get_objects_dir(cache_dir)
+    for f in _repo_cache_files(cache_dir, subdir, repos):
+        yield from _iter_cache_list(f, objects_dir)  # type: ignore[misc]
+
+
+def iter_cached_checks(
+    cache_dir: Path,
+    repos: Collection[str] | None = None,
+) -> Iterator[tuple[str, list[dict[str, object]]]]:
+    """Stream cached check suites per commit SHA across repos.
+
+    Args:
+        cache_dir: Root cache directory.
+        repos: Only read these repos (default: all cached repos).
+
+    Yields:
+        ``(commit SHA, check suites)`` pairs; a SHA may repeat across repos.
+
+    """
+    objects_dir = get_objects_dir(cache_dir)
+    for f in _repo_cache_files(cache_dir, "checks", repos):
+        yield from _iter_cache_mapping(f, objects_dir)  # type: ignore[misc]
+
+
+class CachedRecords:
+    """Re-iterable view of a list-shaped cache subdirectory.
+
+    Every iteration streams the records from disk again instead of keeping
+    them in memory, trading repeated reads for a flat memory profile.
+    """
+
+    __slots__ = ("cache_dir", "repos", "subdir")
+
+    def __init__(self, cache_dir: Path, subdir: str, repos: Collection[str] | None = None) -> None:
+        """Initialize the view.
+
+        Args:
+            cache_dir: Root cache directory.
+            subdir: Subdirectory name (see :func:`iter_cached_records`).
+            repos: Only read these repos (default: all cached repos).
+
+        """
+        self.cache_dir = cache_dir
+        self.subdir = subdir
+        self.repos = repos
+
+    def __iter__(self) -> Iterator[dict[str, object]]:
+        """Stream the records from disk."""
+        return iter_cached_records(self.cache_dir, self.subdir, self.repos)
+
+
+def get_all_cached_commits(cache_dir: Path, repos: Collection[str] | None = None) -> list[dict[str, object]]:
     """Load all cached commits across all repos.
 
     Args:
         cache_dir: Root cache directory.
+        repos: Only load these repos (default: all cached repos).
 
     Returns:
         Combined list of commit dicts.
 
     """
-    all_commits: list[dict[str, object]] = []
-    commits_dir = cache_dir / "commits"
-    if not commits_dir.exists():
-        return []
-    for f in sorted(commits_dir.iterdir()):
-        if f.suffix == ".json":
-            with f.open(encoding="utf-8") as fh:
-                data = json.load(fh)
-                if isinstance(data, list):
-                    all_commits.extend(data)
-    return all_commits
+    return list(iter_cached_records(cache_dir, "commits", repos))
 
 
-def get_all_cached_prs(cache_dir: Path) -> list[dict[str, object]]:
+def get_all_cached_prs(cache_dir: Path, repos: Collection[str] | None = None) -> list[dict[str, object]]:
     """Load all cached PRs across all repos.
 
     Args:
         cache_dir: Root cache directory.
+        repos: Only load these repos (default: all cached repos).
 
     Returns:
         Combined list of PR dicts.
 
     """
-    all_prs: list[dict[str, object]] = []
-    prs_dir = cache_dir / "prs"
-    if not prs_dir.exists():
-        return []
-    for f in sorted(prs_dir.iterdir()):
-        if f.suffix == ".json":
-            with f.open(encoding="utf-8") as fh:
-                data = json.load(fh)
-                if isinstance(data, list):
-                    all_prs.extend(data)
-    return all_prs
+    return list(iter_cached_records(cache_dir, "prs", repos))
 
 
-def get_all_cached_checks(cache_dir: Path) -> dict[str, list[dict[str, object]]]:
+def get_all_cached_checks(cache_dir: Path, repos: Collection[str] | None = None) -> dict[str, list[dict[str, object]]]:
     """Load all cached check suites, keyed by commit SHA.
 
     Args:
         cache_dir: Root cache directory.
+        repos: Only load these repos (default: all cached repos).
 
     Returns:
         Check suites grouped by commit SHA.
 
     """
     checks_by_sha: dict[str, list[dict[str, object]]] = {}
-    checks_dir = cache_dir / "checks"
-    if not checks_dir.exists():
-        return {}
-    for f in sorted(checks_dir.iterdir()):
-        if f.suffix == ".json":
-            with f.open(encoding="utf-8") as fh:
-                data = json.load(fh)
-                if isinstance(data, dict):
-                    for sha, suites in data.items():
-                        checks_by_sha.setdefault(sha, []).extend(suites)
+    for sha, suites in iter_cached_checks(cache_dir, repos):
+        checks_by_sha.setdefault(sha, []).extend(suites)
     return checks_by_sha
 
 
-def get_all_cached_deps(cache_dir: Path) -> list[dict[str, object]]:
+def get_all_cached_deps(cache_dir: Path, repos: Collection[str] | None = None) -> list[dict[str, object]]:
     """Load all cached dependency changes.
 
     Args:
         cache_dir: Root cache directory.
+        repos: Only load these repos (default: all cached repos).
 
     Returns:
         Combined list of dependency change dicts.
 
     """
-    all_deps: list[dict[str, object]] = []
-    deps_dir = cache_dir / "deps"
-    if not deps_dir.exists():
-        return []
-    for f in sorted(deps_dir.iterdir()):
-        if f.suffix == ".json":
-            with f.open(encoding="utf-8") as fh:
-                data = json.load(fh)
-                if isinstance(data, list):
-                    all_deps.extend(data)
-    return all_deps
+    return list(iter_cached_records(cache_dir, "deps", repos))
 
 
-def get_all_cached_protection(cache_dir: Path) -> dict[str, dict[str, object]]:
+def get_all_cached_protection(cache_dir: Path, repos: Collection[str] | None = None) -> dict[str, dict[str, object]]:
     """Load all cached branch protection data, keyed by repo name.
 
     Args:
         cache_dir: Root cache directory.
+        repos: Only load these repos (default: all cached repos).
 
     Returns:
         Protection data grouped by repository.
 
     """
     protection: dict[str, dict[str, object]] = {}
-    prot_dir = cache_dir / "protection"
-    if not prot_dir.exists():
-        return {}
-    for f in sorted(prot_dir.iterdir()):
-        if f.suffix == ".json":
-            repo_name = repo_from_cache_name(f.stem)
-            with f.open(encoding="utf-8") as fh:
-                protection[repo_name] = json.load(fh)
+    for f in _repo_cache_files(cache_dir, "protection", repos):
+        repo_name = repo_from_cache_name(f.stem)
+        protection[repo_name] = _load_cache_json(f, get_objects_dir(cache_dir))  # type: ignore[assignment]
     return protection
 
 
-def get_all_cached_vulns(cache_dir: Path) -> dict[str, list[dict[str, object]]]:
+def get_all_cached_vulns(cache_dir: Path, repos: Collection[str] | None = None) -> dict[str, list[dict[str, object]]]:
     """Load all cached vulnerability scan results, keyed by repo name.
 
     Args:
         cache_dir: Root cache directory.
+        repos: Only load these repos (default: all cached repos).
 
     Returns:
         Vulnerability results grouped by repository.
 
     """
     vulns: dict[str, list[dict[str, object]]] = {}
-    vulns_dir = cache_dir / "vulns"
-    if not vulns_dir.exists():
-        return {}
-    for f in sorted(vulns_dir.iterdir()):
-        if f.suffix == ".json":
-            repo_name = repo_from_cache_name(f.stem)
-            with f.open(encoding="utf-8") as fh:
-                data = json.load(fh)
-                if isinstance(data, list) and data:
-                    vulns[repo_name] = data
+    for f in _repo_cache_files(cache_dir, "vulns", repos):
+        repo_name = repo_from_cache_name(f.stem)
+        data = _load_cache_json(f, get_objects_dir(cache_dir))
+        if isinstance(data, list) and data:
+            vulns[repo_name] = data
     return vulns
 
 
-def get_all_cached_renovate(cache_dir: Path) -> dict[str, dict[str, object]]:
+def get_all_cached_renovate(cache_dir: Path, repos: Collection[str] | None = None) -> dict[str, dict[str, object]]:
     """Load all cached renovate configs, keyed by repo name.
 
     Args:
         cache_dir: Root cache directory.
+        repos: Only load these repos (default: all cached repos).
 
     Returns:
         Renovate configs grouped by repository.
 
     """
     configs: dict[str, dict[str, object]] = {}
-    reno_dir = cache_dir / "renovate"
-    if not reno_dir.exists():
-        return {}
-    for f in sorted(reno_dir.iterdir()):
-        if f.suffix == ".json":
-            repo_name = repo_from_cache_name(f.stem)
-            with f.open(encoding="utf-8") as fh:
-                configs[repo_name] = json.load(fh)
+    for f in _repo_cache_files(cache_dir, "renovate", repos):
+        repo_name = repo_from_cache_name(f.stem)
+        configs[repo_name] = _load_cache_json(f, get_objects_dir(cache_dir))  # type: ignore[assignment]
     return configs
 
 
-def get_all_cached_pr_audits(cache_dir: Path) -> list[dict[str, object]]:
+def get_all_cached_pr_audits(cache_dir: Path, repos: Collection[str] | None = None) -> list[dict[str, object]]:
     """Load all cached PR audit data (commits + reviews per PR).
 
     Args:
         cache_dir: Root cache directory.
+        repos: Only load these repos (default: all cached repos).
 
     Returns:
         Combined list of PR audit dicts.
 
     """
-    all_audits: list[dict[str, object]] = []
-    audits_dir = cache_dir / "pr_audits"
-    if not audits_dir.exists():
-        return []
-    for f in sorted(audits_dir.iterdir()):
-        if f.suffix == ".json":
-            with f.open(encoding="utf-8") as fh:
-                data = json.load(fh)
-                if isinstance(data, list):
-                    all_audits.extend(data)
-    return all_audits
+    return list(iter_cached_records(cache_dir, "pr_audits", repos))
 
 
-def get_all_cached_scorecard(cache_dir: Path) -> dict[str, dict[str, object]]:
+def get_all_cached_scorecard(cache_dir: Path, repos: Collection[str] | None = None) -> dict[str, dict[str, object]]:
     """Load all cached OpenSSF Scorecard data, keyed by repo name.
 
     Args:
         cache_dir: Root cache directory.
+        repos: Only load these repos (default: all cached repos).
 
     Returns:
         Scorecard data grouped by repository.
 
     """
     scorecards: dict[str, dict[str, object]] = {}
-    scorecard_dir = cache_dir / "scorecard"
-    if not scorecard_dir.exists():
-        return {}
-    for f in sorted(scorecard_dir.iterdir()):
-        if f.suffix == ".json":
-            repo_name = repo_from_cache_name(f.stem)
-            with f.open(encoding="utf-8") as fh:
-                data = json.load(fh)
-                if isinstance(data, dict):
-                    scorecards[repo_name] = data
+    for f in _repo_cache_files(cache_dir, "scorecard", repos):
+        repo_name = repo_from_cache_name(f.stem)
+        data = _load_cache_json(f, get_objects_dir(cache_dir))
+        if isinstance(data, dict):
+            scorecards[repo_name] = data
     return scorecards
@@ -4,30 +4,33 @@ Given a suspect package and compromise date, determines which repos in the
 ADT ecosystem pulled in the affected version and when. Cross-references
 cached dependency change data to build an impact timeline.
 """
-# ruff: noqa: BLE001
 
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
 try:
+    from cache_index import PackageUsage, open_cache_index  # pylint: disable=import-error
     from cache_utils import (  # pylint: disable=import-error
-        get_all_cached_deps,
         read_manifest,
         write_package_focus,
     )
+    from registry_client import default_registry  # pylint: disable=import-error
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from cache_index import PackageUsage, open_cache_index
     from cache_utils import (
-        get_all_cached_deps,
         read_manifest,
         write_package_focus,
     )
+    from registry_client import default_registry
+
+# Packages whose release dates are fetched concurrently in batch mode.
+REGISTRY_MAX_WORKERS = 8
 
 
 def get_pypi_release_dates(package_name: str) -> dict[str, str]:
@@ -40,26 +43,8 @@ def get_pypi_release_dates(package_name: str) -> dict[str, str]:
         Mapping of version string to release date (YYYY-MM-DD).
 
     """
-    try:
-        url = f"https://pypi.org/pypi/{package_name}/json"
-        req = urllib.request.Request(  # noqa: S310
-            url,
-            headers={"User-Agent": "supply-chain-audit/1.0"},
-        )
-        with urllib.request.urlopen(req, timeout=15) as resp:  # noqa: S310
-            data = json.loads(resp.read())
-
-        releases = data.get("releases", {})
-        version_dates: dict[str, str] = {}
-        for version, files in releases.items():
-            if files:
-                upload_time = files[0].get("upload_time_iso_8601", "")
-                if upload_time:
-                    version_dates[version] = upload_time[:10]
-    except Exception:
-        return {}
-    else:
-        return version_dates
+    info = default_registry().release_info("pypi", package_name)
+    return dict(info.release_dates) if info else {}
 
 
 def get_npm_release_dates(package_name: str) -> dict[str, str]:
@@ -72,24 +57,8 @@ def get_npm_release_dates(package_name: str) -> dict[str, str]:
         Mapping of version string to release date (YYYY-MM-DD).
 
     """
-    try:
-        url = f"https://registry.npmjs.org/{package_name}"
-        req = urllib.request.Request(  # noqa: S310
-            url,
-            headers={"User-Agent": "supply-chain-audit/1.0"},
-        )
-        with urllib.request.urlopen(req, timeout=15) as resp:  # noqa: S310
-            data = json.loads(resp.read())
-
-        time_data = data.get("time", {})
-        version_dates: dict[str, str] = {}
-        for version, timestamp in time_data.items():
-            if version not in ("created", "modified"):
-                version_dates[version] = timestamp[:10]
-    except Exception:
-        return {}
-    else:
-        return version_dates
+    info = default_registry().release_info("npm", package_name)
+    return dict(info.release_dates) if info else {}
 
 
 def analyze_package_impact(
@@ -97,14 +66,16 @@ def analyze_package_impact(
     compromise_date: str,
     deps: list[dict],
     release_dates: dict[str, str],
+    pull_requests: dict[tuple[str, str], list[int]] | None = None,
 ) -> dict:
     """Analyze how a compromised package affected the ecosystem.
 
     Args:
         package_name: Name of the suspected package.
         compromise_date: Suspected compromise date (YYYY-MM-DD).
-        deps: All cached dependency changes.
+        deps: Cached dependency changes; changes of other packages are ignored.
         release_dates: Version-to-date mapping from registry.
+        pull_requests: PR numbers per ``(repo, commit SHA)`` of a change.
 
     Returns:
         Impact analysis results dict.
@@ -137,6 +108,7 @@ def analyze_package_impact(
                 "change_type": change_type,
                 "commit_date": commit_date,
                 "commit_sha": dep.get("commit_sha", ""),
+                "pull_requests": (pull_requests or {}).get((repo, dep.get("commit_sha", "")), []),
                 "file_path": dep.get("file_path", ""),
                 "version_release_date": version_release,
                 "is_pinned": is_pinned,
@@ -257,7 +229,69 @@ def _build_timeline(
     return events
 
 
-def main() -> None:
+def _read_package_names(packages: list[str] | None, packages_file: str | None) -> list[str]:
+    """Collect package names from ``--package`` and ``--packages-file`` (one per line, ``#`` comments).
+
+    Args:
+        packages: Names given on the command line.
+        packages_file: Path of a file listing more names.
+
+    Returns:
+        Names in first-seen order, without case-insensitive duplicates.
+
+    """
+    names = list(packages or [])
+    if packages_file:
+        for line in Path(packages_file).read_text(encoding="utf-8").splitlines():
+            name = line.split("#", 1)[0].strip()
+            if name:
+                names.append(name)
+    unique: dict[str, str] = {}
+    for name in names:
+        unique.setdefault(name.lower(), name)
+    return list(unique.values())
+
+
+def _find_cache_dir(cache_path: Path) -> Path | None:
+    """Return ``cache_path`` or its first window subdirectory holding ``manifest.json``."""
+    if (cache_path / "manifest.json").exists():
+        return cache_path
+    for subdir in sorted(cache_path.iterdir()):
+        if subdir.is_dir() and (subdir / "manifest.json").exists():
+            return subdir
+    return None
+
+
+def _print_summary(package: str, result: dict, usage: PackageUsage) -> None:
+    """Print the impact summary of one package.
+
+    Args:
+        package: Package name as requested.
+        result: Output of :func:`analyze_package_impact`.
+        usage: Index lookup result for the package.
+
+    """
+    print(f"\n{'=' * 60}")
+    print(f"  Results Summary: {package}")
+    print(f"{'=' * 60}")
+    print(f"  Repos using '{package}': {result['total_repos_using']}")
+    print(f"  Versions adopted: {', '.join(usage.versions) or 'none'}")
+    print(f"  Potentially exposed: {result['potentially_exposed_count']}")
+    print(f"  Affected entries: {len(result['affected_entries'])}")
+    print(f"  Safe entries: {len(result['safe_entries'])}")
+
+    if result["affected_entries"]:
+        print("\n  Affected repos:")
+        for entry in result["affected_entries"]:
+            risk = entry["risk_assessment"].upper()
+            prs = "".join(f" #{number}" for number in entry["pull_requests"])
+            print(
+                f"    [{risk}] {entry['repo']}: v{entry['version']} "
+                f"({entry['change_type']} on {entry['commit_date']}){prs}",
+            )
+
+
+def main() -> None:  # pylint: disable=too-many-locals,too-many-statements
     """Entry point for package focus analysis."""
     parser = argparse.ArgumentParser(
         description="Package/CVE focused supply chain analysis",
@@ -267,12 +301,22 @@ def main() -> None:
         required=True,
         help="Cache directory from collect.py",
     )
-    parser.add_argument("--package", required=True, help="Package name to investigate")
+    parser.add_argument(
+        "--package",
+        nargs="+",
+        help="Package name(s) to investigate",
+    )
+    parser.add_argument(
+        "--packages-file",
+        help="File with more package names to investigate, one per line",
+    )
     parser.add_argument(
         "--compromise-date",
         required=True,
         help="Suspected compromise date (YYYY-MM-DD)",
     )
+    parser.add_argument("--since", help="Only consider changes committed on or after this day (YYYY-MM-DD)")
+    parser.add_argument("--until", help="Only consider changes committed on or before this day (YYYY-MM-DD)")
     parser.add_argument(
         "--ecosystem",
         default="pypi",
@@ -282,72 +326,65 @@ def main() -> None:
     args = parser.parse_args()
 
     try:
-        datetime.strptime(args.compromise_date, "%Y-%m-%d").replace(tzinfo=UTC)
+        for value in (args.compromise_date, args.since, args.until):
+            if value:
+                datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=UTC)
     except ValueError:
-        print("ERROR: compromise-date must be YYYY-MM-DD", file=sys.stderr)
+        print("ERROR: compromise-date, since and until must be YYYY-MM-DD", file=sys.stderr)
         sys.exit(1)
 
-    cache_path = Path(args.cache_dir)
+    packages = _read_package_names(args.package, args.packages_file)
+    if not packages:
+        print("ERROR: Pass --package and/or --packages-file", file=sys.stderr)
+        sys.exit(1)
 
-    cache_dir = cache_path
-    if not (cache_path / "manifest.json").exists():
-        for subdir in sorted(cache_path.iterdir()):
-            if subdir.is_dir() and (subdir / "manifest.json").exists():
-                cache_dir = subdir
-                break
-        else:
-            print(
-                "ERROR: No manifest.json found. Run collect.py first.",
-                file=sys.stderr,
-            )
-            sys.exit(1)
+    cache_dir = _find_cache_dir(Path(args.cache_dir))
+    if cache_dir is None:
+        print(
+            "ERROR: No manifest.json found. Run collect.py first.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
 
     manifest = read_manifest(cache_dir)
     if not manifest:
         print("ERROR: Could not read manifest.", file=sys.stderr)
         sys.exit(1)
     print("Package Focus Analysis")
-    print(f"  Package: {args.package}")
+    print(f"  Package{'s' if len(packages) > 1 else ''}: {', '.join(packages)}")
     print(f"  Compromise date: {args.compromise_date}")
     print(f"  Audit window: {manifest['start_date']} to {manifest['end_date']}")
     print(f"  Ecosystem: {args.ecosystem}")
 
-    print(f"\nFetching release dates for '{args.package}'...")
-    if args.ecosystem == "pypi":
-        release_dates = get_pypi_release_dates(args.package)
-    else:
-        release_dates = get_npm_release_dates(args.package)
-    print(f"  Found {len(release_dates)} versions")
+    print("\nFetching release dates...")
+    fetch = get_pypi_release_dates if args.ecosystem == "pypi" else get_npm_release_dates
+    with ThreadPoolExecutor(max_workers=min(REGISTRY_MAX_WORKERS, len(packages))) as pool:
+        release_dates = dict(zip(packages, pool.map(fetch, packages), strict=True))
+    for package in packages:
+        print(f"  {package}: {len(release_dates[package])} versions")
 
-    print("\nLoading cached dependency data...")
-    deps = get_all_cached_deps(cache_dir)
-    print(f"  Total dep changes in cache: {len(deps)}")
+    print("\nLooking up packages in the dependency index...")
+    with open_cache_index(cache_dir, create=True) as index:
+        usage = index.package_usage(packages, since=args.since, until=args.until)
 
     print("\nAnalyzing impact...")
-    results = analyze_package_impact(
-        args.package,
-        args.compromise_date,
-        deps,
-        release_dates,
-    )
-
-    write_package_focus(cache_dir, results)
+    results = []
+    for package in packages:
+        package_usage = usage[package.lower()]
+        results.append(
+            analyze_package_impact(
+                package,
+                args.compromise_date,
+                package_usage.changes,
+                release_dates[package],
+                package_usage.pull_requests,
+            ),
+        )
 
-    print(f"\n{'=' * 60}")
-    print("  Results Summary")
-    print(f"{'=' * 60}")
-    print(f"  Repos using '{args.package}': {results['total_repos_using']}")
-    print(f"  Potentially exposed: {results['potentially_exposed_count']}")
-    print(f"  Affected entries: {len(results['affected_entries'])}")
-    print(f"  Safe entries: {len(results['safe_entries'])}")
+    write_package_focus(cache_dir, results[0] if len(results) == 1 else {"packages": results})
 
-    if results["affected_entries"]:
-        print("\n  Affected repos:")
-        for entry in results["affected_entries"]:
-            risk = entry["risk_assessment"].upper()
-            print(
-                f"    [{risk}] {entry['repo']}: v{entry['version']} ({entry['change_type']} on {entry['commit_date']})",
-            )
+    for package, result in zip(packages, results, strict=True):
+        _print_summary(package, result, usage[package.lower()])
 
     print(f"\n  Results written to: {cache_dir / 'package_focus.json'}")
 
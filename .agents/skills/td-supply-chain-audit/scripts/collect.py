@@ -1,4 +1,4 @@
-"""Data collection for supply chain audit via GitHub CLI.
+"""Data collection for supply chain audit via the GitHub API.
 
 Fetches commits, PRs, check suites, and dependency file diffs for all
 target repos within a specified time window. Results are cached as JSON
@@ -11,6 +11,7 @@ from __future__ import annotations
 import argparse
 import base64
 import contextlib
+import io
 import json
 import os
 import platform
@@ -20,11 +21,17 @@ import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 try:
     from audit_models import (  # pylint: disable=import-error
@@ -33,17 +40,40 @@ try:
         DepChange,
         PullRequest,
     )
+    from cache_index import CACHE_INDEX_FILE, open_cache_index  # pylint: disable=import-error
     from cache_utils import (  # pylint: disable=import-error
+        CACHE_FORMATS,
+        DEFAULT_CACHE_FORMAT,
         TARGET_REPOS,
+        contiguous_ranges,
         ensure_cache_structure,
         get_cache_dir,
+        get_objects_dir,
+        get_segments_dir,
         has_cached_data,
+        has_object,
+        iter_days,
         normalize_repo,
+        object_refs,
+        pr_object_key,
         read_cache_file,
+        read_day_segment,
+        read_object,
+        read_segment_coverage,
         repo_cache_name,
+        repo_object_kind,
+        set_cache_format,
         write_cache_file,
+        write_day_segments,
         write_manifest,
     )
+    from github_client import (  # pylint: disable=import-error
+        GitHubResponse,
+        default_client,
+        resolve_github_token,
+    )
+    from http_cache import CachedResponse, HttpCache, cached_urlopen, default_http_cache  # pylint: disable=import-error
+    from registry_client import default_registry  # pylint: disable=import-error
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parent))
     from audit_models import (
@@ -52,32 +82,62 @@ except ImportError:
         DepChange,
         PullRequest,
     )
+    from cache_index import CACHE_INDEX_FILE, open_cache_index
     from cache_utils import (
+        CACHE_FORMATS,
+        DEFAULT_CACHE_FORMAT,
         TARGET_REPOS,
+        contiguous_ranges,
         ensure_cache_structure,
         get_cache_dir,
+        get_objects_dir,
+        get_segments_dir,
         has_cached_data,
+        has_object,
+        iter_days,
         normalize_repo,
+        object_refs,
+        pr_object_key,
         read_cache_file,
+        read_day_segment,
+        read_object,
+        read_segment_coverage,
         repo_cache_name,
+        repo_object_kind,
+        set_cache_format,
         write_cache_file,
+        write_day_segments,
         write_manifest,
     )
+    from github_client import (
+        GitHubResponse,
+        default_client,
+        resolve_github_token,
+    )
+    from http_cache import CachedResponse, HttpCache, cached_urlopen, default_http_cache
+    from registry_client import default_registry
 
 
-RATE_LIMIT_SLEEP = 0.5
-RATE_LIMIT_RETRY_SLEEP_SECONDS = 60
+# Repos collected concurrently; all jobs draw on the one shared rate-limit governor.
+DEFAULT_COLLECT_JOBS = 1
 PER_PAGE = 100
+GRAPHQL_COMMIT_BATCH_SIZE = 100
+GRAPHQL_ASSOCIATED_PRS_LIMIT = 10
+GRAPHQL_CHECK_SUITES_LIMIT = 30
 GH_API_TIMEOUT_SECONDS = 120
 GH_VERSION_TIMEOUT_SECONDS = 10
-REGISTRY_REQUEST_TIMEOUT_SECONDS = 10
+REGISTRY_MAX_WORKERS = 8
+# Commits whose diffs are fetched at once when looking for dependency changes.
+COMMIT_FILES_MAX_WORKERS = 8
 OSV_REQUEST_TIMEOUT_SECONDS = 30
 OSV_BATCH_SIZE = 1000
-OSV_BATCH_SLEEP_SECONDS = 1
+OSV_MAX_WORKERS = 4
 SCORECARD_REQUEST_TIMEOUT_SECONDS = 20
 SCORECARD_CLI_TIMEOUT_SECONDS = 300
 SCORECARD_CLI_DOWNLOAD_TIMEOUT_SECONDS = 120
 SCORECARD_CLI_BIN = "scorecard"
+# Serializes the one-time CLI bootstrap when repos are collected concurrently.
+_SCORECARD_CLI_LOCK = threading.Lock()
 # Pinned release used when auto-bootstrapping the CLI (linux/mac).
 SCORECARD_CLI_VERSION = "v5.5.0"
 # Full Scorecard suite minus Vulnerabilities. That check walks OSV for the
@@ -163,36 +223,85 @@ DEP_FILE_PATTERNS = re.compile(
 )
 
 
-def _gh_api_on_failure(
-    endpoint: str,
-    result: subprocess.CompletedProcess[str],
-    *,
-    paginate: bool,
-) -> list | dict | None:
-    """Handle a non-zero ``gh api`` exit: retry rate limits, else return None."""
-    stderr_lower = result.stderr.lower()
+class _WorkerOutput(io.TextIOBase):
+    """Stdout proxy that buffers each worker's output until its repo finishes.
+
+    Keeps per-repo progress blocks contiguous when several repos are
+    collected concurrently.
+    """
+
+    def __init__(self, stream: io.TextIOBase) -> None:
+        """Wrap ``stream``; writes outside :meth:`capture` pass straight through.
+
+        Args:
+            stream: Underlying output stream.
+
+        """
+        self._stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def writable(self) -> bool:
+        """Report that the proxy accepts writes."""
+        return True
+
+    def write(self, text: str) -> int:
+        """Write to the current worker's buffer, or to the wrapped stream."""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            return buffer.write(text)
+        with self._lock:
+            return self._stream.write(text)
+
+    def flush(self) -> None:
+        """Flush the wrapped stream."""
+        with self._lock:
+            self._stream.flush()
+
+    @contextlib.contextmanager
+    def capture(self) -> Iterator[None]:
+        """Buffer output written by the current thread and emit it on exit."""
+        self._local.buffer = io.StringIO()
+        try:
+            yield
+        finally:
+            text = self._local.buffer.getvalue()
+            self._local.buffer = None
+            with self._lock:
+                self._stream.write(text)
+                self._stream.flush()
+
+
+def _gh_api_on_failure(endpoint: str, response: GitHubResponse) -> None:
+    """Report a failed GitHub API call.
+
+    Rate limits are already waited out and retried by the client's
+    governor, so anything reaching here is final.
+    """
+    if response.status == 0:
+        print(f"  {response.error.upper()}: {endpoint}", file=sys.stderr)
+        return
+    error_lower = response.error.lower()
     # Auth / SAML / permission failures are not rate limits — fail fast.
-    if "saml" in stderr_lower or "sso" in stderr_lower:
+    if "saml" in error_lower or "sso" in error_lower:
         print(
             f"  ACCESS DENIED (SAML/SSO): {endpoint} — authorize the org token via gh auth refresh / SSO grant",
             file=sys.stderr,
         )
-    elif "rate limit" in stderr_lower or "secondary rate limit" in stderr_lower:
-        print("  Rate limited, sleeping 60s...", file=sys.stderr)
-        time.sleep(RATE_LIMIT_RETRY_SLEEP_SECONDS)
-        return gh_api(endpoint, paginate=paginate)
-    elif "404" in result.stderr or "Not Found" in result.stderr:
+    elif "rate limit" in error_lower:
+        # The client already waited and retried; give up on this endpoint.
+        print(f"  RATE LIMITED: {endpoint}: {response.error[:200]}", file=sys.stderr)
+    elif response.status == 404:  # noqa: PLR2004
         pass
-    elif "403" in result.stderr or "forbidden" in stderr_lower:
+    elif response.status == 403:  # noqa: PLR2004
         # Generic 403 (e.g. private repo without access) — do not retry forever.
-        print(f"  FORBIDDEN: {endpoint}: {result.stderr[:200]}", file=sys.stderr)
+        print(f"  FORBIDDEN: {endpoint}: {response.error[:200]}", file=sys.stderr)
     else:
-        print(f"  ERROR ({result.returncode}): {result.stderr[:200]}", file=sys.stderr)
-    return None
+        print(f"  ERROR ({response.status}): {response.error[:200]}", file=sys.stderr)
 
 
 def gh_api(endpoint: str, *, paginate: bool = False) -> list | dict | None:
-    """Call GitHub API via gh CLI.
+    """Call the GitHub API through the shared pooled client.
 
     Args:
         endpoint: API endpoint path.
@@ -202,29 +311,29 @@ def gh_api(endpoint: str, *, paginate: bool = False) -> list | dict | None:
         Parsed JSON, or ``None`` on error.
 
     """
-    cmd = ["gh", "api", endpoint, "--header", "Accept: application/vnd.github+json"]
-    if paginate:
-        cmd.append("--paginate")
-
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=GH_API_TIMEOUT_SECONDS,
-            check=False,
-        )
-    except subprocess.TimeoutExpired:
-        print(f"  TIMEOUT: {endpoint}", file=sys.stderr)
+    response = default_client().fetch(endpoint, paginate=paginate, timeout=GH_API_TIMEOUT_SECONDS)
+    if not response.ok:
+        _gh_api_on_failure(endpoint, response)
         return None
+    return response.data  # type: ignore[no-any-return]
 
-    if result.returncode != 0:
-        return _gh_api_on_failure(endpoint, result, paginate=paginate)
 
-    try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
+def gh_graphql(query: str, variables: dict) -> dict | None:
+    """Run a GraphQL query through the shared pooled client.
+
+    Args:
+        query: GraphQL query document.
+        variables: Query variables.
+
+    Returns:
+        GraphQL ``data`` object, or ``None`` on error.
+
+    """
+    response = default_client().graphql(query, variables, timeout=GH_API_TIMEOUT_SECONDS)
+    if not response.ok:
+        print(f"  GraphQL ERROR ({response.status}): {response.error[:200]}", file=sys.stderr)
         return None
+    return response.data  # type: ignore[no-any-return]
 
 
 def get_gh_version() -> str:
@@ -247,8 +356,8 @@ def get_gh_version() -> str:
         return "unknown"
 
 
-def collect_commits(repo: str, start_date: str, end_date: str) -> list[dict]:
-    """Fetch all commits for a repo in the time window.
+def collect_commits(repo: str, start_date: str, end_date: str) -> list[dict] | None:
+    """Fetch all commits for a repo committed in the time window.
 
     Args:
         repo: Repository name.
@@ -256,13 +365,13 @@ def collect_commits(repo: str, start_date: str, end_date: str) -> list[dict]:
         end_date: Audit window end (YYYY-MM-DD).
 
     Returns:
-        Serialized commit dicts.
+        Serialized commit dicts, or ``None`` if the listing failed.
 
     """
     endpoint = f"repos/{repo}/commits?since={start_date}T00:00:00Z&until={end_date}T23:59:59Z&per_page={PER_PAGE}"
     data = gh_api(endpoint, paginate=True)
-    if not data or not isinstance(data, list):
-        return []
+    if not isinstance(data, list):
+        return None
 
     commits = []
     for item in data:
@@ -272,50 +381,200 @@ def collect_commits(repo: str, start_date: str, end_date: str) -> list[dict]:
     return commits
 
 
-def collect_prs_for_commits(repo: str, commits: list[dict]) -> list[dict]:
-    """Fetch associated PRs for each commit and PR details.
+_ASSOCIATED_PRS_FRAGMENT = """
+... on Commit {
+  associatedPullRequests(first: %d) {
+    nodes {
+      number
+      title
+      state
+      merged
+      mergedAt
+      updatedAt
+      url
+      baseRefName
+      headRefName
+      mergeCommit { oid }
+      author { __typename login }
+    }
+  }
+}
+"""
+
+
+def _build_commit_batch_query(batch_size: int, fragment: str) -> str:
+    """Build a GraphQL query selecting ``fragment`` on aliased commit objects.
+
+    Args:
+        batch_size: Number of ``$cN`` commit-oid variables in the query.
+        fragment: Inline fragment applied to each commit object.
+
+    Returns:
+        GraphQL query document.
+
+    """
+    var_decls = ", ".join(f"$c{i}: GitObjectID!" for i in range(batch_size))
+    fields = "\n".join(f"c{i}: object(oid: $c{i}) {{{fragment}}}" for i in range(batch_size))
+    return (
+        f"query($owner: String!, $name: String!, {var_decls}) {{\n"
+        f"repository(owner: $owner, name: $name) {{\n{fields}\n}}\n}}"
+    )
+
+
+def _graphql_commit_batch(repo: str, shas: list[str], fragment: str) -> dict[str, dict] | None:
+    """Fetch ``fragment`` for a batch of commits with one GraphQL query.
+
+    Args:
+        repo: Repository name (org/repo).
+        shas: Commit SHAs, at most ``GRAPHQL_COMMIT_BATCH_SIZE``.
+        fragment: Inline fragment applied to each commit object.
+
+    Returns:
+        Mapping of SHA to the commit object (empty if not found), or
+        ``None`` if the query failed.
+
+    """
+    owner, name = repo.split("/", 1)
+    variables: dict[str, str] = {"owner": owner, "name": name}
+    variables.update({f"c{i}": sha for i, sha in enumerate(shas)})
+    data = gh_graphql(_build_commit_batch_query(len(shas), fragment), variables)
+    repository = (data or {}).get("repository")
+    if not isinstance(repository, dict):
+        return None
+    return {sha: repository.get(f"c{i}") or {} for i, sha in enumerate(shas)}
+
+
+def _graphql_pr_to_rest(node: dict) -> dict:
+    """Reshape a GraphQL ``PullRequest`` node into the REST fields ``PullRequest.from_api`` reads.
+
+    Args:
+        node: GraphQL pull request node.
+
+    Returns:
+        REST-shaped pull request dict.
+
+    """
+    author = node.get("author") or {}
+    login = author.get("login", "unknown")
+    # REST reports bot accounts as ``name[bot]``; GraphQL drops the suffix.
+    if author.get("__typename") == "Bot" and not login.endswith("[bot]"):
+        login = f"{login}[bot]"
+    merge_commit = node.get("mergeCommit") or {}
+    return {
+        "number": node.get("number", 0),
+        "title": node.get("title", ""),
+        "state": "open" if node.get("state") == "OPEN" else "closed",
+        "merged": node.get("merged", False),
+        "merged_at": node.get("mergedAt"),
+        "updated_at": node.get("updatedAt"),
+        "merge_commit_sha": merge_commit.get("oid"),
+        "user": {"login": login},
+        "base": {"ref": node.get("baseRefName", "")},
+        "head": {"ref": node.get("headRefName", "")},
+        "html_url": node.get("url", ""),
+    }
+
+
+def _fetch_commit_prs_graphql(repo: str, shas: list[str]) -> dict[str, list[dict]] | None:
+    """Resolve associated PRs for a batch of commits with one GraphQL query.
+
+    Args:
+        repo: Repository name (org/repo).
+        shas: Commit SHAs, at most ``GRAPHQL_COMMIT_BATCH_SIZE``.
+
+    Returns:
+        Mapping of SHA to REST-shaped PR dicts, or ``None`` if the query failed.
+
+    """
+    objects = _graphql_commit_batch(repo, shas, _ASSOCIATED_PRS_FRAGMENT % GRAPHQL_ASSOCIATED_PRS_LIMIT)
+    if objects is None:
+        return None
+    return {
+        sha: [
+            _graphql_pr_to_rest(node) for node in (obj.get("associatedPullRequests") or {}).get("nodes") or [] if node
+        ]
+        for sha, obj in objects.items()
+    }
+
+
+def _fetch_commit_prs_rest(repo: str, sha: str, prs_seen: set[int]) -> list[dict] | None:
+    """Resolve associated PRs for one commit via REST (GraphQL fallback).
+
+    PR details are only fetched for PR numbers not yet in ``prs_seen``;
+    already-seen PRs are returned as ``{"number": n}`` stubs.
+
+    Args:
+        repo: Repository name.
+        sha: Commit SHA.
+        prs_seen: PR numbers whose details were already collected.
+
+    Returns:
+        REST PR dicts associated with the commit, or ``None`` if the commit's
+        PRs or the details of one of them could not be fetched.
+
+    """
+    pr_list = gh_api(f"repos/{repo}/commits/{sha}/pulls")
+    if not isinstance(pr_list, list):
+        return None
+
+    results = []
+    for pr_data in pr_list:
+        pr_num = pr_data.get("number", 0)
+        if pr_num in prs_seen:
+            results.append({"number": pr_num})
+            continue
+        pr_detail = gh_api(f"repos/{repo}/pulls/{pr_num}")
+        if not isinstance(pr_detail, dict):
+            return None
+        results.append(pr_detail)
+    return results
+
+
+def collect_prs_for_commits(repo: str, commits: list[dict]) -> tuple[list[dict], bool]:
+    """Fetch associated PRs and PR details for every commit.
+
+    Commits are resolved in batches of ``GRAPHQL_COMMIT_BATCH_SIZE`` with one
+    GraphQL query each, which returns the PR fields directly. A batch whose
+    query fails falls back to the per-commit REST endpoints.
 
     Args:
         repo: Repository name.
         commits: Commit dicts (mutated in place to add ``associated_prs``).
 
     Returns:
-        Serialized PR dicts.
+        Serialized PR dicts, and whether every commit was resolved (``False``
+        if a REST fallback failed for any of them).
 
     """
     prs_seen: set[int] = set()
     prs: list[dict] = []
+    complete = True
+
+    for offset in range(0, len(commits), GRAPHQL_COMMIT_BATCH_SIZE):
+        batch = commits[offset : offset + GRAPHQL_COMMIT_BATCH_SIZE]
+        by_sha = _fetch_commit_prs_graphql(repo, [c["sha"] for c in batch])
+        if by_sha is None:
+            print(f"  GraphQL batch failed for {repo}, falling back to REST", file=sys.stderr)
+
+        for commit_data in batch:
+            sha = commit_data["sha"]
+            pr_list = by_sha[sha] if by_sha is not None else _fetch_commit_prs_rest(repo, sha, prs_seen)
+            if pr_list is None:
+                complete = False
+                continue
 
-    for commit_data in commits:
-        sha = commit_data["sha"]
-        endpoint = f"repos/{repo}/commits/{sha}/pulls"
-        pr_list = gh_api(endpoint)
-        time.sleep(RATE_LIMIT_SLEEP)
-
-        if not pr_list or not isinstance(pr_list, list):
-            continue
+            for pr_data in pr_list:
+                pr_num = pr_data.get("number", 0)
+                if pr_num not in prs_seen:
+                    prs_seen.add(pr_num)
+                    if "merged" in pr_data:
+                        prs.append(PullRequest.from_api(pr_data, repo).to_dict())
 
-        for pr_data in pr_list:
-            pr_num = pr_data.get("number", 0)
-            if pr_num in prs_seen:
                 commit_data.setdefault("associated_prs", [])
                 if pr_num not in commit_data["associated_prs"]:
                     commit_data["associated_prs"].append(pr_num)
-                continue
-
-            prs_seen.add(pr_num)
-            pr_detail = gh_api(f"repos/{repo}/pulls/{pr_num}")
-            time.sleep(RATE_LIMIT_SLEEP)
-
-            if pr_detail and isinstance(pr_detail, dict):
-                pr = PullRequest.from_api(pr_detail, repo)
-                prs.append(pr.to_dict())
-
-            commit_data.setdefault("associated_prs", [])
-            if pr_num not in commit_data["associated_prs"]:
-                commit_data["associated_prs"].append(pr_num)
 
-    return prs
+    return prs, complete
 
 
 def collect_pr_commits_and_reviews(repo: str, prs: list[dict]) -> list[dict]:
@@ -345,7 +604,6 @@ def collect_pr_commits_and_reviews(repo: str, prs: list[dict]) -> list[dict]:
         # Get all commits on the PR branch
         commits_endpoint = f"repos/{repo}/pulls/{pr_num}/commits?per_page=100"
         pr_commits = gh_api(commits_endpoint)
-        time.sleep(RATE_LIMIT_SLEEP)
 
         if not pr_commits or not isinstance(pr_commits, list):
             pr_commits = []
@@ -353,7 +611,6 @@ def collect_pr_commits_and_reviews(repo: str, prs: list[dict]) -> list[dict]:
         # Get reviews (approvals)
         reviews_endpoint = f"repos/{repo}/pulls/{pr_num}/reviews"
         reviews = gh_api(reviews_endpoint)
-        time.sleep(RATE_LIMIT_SLEEP)
 
         if not reviews or not isinstance(reviews, list):
             reviews = []
@@ -390,6 +647,7 @@ def collect_pr_commits_and_reviews(repo: str, prs: list[dict]) -> list[dict]:
                 "pr_title": pr.get("title", ""),
                 "pr_author": pr.get("author_login", ""),
                 "merged_at": pr.get("merged_at", ""),
+                "pr_updated_at": pr.get("updated_at"),
                 "commits": commit_entries,
                 "approvals": approvals,
                 "commit_count": len(commit_entries),
@@ -399,32 +657,92 @@ def collect_pr_commits_and_reviews(repo: str, prs: list[dict]) -> list[dict]:
     return pr_audit_data
 
 
+_CHECK_SUITES_FRAGMENT = """
+... on Commit {
+  checkSuites(first: %d) {
+    nodes {
+      databaseId
+      status
+      conclusion
+      app { name }
+    }
+  }
+}
+"""
+
+
+def _graphql_suite_to_rest(node: dict, repo: str) -> dict:
+    """Reshape a GraphQL ``CheckSuite`` node into the REST fields ``CheckSuite.from_api`` reads.
+
+    Args:
+        node: GraphQL check suite node.
+        repo: Repository name (org/repo).
+
+    Returns:
+        REST-shaped check suite dict.
+
+    """
+    conclusion = node.get("conclusion")
+    suite_id = node.get("databaseId")
+    return {
+        "status": (node.get("status") or "").lower(),
+        "conclusion": conclusion.lower() if conclusion else None,
+        "app": node.get("app") or {},
+        "url": f"https://api.github.com/repos/{repo}/check-suites/{suite_id}" if suite_id else "",
+    }
+
+
+def _fetch_check_suites_rest(repo: str, sha: str) -> list[dict] | None:
+    """Fetch check suites for one commit via REST (GraphQL fallback).
+
+    Args:
+        repo: Repository name.
+        sha: Commit SHA.
+
+    Returns:
+        REST check suite dicts, or ``None`` if the request failed.
+
+    """
+    data = gh_api(f"repos/{repo}/commits/{sha}/check-suites")
+    if isinstance(data, dict):
+        return data.get("check_suites", [])
+    return None
+
+
 def collect_check_suites(repo: str, commits: list[dict]) -> dict[str, list[dict]]:
     """Fetch check suites for each commit.
 
+    Commits are resolved in batches of ``GRAPHQL_COMMIT_BATCH_SIZE`` with one
+    GraphQL query each. A batch whose query fails falls back to the
+    per-commit REST endpoint.
+
     Args:
         repo: Repository name.
         commits: Commit dicts.
 
     Returns:
-        Check suites keyed by commit SHA.
+        Check suites keyed by commit SHA; commits whose REST fallback failed
+        are absent.
 
     """
     checks_by_sha: dict[str, list[dict]] = {}
-
-    for commit_data in commits:
-        sha = commit_data["sha"]
-        endpoint = f"repos/{repo}/commits/{sha}/check-suites"
-        data = gh_api(endpoint)
-        time.sleep(RATE_LIMIT_SLEEP)
-
-        suites = []
-        if data and isinstance(data, dict):
-            for suite in data.get("check_suites", []):
-                cs = CheckSuite.from_api(suite, repo, sha)
-                suites.append(cs.to_dict())
-
-        checks_by_sha[sha] = suites
+    fragment = _CHECK_SUITES_FRAGMENT % GRAPHQL_CHECK_SUITES_LIMIT
+
+    for offset in range(0, len(commits), GRAPHQL_COMMIT_BATCH_SIZE):
+        shas = [c["sha"] for c in commits[offset : offset + GRAPHQL_COMMIT_BATCH_SIZE]]
+        objects = _graphql_commit_batch(repo, shas, fragment)
+        if objects is None:
+            print(f"  GraphQL batch failed for {repo}, falling back to REST", file=sys.stderr)
+
+        for sha in shas:
+            if objects is not None:
+                nodes = (objects[sha].get("checkSuites") or {}).get("nodes") or []
+                raw_suites = [_graphql_suite_to_rest(node, repo) for node in nodes if node]
+            else:
+                raw_suites = _fetch_check_suites_rest(repo, sha)
+                if raw_suites is None:
+                    continue
+            checks_by_sha[sha] = [CheckSuite.from_api(suite, repo, sha).to_dict() for suite in raw_suites]
 
     return checks_by_sha
 
@@ -489,9 +807,7 @@ def _fetch_shared_renovate_config(extends: list) -> tuple[dict, str | None]:
         if ext_data and isinstance(ext_data, dict):
             shared = _decode_github_file_content(ext_data)
             if shared:
-                time.sleep(RATE_LIMIT_SLEEP)
                 return shared, f"shared:{ext}"
-        time.sleep(RATE_LIMIT_SLEEP)
     return {}, None
 
 
@@ -596,40 +912,27 @@ def _parse_release_age(age_str: str | int | None) -> int | None:
     return value
 
 
-def collect_dep_changes(
-    repo: str,
-    _start_date: str,
-    end_date: str,
-    commits: list[dict],
-) -> list[dict]:
-    """Identify dependency file changes by examining commits that touch dep files.
+def _commit_dep_changes(repo: str, commit: dict, end_date: str) -> list[dict] | None:
+    """Extract the dependency changes made by one commit.
 
     Args:
         repo: Repository name.
-        _start_date: Audit window start (unused, kept for API consistency).
-        end_date: Audit window end (YYYY-MM-DD).
-        commits: Commit dicts for this repo.
+        commit: Commit dict.
+        end_date: Audit window end, the fallback date (YYYY-MM-DD).
 
     Returns:
-        Deduplicated and enriched dependency change dicts.
+        Deduplicated dependency change dicts, or ``None`` if the commit's
+        files could not be fetched.
 
     """
-    if not commits:
-        return []
-
-    first_sha = commits[-1]["sha"]
-    last_sha = commits[0]["sha"]
-
-    endpoint = f"repos/{repo}/compare/{first_sha}...{last_sha}"
-    data = gh_api(endpoint)
-
-    if not data or not isinstance(data, dict):
-        return []
+    data = gh_api(f"repos/{repo}/commits/{commit['sha']}", paginate=True)
+    if not isinstance(data, dict):
+        return None
 
+    # The committer date is when the change landed on main.
+    commit_date = (commit.get("committed_date") or commit.get("date") or end_date)[:10]
     dep_changes: list[dict] = []
-    files = data.get("files", [])
-
-    for file_info in files:
+    for file_info in data.get("files", []):
         filename = file_info.get("filename", "")
         basename = filename.split("/")[-1] if "/" in filename else filename
 
@@ -647,21 +950,77 @@ def collect_dep_changes(
             "yarn.lock",
             "pnpm-lock.yaml",
         }
-
-        # Use the latest commit date as the adoption date (when dep landed on main)
-        latest_commit_date = commits[0].get("date", end_date)[:10]
-        changes = parse_dep_patch(
-            patch,
-            filename,
-            repo,
-            ecosystem,
-            is_direct=is_direct,
-            commit_sha=last_sha,
-            commit_date=latest_commit_date,
+        dep_changes.extend(
+            parse_dep_patch(
+                patch,
+                filename,
+                repo,
+                ecosystem,
+                is_direct=is_direct,
+                commit_sha=commit["sha"],
+                commit_date=commit_date,
+            ),
         )
-        dep_changes.extend(changes)
+    return _dedupe_dep_changes(dep_changes)
+
+
+def collect_dep_changes(
+    repo: str,
+    _start_date: str,
+    end_date: str,
+    commits: list[dict],
+) -> list[dict] | None:
+    """Identify dependency file changes made by each commit.
+
+    Every commit's own diff is examined, so each change carries the SHA and
+    date of the commit that made it and can be filed under that commit's day.
 
-    # Deduplicate: prefer direct dep files (package.json) over lock files
+    Args:
+        repo: Repository name.
+        _start_date: Audit window start (unused, kept for API consistency).
+        end_date: Audit window end (YYYY-MM-DD).
+        commits: Commit dicts for this repo, newest first.
+
+    Returns:
+        Enriched dependency change dicts, newest commit first, or ``None``
+        if any commit's files could not be fetched.
+
+    """
+    if not commits:
+        return []
+
+    with ThreadPoolExecutor(
+        max_workers=min(COMMIT_FILES_MAX_WORKERS, len(commits)),
+        thread_name_prefix="commit-files",
+    ) as pool:
+        per_commit = list(pool.map(lambda commit: _commit_dep_changes(repo, commit, end_date), commits))
+    if any(changes is None for changes in per_commit):
+        return None
+
+    dep_changes = [change for changes in per_commit for change in changes or []]
+    if dep_changes:
+        with ThreadPoolExecutor(
+            max_workers=min(REGISTRY_MAX_WORKERS, len(dep_changes)),
+            thread_name_prefix="registry",
+        ) as pool:
+            list(pool.map(enrich_dep_release_info, dep_changes))
+
+    return dep_changes
+
+
+def _dedupe_dep_changes(dep_changes: list[dict]) -> list[dict]:
+    """Keep one change per package version, preferring direct dep files over lock files.
+
+    Applied per commit, where a dependency file and its lock file record the
+    same change.
+
+    Args:
+        dep_changes: Dependency change dicts.
+
+    Returns:
+        Deduplicated changes in first-seen order.
+
+    """
     seen: dict[tuple[str, str, str], dict] = {}
     for dep in dep_changes:
         key = (
@@ -675,13 +1034,7 @@ def collect_dep_changes(
                 seen[key] = dep
         else:
             seen[key] = dep
-
-    deduped = list(seen.values())
-    for dep in deduped:
-        enrich_dep_release_info(dep)
-        time.sleep(RATE_LIMIT_SLEEP)
-
-    return deduped
+    return list(seen.values())
 
 
 def parse_dep_patch(
@@ -921,7 +1274,7 @@ def _parse_python_patch(patch: str) -> tuple[dict[str, str], dict[str, str]]:
 
 
 def enrich_dep_release_info(dep: dict) -> None:
-    """Query PyPI or npm for release date of a dependency version.
+    """Fill release date and yanked status of a dependency version from its registry.
 
     Args:
         dep: Dependency change dict (mutated in place).
@@ -930,49 +1283,11 @@ def enrich_dep_release_info(dep: dict) -> None:
     if dep.get("new_version") is None:
         return
 
-    pkg = dep["package_name"]
     version = dep["new_version"]
-    ecosystem = dep["ecosystem"]
-
-    try:
-        if ecosystem == "pypi":
-            url = f"https://pypi.org/pypi/{pkg}/{version}/json"
-            req = urllib.request.Request(  # noqa: S310
-                url,
-                headers={"User-Agent": "supply-chain-audit/1.0"},
-            )
-            with urllib.request.urlopen(  # noqa: S310
-                req,
-                timeout=REGISTRY_REQUEST_TIMEOUT_SECONDS,
-            ) as resp:
-                data = json.loads(resp.read())
-                urls = data.get("urls", [])
-                if urls:
-                    upload_time = urls[0].get("upload_time_iso_8601", "")
-                    dep["release_date"] = upload_time[:10] if upload_time else None
-                info = data.get("info", {})
-                if info.get("yanked"):
-                    dep["yanked"] = True
-        elif ecosystem == "npm":
-            url = f"https://registry.npmjs.org/{pkg}"
-            req = urllib.request.Request(  # noqa: S310
-                url,
-                headers={"User-Agent": "supply-chain-audit/1.0"},
-            )
-            with urllib.request.urlopen(  # noqa: S310
-                req,
-                timeout=REGISTRY_REQUEST_TIMEOUT_SECONDS,
-            ) as resp:
-                data = json.loads(resp.read())
-                time_map = data.get("time", {})
-                publish_time = time_map.get(version, "")
-                dep["release_date"] = publish_time[:10] if publish_time else None
-                versions = data.get("versions", {})
-                ver_data = versions.get(version, {})
-                if ver_data.get("deprecated"):
-                    dep["yanked"] = True
-    except (urllib.error.URLError, json.JSONDecodeError, TimeoutError, OSError):
-        dep["release_date"] = None
+    info = default_registry().release_info(dep["ecosystem"], dep["package_name"])
+    dep["release_date"] = info.release_dates.get(version) if info else None
+    if info and version in info.yanked:
+        dep["yanked"] = True
 
     if dep.get("release_date") and dep.get("commit_date"):
         try:
@@ -1010,7 +1325,6 @@ def collect_package_inventory(repo: str) -> list[dict]:
             except (ValueError, UnicodeDecodeError):
                 pass
             break
-        time.sleep(RATE_LIMIT_SLEEP)
 
     npm_pkgs = _collect_npm_inventory(repo)
     packages.extend(npm_pkgs)
@@ -1035,7 +1349,6 @@ def _collect_npm_inventory(repo: str) -> list[dict]:
                     continue
                 parser = _parse_pnpm_lock_inventory if lock_file == "pnpm-lock.yaml" else _parse_package_lock_inventory
                 return [{"name": p[0], "version": p[1], "ecosystem": "npm"} for p in parser(content)]
-            time.sleep(RATE_LIMIT_SLEEP)
 
     endpoint = f"repos/{repo}/contents/package.json"
     data = gh_api(endpoint)
@@ -1130,81 +1443,147 @@ def _parse_toml_lock_inventory(content: str, _filename: str) -> list[tuple[str,
     return packages
 
 
-def scan_osv_batch(packages: list[dict]) -> list[dict]:
-    """Query OSV.dev batch endpoint for known vulnerabilities.
+def _osv_triple(pkg: dict) -> tuple[str, str, str]:
+    """Identity of an inventory entry for OSV: ``(ecosystem, name, version)``."""
+    return (pkg["ecosystem"], pkg["name"], pkg["version"])
 
-    Sends up to 100 packages per request.
+
+def _osv_cache_key(triple: tuple[str, str, str]) -> tuple[str, str]:
+    """Cache key and pseudo-URL for one package version's OSV result.
+
+    The URL lives under ``api.osv.dev`` so the response cache applies its OSV TTL.
+    """
+    ecosystem, name, version = triple
+    url = f"https://api.osv.dev/v1/query#{ecosystem}/{name}@{version}"
+    return HttpCache.key("OSV", url), url
+
+
+def _query_osv_batch(triples: list[tuple[str, str, str]]) -> dict[tuple[str, str, str], list[dict]] | None:
+    """Send one OSV ``querybatch`` request.
 
     Args:
-        packages: List of ``{name, version, ecosystem}`` dicts.
+        triples: Up to ``OSV_BATCH_SIZE`` package versions.
 
     Returns:
-        Entries with known vulnerabilities.
+        Summarised vulnerabilities per triple, or ``None`` if the request failed.
 
     """
-    results = []
+    queries = [{"version": version, "package": {"name": name, "ecosystem": eco}} for eco, name, version in triples]
+    req = urllib.request.Request(
+        "https://api.osv.dev/v1/querybatch",
+        data=json.dumps({"queries": queries}).encode("utf-8"),
+        headers={
+            "Content-Type": "application/json",
+            "User-Agent": "supply-chain-audit/1.0",
+        },
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(  # noqa: S310
+            req,
+            timeout=OSV_REQUEST_TIMEOUT_SECONDS,
+        ) as resp:
+            data = json.loads(resp.read())
+    except (
+        urllib.error.URLError,
+        json.JSONDecodeError,
+        TimeoutError,
+        OSError,
+    ) as exc:
+        print(f"    OSV batch query failed: {exc}")
+        return None
 
-    for i in range(0, len(packages), OSV_BATCH_SIZE):
-        batch = packages[i : i + OSV_BATCH_SIZE]
-        queries = [
+    results: dict[tuple[str, str, str], list[dict]] = {}
+    for triple, result in zip(triples, data.get("results", []), strict=False):
+        results[triple] = [
             {
-                "version": pkg["version"],
-                "package": {"name": pkg["name"], "ecosystem": pkg["ecosystem"]},
+                "id": v.get("id", ""),
+                "summary": v.get("summary", "")[:120],
+                "severity": _extract_osv_severity(v),
+                "aliases": v.get("aliases", [])[:3],
             }
-            for pkg in batch
+            for v in result.get("vulns", [])
         ]
+    return results
 
-        payload = json.dumps({"queries": queries}).encode("utf-8")
-        req = urllib.request.Request(
-            "https://api.osv.dev/v1/querybatch",
-            data=payload,
-            headers={
-                "Content-Type": "application/json",
-                "User-Agent": "supply-chain-audit/1.0",
-            },
-            method="POST",
-        )
 
-        try:
-            with urllib.request.urlopen(  # noqa: S310
-                req,
-                timeout=OSV_REQUEST_TIMEOUT_SECONDS,
-            ) as resp:
-                data = json.loads(resp.read())
-                batch_results = data.get("results", [])
-                for j, result in enumerate(batch_results):
-                    vulns = result.get("vulns", [])
-                    if vulns:
-                        pkg = batch[j]
-                        results.append(
-                            {
-                                "name": pkg["name"],
-                                "version": pkg["version"],
-                                "ecosystem": pkg["ecosystem"],
-                                "vulns": [
-                                    {
-                                        "id": v.get("id", ""),
-                                        "summary": v.get("summary", "")[:120],
-                                        "severity": _extract_osv_severity(v),
-                                        "aliases": v.get("aliases", [])[:3],
-                                    }
-                                    for v in vulns
-                                ],
-                            },
-                        )
-        except (
-            urllib.error.URLError,
-            json.JSONDecodeError,
-            TimeoutError,
-            OSError,
-        ) as exc:
-            print(f"    OSV batch query failed: {exc}")
-
-        time.sleep(OSV_BATCH_SLEEP_SECONDS)
+def query_osv_vulns(triples: set[tuple[str, str, str]]) -> dict[tuple[str, str, str], list[dict]]:
+    """Look up vulnerabilities for unique package versions.
+
+    Results cached within the OSV TTL of the shared response cache are reused;
+    the rest are split into ``OSV_BATCH_SIZE`` batches sent concurrently.
+    Successful lookups (including "no vulnerabilities") are cached per triple.
+
+    Args:
+        triples: Unique ``(ecosystem, name, version)`` entries.
+
+    Returns:
+        Vulnerabilities per triple; triples whose batch failed are absent.
+
+    """
+    http_cache = default_http_cache()
+    results: dict[tuple[str, str, str], list[dict]] = {}
+    pending: list[tuple[str, str, str]] = []
+    for triple in sorted(triples):
+        entry = http_cache.get(_osv_cache_key(triple)[0]) if http_cache else None
+        if entry is not None and http_cache is not None and http_cache.is_fresh(entry):
+            results[triple] = json.loads(entry.body)
+        else:
+            pending.append(triple)
 
+    batches = [pending[i : i + OSV_BATCH_SIZE] for i in range(0, len(pending), OSV_BATCH_SIZE)]
+    if batches:
+        with ThreadPoolExecutor(max_workers=min(OSV_MAX_WORKERS, len(batches)), thread_name_prefix="osv") as pool:
+            for batch_results in pool.map(_query_osv_batch, batches):
+                if batch_results is None:
+                    continue
+                results.update(batch_results)
+                if http_cache is None:
+                    continue
+                now = time.time()
+                for triple, vulns in batch_results.items():
+                    key, url = _osv_cache_key(triple)
+                    http_cache.put(key, CachedResponse(url=url, status=200, body=json.dumps(vulns), stored_at=now))
+    print(f"  OSV: {len(triples)} unique package versions, {len(triples) - len(pending)} from cache")
     return results
 
 
+def _osv_results_for(packages: list[dict], vulns_by_triple: dict[tuple[str, str, str], list[dict]]) -> list[dict]:
+    """Build per-repo OSV scan results from fleet-level lookups.
+
+    Args:
+        packages: Inventory entries of one repo.
+        vulns_by_triple: Output of :func:`query_osv_vulns`.
+
+    Returns:
+        Entries with known vulnerabilities.
+
+    """
+    return [
+        {
+            "name": pkg["name"],
+            "version": pkg["version"],
+            "ecosystem": pkg["ecosystem"],
+            "vulns": vulns_by_triple[_osv_triple(pkg)],
+        }
+        for pkg in packages
+        if vulns_by_triple.get(_osv_triple(pkg))
+    ]
+
+
+def scan_osv_batch(packages: list[dict]) -> list[dict]:
+    """Query OSV.dev for known vulnerabilities in a list of packages.
+
+    Args:
+        packages: List of ``{name, version, ecosystem}`` dicts.
+
+    Returns:
+        Entries with known vulnerabilities.
+
+    """
+    return _osv_results_for(packages, query_osv_vulns({_osv_triple(pkg) for pkg in packages}))
+
+
 def _extract_osv_severity(vuln: dict) -> str:
     """Extract severity from OSV vulnerability entry.
 
@@ -1308,7 +1687,6 @@ def _collect_ruleset_required_checks(repo: str) -> list[str]:
         if not rs_id:
             continue
         detail = gh_api(f"repos/{repo}/rulesets/{rs_id}")
-        time.sleep(RATE_LIMIT_SLEEP)
         if not detail or not isinstance(detail, dict):
             continue
         for rule in detail.get("rules", []):
@@ -1570,11 +1948,7 @@ def _fetch_openssf_scorecard(repo: str) -> dict:
             api_url,
             headers={"User-Agent": "supply-chain-audit/1.0", "Accept": "application/json"},
         )
-        with urllib.request.urlopen(  # noqa: S310
-            req,
-            timeout=SCORECARD_REQUEST_TIMEOUT_SECONDS,
-        ) as resp:
-            data = json.loads(resp.read())
+        data = json.loads(cached_urlopen(req, timeout=SCORECARD_REQUEST_TIMEOUT_SECONDS))
     except urllib.error.HTTPError as exc:
         result["error"] = f"http_{exc.code}"
         return result
@@ -1588,31 +1962,6 @@ def _fetch_openssf_scorecard(repo: str) -> dict:
     return _normalize_scorecard_payload(data, source="api", api_url=api_url)
 
 
-def _resolve_github_token() -> str | None:
-    """Resolve a GitHub token for Scorecard CLI rate limits.
-
-    Returns:
-        Token string, or ``None`` if unavailable.
-
-    """
-    for key in ("GITHUB_AUTH_TOKEN", "GH_TOKEN", "GITHUB_TOKEN"):
-        value = os.environ.get(key, "").strip()
-        if value:
-            return value
-    try:
-        result = subprocess.run(
-            ["gh", "auth", "token"],
-            capture_output=True,
-            text=True,
-            timeout=GH_VERSION_TIMEOUT_SECONDS,
-            check=False,
-        )
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return None
-    token = (result.stdout or "").strip()
-    return token or None
-
-
 def _scorecard_managed_bin_dir() -> Path:
     """Return the directory used for auto-downloaded Scorecard binaries."""
     return Path(".supply-chain-audit") / "bin"
@@ -1781,12 +2130,13 @@ def _ensure_scorecard_cli() -> str | None:
 
     """
     managed = _managed_scorecard_binary()
-    if _is_usable_executable(managed):
-        return str(managed.resolve())
+    with _SCORECARD_CLI_LOCK:
+        if _is_usable_executable(managed):
+            return str(managed.resolve())
 
-    downloaded = _download_scorecard_cli(managed)
-    if downloaded:
-        return downloaded
+        downloaded = _download_scorecard_cli(managed)
+        if downloaded:
+            return downloaded
 
     # Last resort: PATH (may differ from the pinned version).
     return shutil.which(SCORECARD_CLI_BIN) or shutil.which(f"{SCORECARD_CLI_BIN}.exe")
@@ -1838,7 +2188,7 @@ def _run_scorecard_cli(repo: str) -> dict:
         return result
 
     env = os.environ.copy()
-    token = _resolve_github_token()
+    token = resolve_github_token()
     if token:
         # Scorecard accepts any of these; set all common variants.
         env.setdefault("GITHUB_AUTH_TOKEN", token)
@@ -1975,7 +2325,7 @@ def _report_osv_scan_results(inventory: list[dict], vuln_results: list[dict]) ->
     if not inventory:
         print("  No lock files found, skipping OSV scan")
         return
-    print(f"  Found {len(inventory)} packages, querying OSV...")
+    print(f"  Scanned {len(inventory)} packages")
     if vuln_results:
         total_vulns = sum(len(v["vulns"]) for v in vuln_results)
         print(
@@ -1985,59 +2335,188 @@ def _report_osv_scan_results(inventory: list[dict], vuln_results: list[dict]) ->
         print("  \u2705 No known vulnerabilities found")
 
 
-def _scan_osv_for_repo(repo: str) -> list[dict]:
-    """Scan package inventory for known vulnerabilities via OSV.dev.
+def scan_fleet_vulnerabilities(cache_dir: Path, repos: list[str]) -> None:
+    """Scan every repo's package inventory against OSV.dev in one fleet-level pass.
+
+    Inventories of repos without a ``vulns`` file are unioned and deduplicated
+    by ``(ecosystem, name, version)`` before querying, then results are fanned
+    back out into each repo's ``vulns`` cache file.
 
     Args:
-        repo: Repository name.
+        cache_dir: Root cache directory.
+        repos: Normalized repository names.
+
+    """
+    inventories: dict[str, list[dict]] = {}
+    for repo in repos:
+        cache_name = f"{repo_cache_name(repo)}.json"
+        inventory = read_cache_file(cache_dir, "inventory", cache_name)
+        if isinstance(inventory, list) and not (cache_dir / "vulns" / cache_name).exists():
+            inventories[repo] = inventory
+    if not inventories:
+        return
+
+    print(f"\nScanning package inventories of {len(inventories)} repo(s) against OSV.dev...")
+    vulns_by_triple = query_osv_vulns({_osv_triple(pkg) for inventory in inventories.values() for pkg in inventory})
+    for repo, inventory in inventories.items():
+        vuln_results = _osv_results_for(inventory, vulns_by_triple)
+        write_cache_file(cache_dir, "vulns", f"{repo_cache_name(repo)}.json", vuln_results)
+        print(f"  {repo}:")
+        _report_osv_scan_results(inventory, vuln_results)
+
+
+def _read_stored_objects(objects_dir: Path | None, kind: str, keys: list[str]) -> dict:
+    """Load the objects of ``kind`` that the store already holds for ``keys``.
+
+    Args:
+        objects_dir: Shared object store, or ``None``.
+        kind: Object kind.
+        keys: Candidate object keys.
 
     Returns:
-        Vulnerability scan results.
+        Stored data per key, for keys present in the store.
 
     """
-    print("  Scanning package inventory against OSV.dev...")
-    inventory = collect_package_inventory(repo)
-    vuln_results = scan_osv_batch(inventory) if inventory else []
-    _report_osv_scan_results(inventory, vuln_results)
-    return vuln_results
+    if objects_dir is None:
+        return {}
+    return {key: read_object(objects_dir, kind, key) for key in keys if has_object(objects_dir, kind, key)}
+
+
+def _pr_audit_object_key(audit: dict) -> str:
+    """Content key of a PR audit, shared with its PR (``org/repo#number@updated_at``)."""
+    pr = {"repo": audit["repo"], "number": audit["pr_number"], "updated_at": audit.get("pr_updated_at")}
+    return pr_object_key(pr)
+
 
+def _window_object_refs(objects_dir: Path, repo: str, window: dict) -> dict:
+    """Move a window's commits, PRs, check suites and PR audits into the object store.
 
-def _collect_repo_artifacts(
+    Commits and check suites are keyed by SHA within the repo's own kind.
+    Check suites are only stored once every suite has completed; pending ones
+    stay inline so a later run can pick up their final state.
+
+    Args:
+        objects_dir: Shared object store.
+        repo: Repository the window belongs to.
+        window: Window artifacts (or one day segment of them).
+
+    Returns:
+        The same artifacts with those categories replaced by reference documents.
+
+    """
+    final_checks = {
+        sha: suites
+        for sha, suites in window["checks"].items()
+        if all(suite.get("status") == "completed" for suite in suites)
+    }
+    pending_checks = {sha: suites for sha, suites in window["checks"].items() if sha not in final_checks}
+    return {
+        **window,
+        "commits": object_refs(
+            objects_dir,
+            repo_object_kind("commits", repo),
+            {c["sha"]: c for c in window["commits"]},
+        ),
+        "prs": object_refs(objects_dir, "prs", {pr_object_key(pr): pr for pr in window["prs"]}),
+        "checks": object_refs(
+            objects_dir,
+            repo_object_kind("checks", repo),
+            final_checks,
+            shape="mapping",
+            inline=pending_checks,
+        ),
+        "pr_audits": object_refs(
+            objects_dir,
+            "pr_audits",
+            {_pr_audit_object_key(audit): audit for audit in window["pr_audits"]},
+        ),
+    }
+
+
+def _collect_window_artifacts(
     repo: str,
     start_date: str,
     end_date: str,
     *,
-    use_scorecard_cli: bool = True,
-) -> dict:
-    """Collect all audit artifacts for a single repo.
+    objects_dir: Path | None = None,
+) -> tuple[dict, bool]:
+    """Collect the artifacts that depend on the audit window for a single repo.
+
+    Check suites and PR audits already in the object store (from any earlier
+    window) are reused instead of fetched. Commit, PR, check suite and
+    dependency lookups that fail leave their data out and mark the result
+    incomplete, so the range is not stored as covered.
 
     Args:
         repo: Repository name.
-        start_date: Audit window start (YYYY-MM-DD).
-        end_date: Audit window end (YYYY-MM-DD).
-        use_scorecard_cli: Fall back to local Scorecard CLI when API has no score.
+        start_date: Range start (YYYY-MM-DD).
+        end_date: Range end (YYYY-MM-DD).
+        objects_dir: Shared object store, or ``None`` to fetch everything.
 
     Returns:
-        Dict of collected artifact categories.
+        Dict with ``commits``, ``prs``, ``checks``, ``deps``, ``pr_audits``
+        and ``protection_changes``, and whether every lookup succeeded.
 
     """
     print(f"  Fetching commits ({start_date} to {end_date})...")
-    commits = collect_commits(repo, start_date, end_date)
+    fetched_commits = collect_commits(repo, start_date, end_date)
+    commits = fetched_commits or []
     print(f"  Found {len(commits)} commits")
 
     print("  Fetching associated PRs...")
-    prs = collect_prs_for_commits(repo, commits)
+    prs, prs_complete = collect_prs_for_commits(repo, commits)
     print(f"  Found {len(prs)} PRs")
 
     print("  Fetching check suites...")
-    checks = collect_check_suites(repo, commits)
-    print(f"  Collected checks for {len(checks)} commits")
+    stored_checks = _read_stored_objects(objects_dir, repo_object_kind("checks", repo), [c["sha"] for c in commits])
+    checks = collect_check_suites(repo, [c for c in commits if c["sha"] not in stored_checks])
+    checks.update(stored_checks)
+    print(f"  Collected checks for {len(checks)} commits ({len(stored_checks)} from object store)")
 
     print("  Analyzing dependency changes...")
-    deps = collect_dep_changes(repo, start_date, end_date, commits)
+    fetched_deps = collect_dep_changes(repo, start_date, end_date, commits)
+    deps = fetched_deps or []
     print(f"  Found {len(deps)} dependency changes")
 
-    vuln_results = _scan_osv_for_repo(repo)
+    print("  Fetching PR commit histories and reviews...")
+    stored_audits = _read_stored_objects(objects_dir, "pr_audits", [pr_object_key(pr) for pr in prs])
+    fetched_audits = collect_pr_commits_and_reviews(repo, [pr for pr in prs if pr_object_key(pr) not in stored_audits])
+    pr_audits = [*stored_audits.values(), *fetched_audits]
+    total_pr_commits = sum(a["commit_count"] for a in pr_audits)
+    print(
+        f"  Collected {total_pr_commits} PR branch commits across {len(pr_audits)} PRs",
+    )
+
+    print("  Checking for protection rule changes...")
+    protection_changes = collect_protection_changes(repo, start_date, end_date)
+    print(f"  Protection changes in window: {len(protection_changes)}")
+
+    complete = fetched_commits is not None and prs_complete and len(checks) == len(commits) and fetched_deps is not None
+    window = {
+        "commits": commits,
+        "prs": prs,
+        "checks": checks,
+        "deps": deps,
+        "pr_audits": pr_audits,
+        "protection_changes": protection_changes,
+    }
+    return window, complete
+
+
+def _collect_repo_snapshot(repo: str, *, use_scorecard_cli: bool = True) -> dict:
+    """Collect the point-in-time artifacts of a repo (independent of the window).
+
+    Args:
+        repo: Repository name.
+        use_scorecard_cli: Fall back to local Scorecard CLI when API has no score.
+
+    Returns:
+        Dict with ``inventory``, ``renovate_config``, ``protection`` and ``scorecard``.
+
+    """
+    print("  Collecting package inventory...")
+    inventory = collect_package_inventory(repo)
+    print(f"  Found {len(inventory)} packages (OSV scan runs once for all repos)")
 
     print("  Fetching renovate config...")
     renovate_config = collect_renovate_config(repo)
@@ -2047,62 +2526,207 @@ def _collect_repo_artifacts(
         f"  Cooldown: {cooldown} days (major: {major_cd} days), source: {renovate_config['source']}",
     )
 
-    print("  Fetching PR commit histories and reviews...")
-    pr_audits = collect_pr_commits_and_reviews(repo, prs)
-    total_pr_commits = sum(a["commit_count"] for a in pr_audits)
-    print(
-        f"  Collected {total_pr_commits} PR branch commits across {len(pr_audits)} PRs",
-    )
-
     print("  Fetching branch protection rules...")
     protection = collect_branch_protection(repo)
     required = protection.get("required_checks", [])
     print(f"  Required checks: {required or '(none configured)'}")
 
-    print("  Checking for protection rule changes...")
-    protection_changes = collect_protection_changes(repo, start_date, end_date)
-    print(f"  Protection changes in window: {len(protection_changes)}")
-
     print("  Fetching OpenSSF Scorecard status...")
     scorecard = collect_scorecard(repo, use_cli=use_scorecard_cli)
     _print_scorecard_status(scorecard)
 
     return {
-        "commits": commits,
-        "prs": prs,
-        "checks": checks,
-        "deps": deps,
-        "pr_audits": pr_audits,
+        "inventory": inventory,
         "renovate_config": renovate_config,
-        "vuln_results": vuln_results,
         "protection": protection,
-        "protection_changes": protection_changes,
         "scorecard": scorecard,
     }
 
 
+def _segment_day(timestamp: str | None, start_date: str, end_date: str) -> str:
+    """Pick the day segment for a timestamp, clamped into the fetched range.
+
+    Clamping keeps every object inside the days that were actually fetched
+    for it, e.g. a dependency change dated by its commit's author date.
+    """
+    day = (timestamp or "")[:10]
+    if not day:
+        return end_date
+    return min(max(day, start_date), end_date)
+
+
+def _split_window_by_day(window: dict, start_date: str, end_date: str) -> dict[str, dict]:
+    """Split window artifacts for a fetched range into per-day segments.
+
+    Args:
+        window: Output of :func:`_collect_window_artifacts`.
+        start_date: Fetched range start (YYYY-MM-DD).
+        end_date: Fetched range end (YYYY-MM-DD).
+
+    Returns:
+        Segment payload per ISO day, covering every day of the range.
+
+    """
+    segments: dict[str, dict] = {
+        day: {"commits": [], "prs": [], "checks": {}, "deps": [], "pr_audits": [], "protection_changes": []}
+        for day in iter_days(start_date, end_date)
+    }
+    prs_by_number = {pr["number"]: pr for pr in window["prs"]}
+    audits_by_number = {audit["pr_number"]: audit for audit in window["pr_audits"]}
+    # Commits are listed by committer date, so they are bucketed by it too:
+    # the author date of a rebased or cherry-picked commit can be any earlier day.
+    commit_days = {
+        commit["sha"]: _segment_day(commit.get("committed_date") or commit.get("date"), start_date, end_date)
+        for commit in window["commits"]
+    }
+
+    for commit in window["commits"]:
+        segment = segments[commit_days[commit["sha"]]]
+        segment["commits"].append(commit)
+        if commit["sha"] in window["checks"]:
+            segment["checks"][commit["sha"]] = window["checks"][commit["sha"]]
+        for pr_num in commit.get("associated_prs", []):
+            if pr_num in prs_by_number and prs_by_number[pr_num] not in segment["prs"]:
+                segment["prs"].append(prs_by_number[pr_num])
+            if pr_num in audits_by_number and audits_by_number[pr_num] not in segment["pr_audits"]:
+                segment["pr_audits"].append(audits_by_number[pr_num])
+    for dep in window["deps"]:
+        day = commit_days.get(dep.get("commit_sha", "")) or _segment_day(dep.get("commit_date"), start_date, end_date)
+        segments[day]["deps"].append(dep)
+    for change in window["protection_changes"]:
+        segments[_segment_day(change.get("timestamp"), start_date, end_date)]["protection_changes"].append(change)
+    return segments
+
+
+def _assemble_window(segments_dir: Path, repo: str, start_date: str, end_date: str) -> dict:
+    """Build window artifacts for a repo from its per-day segments.
+
+    Days are read newest first so commits keep the API's newest-first order;
+    PRs and PR audits shared by several days are kept once. Dependency
+    changes belong to the day of the commit that made them.
+
+    Args:
+        segments_dir: Shared segment directory.
+        repo: Repository name.
+        start_date: Window start (YYYY-MM-DD).
+        end_date: Window end (YYYY-MM-DD).
+
+    Returns:
+        Same shape as :func:`_collect_window_artifacts`.
+
+    """
+    window: dict = {"commits": [], "prs": [], "checks": {}, "deps": [], "pr_audits": [], "protection_changes": []}
+    seen_prs: set[int] = set()
+    seen_audits: set[int] = set()
+    for day in reversed(iter_days(start_date, end_date)):
+        segment = read_day_segment(segments_dir, repo, day)
+        if not segment:
+            continue
+        window["commits"].extend(segment["commits"])
+        window["checks"].update(segment["checks"])
+        window["deps"].extend(segment["deps"])
+        window["protection_changes"].extend(segment["protection_changes"])
+        for pr in segment["prs"]:
+            if pr["number"] not in seen_prs:
+                seen_prs.add(pr["number"])
+                window["prs"].append(pr)
+        for audit in segment["pr_audits"]:
+            if audit["pr_number"] not in seen_audits:
+                seen_audits.add(audit["pr_number"])
+                window["pr_audits"].append(audit)
+    return window
+
+
+def _checks_settled(segment: dict) -> bool:
+    """Whether every check suite of a day segment has completed.
+
+    Args:
+        segment: Day segment payload.
+
+    Returns:
+        ``True`` if no suite is still queued or running.
+
+    """
+    return all(suite.get("status") == "completed" for suites in segment["checks"].values() for suite in suites)
+
+
+def _collect_window_incrementally(
+    repo: str,
+    start_date: str,
+    end_date: str,
+    segments_dir: Path,
+    *,
+    force: bool = False,
+) -> dict:
+    """Collect window artifacts, fetching only days not already in the segment store.
+
+    Each run of consecutive missing days is fetched as one range, split into
+    per-day segments and stored; the requested window is then assembled from
+    segments. Days up to and including today (UTC), days with a check suite
+    that has not completed, and every day of a range whose fetch was
+    incomplete are never marked covered, so they are refetched on the next
+    run.
+
+    Args:
+        repo: Repository name.
+        start_date: Window start (YYYY-MM-DD).
+        end_date: Window end (YYYY-MM-DD).
+        segments_dir: Shared segment directory.
+        force: Refetch every day of the window.
+
+    Returns:
+        Same shape as :func:`_collect_window_artifacts`.
+
+    """
+    days = iter_days(start_date, end_date)
+    covered = set() if force else read_segment_coverage(segments_dir, repo)
+    missing = [day for day in days if day not in covered]
+    today = datetime.now(UTC).date().isoformat()
+    print(f"  Segments: {len(days) - len(missing)}/{len(days)} days reused")
+
+    objects_dir = get_objects_dir(segments_dir)
+    for range_start, range_end in contiguous_ranges(missing):
+        window, complete = _collect_window_artifacts(repo, range_start, range_end, objects_dir=objects_dir)
+        if not complete:
+            print(f"  Incomplete fetch for {range_start}..{range_end}; these days will be refetched next run")
+        segments = _split_window_by_day(window, range_start, range_end)
+        write_day_segments(
+            segments_dir,
+            repo,
+            {day: _window_object_refs(objects_dir, repo, segment) for day, segment in segments.items()},
+            complete={day for day, segment in segments.items() if day < today and _checks_settled(segment)}
+            if complete
+            else set(),
+        )
+
+    return _assemble_window(segments_dir, repo, start_date, end_date)
+
+
 def _write_repo_cache_files(cache_dir: Path, repo: str, artifacts: dict) -> None:
     """Persist collected repo artifacts to the cache directory.
 
     Args:
         cache_dir: Root cache directory.
         repo: Repository name.
-        artifacts: Collected artifact categories from ``_collect_repo_artifacts``.
+        artifacts: Window artifacts merged with the repo snapshot.
 
     """
     cache_name = f"{repo_cache_name(repo)}.json"
-    write_cache_file(cache_dir, "commits", cache_name, artifacts["commits"])
-    write_cache_file(cache_dir, "prs", cache_name, artifacts["prs"])
-    write_cache_file(cache_dir, "checks", cache_name, artifacts["checks"])
+    refs = _window_object_refs(get_objects_dir(cache_dir), repo, artifacts)
+    write_cache_file(cache_dir, "commits", cache_name, refs["commits"])
+    write_cache_file(cache_dir, "prs", cache_name, refs["prs"])
+    write_cache_file(cache_dir, "checks", cache_name, refs["checks"])
     write_cache_file(cache_dir, "deps", cache_name, artifacts["deps"])
-    write_cache_file(cache_dir, "pr_audits", cache_name, artifacts["pr_audits"])
+    write_cache_file(cache_dir, "pr_audits", cache_name, refs["pr_audits"])
     write_cache_file(
         cache_dir,
         "renovate",
         cache_name,
         artifacts["renovate_config"],
     )
-    write_cache_file(cache_dir, "vulns", cache_name, artifacts["vuln_results"])
+    write_cache_file(cache_dir, "inventory", cache_name, artifacts["inventory"])
+    # Stale scan results are replaced by the fleet-level OSV stage.
+    (cache_dir / "vulns" / cache_name).unlink(missing_ok=True)
     write_cache_file(
         cache_dir,
         "protection",
@@ -2198,12 +2822,14 @@ def collect_repo(
                 _print_scorecard_status(api_only)
         return _load_cached_repo_counts(cache_dir, repo)
 
-    artifacts = _collect_repo_artifacts(
+    artifacts = _collect_window_incrementally(
         repo,
         start_date,
         end_date,
-        use_scorecard_cli=use_scorecard_cli,
+        get_segments_dir(cache_dir),
+        force=force,
     )
+    artifacts.update(_collect_repo_snapshot(repo, use_scorecard_cli=use_scorecard_cli))
     _write_repo_cache_files(cache_dir, repo, artifacts)
 
     commits = artifacts["commits"]
@@ -2215,6 +2841,82 @@ def collect_repo(
     return len(commits), len(prs)
 
 
+def collect_repos(
+    repos: list[str],
+    start_date: str,
+    end_date: str,
+    cache_dir: Path,
+    *,
+    jobs: int = DEFAULT_COLLECT_JOBS,
+    force: bool = False,
+    use_scorecard_cli: bool = True,
+    refresh_scorecard: bool = False,
+) -> tuple[int, int]:
+    """Collect several repos on a bounded worker pool.
+
+    All workers share the client's rate-limit governor. Each repo writes
+    its own cache files as soon as it finishes; a failure in one repo does not
+    stop the others. Once every repo succeeded, OSV.dev is queried once for
+    the union of their package inventories.
+
+    Args:
+        repos: Normalized repository names.
+        start_date: Audit window start (YYYY-MM-DD).
+        end_date: Audit window end (YYYY-MM-DD).
+        cache_dir: Root cache directory.
+        jobs: Maximum number of repos collected at once.
+        force: Re-collect even if cached data exists.
+        use_scorecard_cli: Fall back to local Scorecard CLI when API has no score.
+        refresh_scorecard: Re-collect Scorecard even when other artifacts are cached.
+
+    Returns:
+        Tuple of (total_commits, total_prs).
+
+    Raises:
+        RuntimeError: If any repo failed to collect.
+
+    """
+    jobs = max(1, min(jobs, len(repos) or 1))
+    output = _WorkerOutput(sys.stdout) if jobs > 1 else None
+
+    def _collect(repo: str) -> tuple[int, int]:
+        with output.capture() if output else contextlib.nullcontext():
+            return collect_repo(
+                repo,
+                start_date,
+                end_date,
+                cache_dir,
+                force=force,
+                use_scorecard_cli=use_scorecard_cli,
+                refresh_scorecard=refresh_scorecard,
+            )
+
+    total_commits = 0
+    total_prs = 0
+    failed: list[str] = []
+    with (
+        contextlib.redirect_stdout(output) if output else contextlib.nullcontext(),  # type: ignore[type-var]
+        ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="collect") as pool,
+    ):
+        futures = {pool.submit(_collect, repo): repo for repo in repos}
+        for future in as_completed(futures):
+            repo = futures[future]
+            try:
+                c, p = future.result()
+            except Exception as exc:  # noqa: BLE001 — isolate per-repo failures
+                print(f"  [failed] {repo}: {type(exc).__name__}: {exc}", file=sys.stderr)
+                failed.append(repo)
+                continue
+            total_commits += c
+            total_prs += p
+
+    if failed:
+        msg = f"collection failed for {len(failed)} repo(s): {', '.join(sorted(failed))}"
+        raise RuntimeError(msg)
+    scan_fleet_vulnerabilities(cache_dir, [normalize_repo(r) for r in repos])
+    return total_commits, total_prs
+
+
 def main() -> None:
     """Entry point for data collection."""
     parser = argparse.ArgumentParser(description="Supply chain audit data collector")
@@ -2253,7 +2955,36 @@ def main() -> None:
         action="store_true",
         help="Re-fetch Scorecard (API/CLI) even when other repo data is cached",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_COLLECT_JOBS,
+        help=f"Repos to collect concurrently under one shared rate budget (default: {DEFAULT_COLLECT_JOBS})",
+    )
+    parser.add_argument(
+        "--cache-format",
+        choices=CACHE_FORMATS,
+        default=DEFAULT_CACHE_FORMAT,
+        help=(
+            f"Serializer for cache files written by this run (default: {DEFAULT_CACHE_FORMAT}); "
+            "readers detect the format, so existing caches stay readable"
+        ),
+    )
+    parser.add_argument(
+        "--sqlite-index",
+        dest="sqlite_index",
+        action="store_true",
+        default=True,
+        help="Build or refresh the SQLite package index of the cache, cache_index.sqlite (default)",
+    )
+    parser.add_argument(
+        "--skip-sqlite-index",
+        dest="sqlite_index",
+        action="store_false",
+        help="Do not build the SQLite index; check_package.py builds it on first use",
+    )
     args = parser.parse_args()
+    set_cache_format(args.cache_format)
 
     try:
         datetime.strptime(args.start, DATE_FORMAT).replace(tzinfo=UTC)
@@ -2262,14 +2993,14 @@ def main() -> None:
         print("ERROR: Dates must be in YYYY-MM-DD format", file=sys.stderr)
         sys.exit(1)
 
-    gh_version = get_gh_version()
-    if "unknown" in gh_version:
+    if not resolve_github_token():
         print(
-            "ERROR: gh CLI not found. Install it and run 'gh auth login'",
+            "ERROR: No GitHub token found. Set GH_TOKEN or install gh and run 'gh auth login'",
             file=sys.stderr,
         )
         sys.exit(1)
-    print(f"Using: {gh_version}")
+    gh_version = get_gh_version()
+    print(f"Using: in-process GitHub API client (gh: {gh_version})")
     if args.scorecard_cli:
         # Lazy bootstrap: download only when a repo actually needs the CLI.
         managed = _managed_scorecard_binary()
@@ -2290,22 +3021,22 @@ def main() -> None:
     print(f"Time window: {args.start} to {args.end}")
     print(f"Repos: {len(repos)}")
     print(f"Cache: {cache_dir}")
+    print(f"Jobs: {args.jobs}")
 
-    total_commits = 0
-    total_prs = 0
-
-    for repo in repos:
-        c, p = collect_repo(
-            repo,
+    try:
+        total_commits, total_prs = collect_repos(
+            repos,
             args.start,
             args.end,
             cache_dir,
+            jobs=args.jobs,
             force=args.force,
             use_scorecard_cli=args.scorecard_cli,
             refresh_scorecard=args.refresh_scorecard,
         )
-        total_commits += c
-        total_prs += p
+    except RuntimeError as exc:
+        print(f"ERROR: {exc}; manifest not written", file=sys.stderr)
+        sys.exit(1)
 
     write_manifest(
         cache_dir,
@@ -2316,12 +3047,16 @@ def main() -> None:
         total_commits,
         total_prs,
     )
+    if args.sqlite_index:
+        with open_cache_index(cache_dir, create=True) as index:
+            print(f"\nSQLite index: {index.cache_dir / CACHE_INDEX_FILE}")
 
     print(f"\n{'=' * 60}")
     print("  Collection complete!")
     print(f"  Total commits: {total_commits}")
     print(f"  Total PRs: {total_prs}")
     print(f"  Cache directory: {cache_dir}")
+    print(f"  Rate-limit throttling: {default_client().governor.throttled_seconds:.1f}s")
     print(f"{'=' * 60}")
 
 
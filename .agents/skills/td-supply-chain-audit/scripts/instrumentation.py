@@ -0,0 +1,139 @@
+"""Stage instrumentation for the analysis pipeline.
+
+Measures named stages (cache loads, detection passes): wall time, CPU time
+of the running process, how far the stage raised the process's peak
+resident memory, and caller-supplied input and output sizes. On request a
+stage also runs under ``tracemalloc`` (exact peak of Python allocations)
+and ``cProfile``, whose statistics are dumped as a ``.pstats`` file plus a
+readable ``.txt`` summary.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+# Functions listed in the readable summary of a profiled stage.
+PROFILE_TOP_FUNCTIONS = 30
+BYTES_PER_KIB = 1024
+
+
+def _peak_rss_kib() -> int | None:
+    """Peak resident set size of this process so far, or ``None`` where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak // BYTES_PER_KIB if sys.platform == "darwin" else peak
+
+
+@dataclass
+class StageProfile:  # pylint: disable=too-many-instance-attributes
+    """Measurements of one pipeline stage.
+
+    Attributes:
+        name: Stage name (e.g. ``load:commits`` or a detection pass name).
+        wall_seconds: Elapsed wall-clock time.
+        cpu_seconds: CPU time used by the process during the stage.
+        peak_rss_growth_kib: How much the stage raised the process's peak
+            resident memory (0 when it stayed below an earlier peak).
+        traced_peak_kib: Peak of Python allocations during the stage, when
+            traced.
+        input_sizes: Sizes of the stage inputs, by input name.
+        output_size: Size of the stage output (records, findings, ...).
+
+    """
+
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_growth_kib: int | None = None
+    traced_peak_kib: int | None = None
+    input_sizes: dict[str, int | None] = field(default_factory=dict)
+    output_size: int | None = None
+
+    def to_dict(self) -> dict[str, object]:
+        """Serialize to dict for JSON storage.
+
+        Returns:
+            JSON-serializable dict with times rounded to microseconds.
+
+        """
+        data = asdict(self)
+        data["wall_seconds"] = round(self.wall_seconds, 6)
+        data["cpu_seconds"] = round(self.cpu_seconds, 6)
+        return data
+
+
+def _write_profile(profiler: cProfile.Profile, path: Path) -> None:
+    """Dump ``profiler`` to ``<path>.pstats`` and a cumulative-time summary to ``<path>.txt``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(path.with_suffix(".pstats"))
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_FUNCTIONS)
+    path.with_suffix(".txt").write_text(summary.getvalue(), encoding="utf-8")
+
+
+@contextmanager
+def measure(
+    name: str,
+    *,
+    input_sizes: Mapping[str, int | None] | None = None,
+    profile_path: Path | None = None,
+) -> Iterator[StageProfile]:
+    """Measure the enclosed block as one stage.
+
+    The yielded profile is filled in when the block exits; callers may set
+    ``output_size`` inside the block.
+
+    Args:
+        name: Stage name.
+        input_sizes: Sizes of the stage inputs.
+        profile_path: Also trace allocations and run the block under
+            ``cProfile``, writing ``<profile_path>.pstats`` and ``.txt``.
+
+    Yields:
+        The stage's profile.
+
+    """
+    stage = StageProfile(name, input_sizes=dict(input_sizes or {}))
+    rss_before = _peak_rss_kib()
+    profiler = cProfile.Profile() if profile_path is not None else None
+    tracing = profiler is not None and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield stage
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        stage.wall_seconds = time.perf_counter() - wall_started
+        stage.cpu_seconds = time.process_time() - cpu_started
+        if tracing:
+            stage.traced_peak_kib = tracemalloc.get_traced_memory()[1] // BYTES_PER_KIB
+            tracemalloc.stop()
+        rss_after = _peak_rss_kib()
+        if rss_before is not None and rss_after is not None:
+            stage.peak_rss_growth_kib = rss_after - rss_before
+        if profiler is not None and profile_path is not None:
+            _write_profile(profiler, profile_path)
@@ -0,0 +1,129 @@
+"""Indexed near-duplicate search over token sets.
+
+Implements a prefix-filter similarity join: tokens are ordered globally from
+rarest to most common, and two sets with Jaccard similarity of at least
+``t`` must share a token within the first ``n - ceil(t * n) + 1`` tokens of
+each set. Only those prefix tokens are indexed, so candidates come from
+short inverted lists of rare tokens, and every candidate is confirmed with
+exact Jaccard similarity. Unlike sampling schemes such as MinHash/LSH, the
+result has no false negatives.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections import Counter
+from itertools import chain
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Guards ``ceil(t * n)`` against float error when ``t * n`` is integral.
+_CEIL_EPSILON = 1e-9
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    """Exact Jaccard similarity of two token sets (0.0 when either is empty)."""
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+
+def prefix_length(size: int, threshold: float) -> int:
+    """Return how many leading (rarest) tokens of a set of ``size`` must be indexed."""
+    return size - math.ceil(threshold * size - _CEIL_EPSILON) + 1
+
+
+class PrefixIndex:
+    """Inverted index over the rarest tokens of each set."""
+
+    def __init__(self, token_sets: Sequence[frozenset[str]], threshold: float) -> None:
+        """Initialize an empty index whose token order comes from ``token_sets``.
+
+        Args:
+            token_sets: Every set that will be added or queried.
+            threshold: Minimum Jaccard similarity, in ``(0, 1]``.
+
+        """
+        self.threshold = threshold
+        frequency = Counter(chain.from_iterable(token_sets))
+        ordered = sorted(frequency, key=lambda token: (frequency[token], token))
+        self._rank = {token: position for position, token in enumerate(ordered)}
+        # Postings keyed by (token rank, set size) so the length filter is a lookup.
+        self._postings: dict[tuple[int, int], list[int]] = {}
+
+    def _prefix(self, tokens: frozenset[str]) -> list[int]:
+        return heapq.nsmallest(prefix_length(len(tokens), self.threshold), map(self._rank.__getitem__, tokens))
+
+    def add(self, item: int, tokens: frozenset[str]) -> None:
+        """Index ``tokens`` under ``item``."""
+        size = len(tokens)
+        for token_rank in self._prefix(tokens):
+            self._postings.setdefault((token_rank, size), []).append(item)
+
+    def candidates(self, tokens: frozenset[str]) -> list[int]:
+        """Indexed items that may reach the threshold with ``tokens``, in insertion order."""
+        size = len(tokens)
+        sizes = range(
+            math.ceil(self.threshold * size - _CEIL_EPSILON),
+            int(size / self.threshold + _CEIL_EPSILON) + 1,
+        )
+        found: set[int] = set()
+        for token_rank in self._prefix(tokens):
+            for other_size in sizes:
+                postings = self._postings.get((token_rank, other_size))
+                if postings:
+                    found.update(postings)
+        return sorted(found)
+
+
+def find_earliest_near_duplicates(
+    token_sets: Sequence[frozenset[str]],
+    threshold: float,
+) -> dict[int, tuple[int, float]]:
+    """Match each set to the earliest preceding set at or above ``threshold``.
+
+    Sets are compared in sequence order, so callers pass them sorted
+    chronologically. Identical sets are grouped first, which makes exact
+    duplicates free and keeps the index small.
+
+    Args:
+        token_sets: Token sets in chronological order; empty sets never match.
+        threshold: Minimum Jaccard similarity, in ``(0, 1]``.
+
+    Returns:
+        Mapping of set index to ``(earliest matching earlier index, similarity)``.
+
+    """
+    # Distinct sets in order of first appearance; ``first_seen[s]`` is its earliest index.
+    first_seen: dict[frozenset[str], int] = {}
+    for idx, tokens in enumerate(token_sets):
+        if tokens:
+            first_seen.setdefault(tokens, idx)
+    distinct = list(first_seen)
+
+    index = PrefixIndex(distinct, threshold)
+    # First index of the earliest different set that is a near-duplicate.
+    earliest_match: dict[frozenset[str], tuple[int, float]] = {}
+    for position, tokens in enumerate(distinct):
+        for other_pos in index.candidates(tokens):
+            other = distinct[other_pos]
+            similarity = jaccard(tokens, other)
+            if similarity >= threshold:
+                earliest_match[tokens] = (first_seen[other], similarity)
+                break
+        index.add(position, tokens)
+
+    matches: dict[int, tuple[int, float]] = {}
+    for idx, tokens in enumerate(token_sets):
+        if not tokens:
+            continue
+        found = [earliest_match[tokens]] if tokens in earliest_match else []
+        if first_seen[tokens] < idx:
+            found.append((first_seen[tokens], 1.0))
+        if found:
+            matches[idx] = min(found)
+    return matches
@@ -0,0 +1,139 @@
+"""Shared PyPI/npm registry metadata client.
+
+Fetches each package's metadata document once per run (one request per
+package rather than per version) and keeps only a compact projection — per
+version release dates and yanked/deprecated flags — in memory. Raw documents
+go through the shared :mod:`http_cache`, so later runs revalidate them with
+``ETag`` instead of downloading multi-megabyte npm packuments again.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from dataclasses import dataclass, field
+from functools import cache
+from pathlib import Path
+
+try:
+    from http_cache import cached_urlopen  # pylint: disable=import-error
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from http_cache import cached_urlopen
+
+REGISTRY_REQUEST_TIMEOUT_SECONDS = 15
+USER_AGENT = "supply-chain-audit/1.0"
+# Packument ``time`` keys that are not versions.
+NPM_TIME_META_KEYS = frozenset({"created", "modified"})
+
+
+@dataclass
+class ReleaseInfo:
+    """Per-version release metadata of one package.
+
+    Attributes:
+        release_dates: Release date (YYYY-MM-DD) per version.
+        yanked: Versions yanked (PyPI) or deprecated (npm).
+
+    """
+
+    release_dates: dict[str, str] = field(default_factory=dict)
+    yanked: set[str] = field(default_factory=set)
+
+
+def _pypi_release_info(data: dict) -> ReleaseInfo:
+    """Project a PyPI project JSON document onto :class:`ReleaseInfo`."""
+    info = ReleaseInfo()
+    for version, files in (data.get("releases") or {}).items():
+        if not files:
+            continue
+        upload_time = files[0].get("upload_time_iso_8601", "")
+        if upload_time:
+            info.release_dates[version] = upload_time[:10]
+        if all(f.get("yanked") for f in files):
+            info.yanked.add(version)
+    return info
+
+
+def _npm_release_info(data: dict) -> ReleaseInfo:
+    """Project an npm packument onto :class:`ReleaseInfo`."""
+    info = ReleaseInfo()
+    for version, timestamp in (data.get("time") or {}).items():
+        if version not in NPM_TIME_META_KEYS and timestamp:
+            info.release_dates[version] = timestamp[:10]
+    for version, manifest in (data.get("versions") or {}).items():
+        if isinstance(manifest, dict) and manifest.get("deprecated"):
+            info.yanked.add(version)
+    return info
+
+
+class RegistryClient:
+    """Thread-safe, memoising client for PyPI and npm package metadata."""
+
+    def __init__(self, timeout: float = REGISTRY_REQUEST_TIMEOUT_SECONDS) -> None:
+        """Initialize the client.
+
+        Args:
+            timeout: Socket timeout in seconds per request.
+
+        """
+        self.timeout = timeout
+        self._memo: dict[tuple[str, str], ReleaseInfo | None] = {}
+        self._key_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _fetch_json(self, url: str) -> dict | None:
+        """GET a registry document through the response cache."""
+        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})  # noqa: S310
+        try:
+            data = json.loads(cached_urlopen(req, timeout=self.timeout))
+        except (urllib.error.URLError, json.JSONDecodeError, TimeoutError, OSError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _load(self, ecosystem: str, name: str) -> ReleaseInfo | None:
+        """Fetch and project one package's metadata."""
+        quoted = urllib.parse.quote(name, safe="@")
+        if ecosystem == "pypi":
+            data = self._fetch_json(f"https://pypi.org/pypi/{quoted}/json")
+            return _pypi_release_info(data) if data is not None else None
+        if ecosystem == "npm":
+            data = self._fetch_json(f"https://registry.npmjs.org/{quoted}")
+            return _npm_release_info(data) if data is not None else None
+        return None
+
+    def release_info(self, ecosystem: str, name: str) -> ReleaseInfo | None:
+        """Return release metadata for a package, fetching it at most once per run.
+
+        Args:
+            ecosystem: ``pypi`` or ``npm``.
+            name: Package name.
+
+        Returns:
+            Release metadata, or ``None`` if the registry lookup failed.
+
+        """
+        key = (ecosystem, name.lower() if ecosystem == "pypi" else name)
+        with self._lock:
+            if key in self._memo:
+                return self._memo[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Concurrent callers for the same package wait for one download.
+        with key_lock:
+            with self._lock:
+                if key in self._memo:
+                    return self._memo[key]
+            info = self._load(*key)
+            with self._lock:
+                self._memo[key] = info
+        return info
+
+
+@cache
+def default_registry() -> RegistryClient:
+    """Return the process-wide registry client."""
+    return RegistryClient()
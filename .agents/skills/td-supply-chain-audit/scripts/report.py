@@ -1161,7 +1161,8 @@ def generate_package_focus_section(package_data: dict | None) -> str:
     """Generate the Phase 2 package focus section if data exists.
 
     Args:
-        package_data: Package focus analysis results, or ``None``.
+        package_data: Package focus analysis results (one package, or
+            ``{"packages": [...]}`` from a batch run), or ``None``.
 
     Returns:
         HTML section string, or empty string if no data.
@@ -1169,6 +1170,8 @@ def generate_package_focus_section(package_data: dict | None) -> str:
     """
     if not package_data:
         return ""
+    if "packages" in package_data:
+        return "".join(generate_package_focus_section(entry) for entry in package_data["packages"])
 
     pkg = package_data.get("package_name", "unknown")
     date = package_data.get("compromise_date", "unknown")
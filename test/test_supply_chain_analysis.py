@@ -0,0 +1,197 @@
+"""Tests for incremental supply-chain analysis over a synthetic cache."""
+
+import importlib
+import json
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+
+SCRIPTS_DIR = (
+    Path(__file__).resolve().parents[1]
+    / ".agents"
+    / "skills"
+    / "td-supply-chain-audit"
+    / "scripts"
+)
+REPOS = ("ansible/alpha", "ansible/beta")
+# Long enough for the replicated-message pass, which compares across repos.
+SHARED_MESSAGE = "Bump the shared tooling configuration to the latest release"
+
+
+def _load_script(name: str) -> ModuleType:
+    """Import a supply-chain audit script as a module."""
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    return importlib.import_module(name)
+
+
+@pytest.fixture(name="analyze")
+def fixture_analyze() -> ModuleType:
+    """The analyze.py module."""
+    return _load_script("analyze")
+
+
+@pytest.fixture(name="cache_utils")
+def fixture_cache_utils() -> ModuleType:
+    """The cache_utils.py module."""
+    return _load_script("cache_utils")
+
+
+def _commit(repo: str, seed: int, *, verified: bool, prs: list[int]) -> dict[str, Any]:
+    """Build a cached commit dict."""
+    return {
+        "sha": f"{seed:040x}",
+        "repo": repo,
+        "author_login": "dev",
+        "author_email": "dev@example.com",
+        "committer_login": "dev",
+        "committer_email": "dev@example.com",
+        "message": SHARED_MESSAGE if seed % 2 else f"Change number {seed} in {repo}",
+        "date": f"2026-03-0{seed % 9 + 1}T10:00:00Z",
+        "verification": {
+            "verified": verified,
+            "reason": "valid" if verified else "unsigned",
+        },
+        "associated_prs": prs,
+        "url": "",
+        "committed_date": f"2026-03-0{seed % 9 + 1}T10:00:00Z",
+    }
+
+
+def _write_repo(
+    cache_utils: ModuleType, cache_dir: Path, repo: str, commits: list[dict[str, Any]]
+) -> None:
+    """Write a repo's commits through the object store and its PRs inline."""
+    objects_dir = cache_utils.get_objects_dir(cache_dir)
+    name = f"{cache_utils.repo_cache_name(repo)}.json"
+    refs = cache_utils.object_refs(
+        objects_dir,
+        cache_utils.repo_object_kind("commits", repo),
+        {c["sha"]: c for c in commits},
+    )
+    cache_utils.write_cache_file(cache_dir, "commits", name, refs)
+    prs = [
+        {"repo": repo, "number": n, "merged": True, "merge_commit_sha": ""}
+        for n in sorted({n for c in commits for n in c["associated_prs"]})
+    ]
+    cache_utils.write_cache_file(cache_dir, "prs", name, prs)
+
+
+@pytest.fixture(name="cache_dir")
+def fixture_cache_dir(cache_utils: ModuleType, tmp_path: Path) -> Path:
+    """A window cache holding signed, unsigned, orphan and replicated commits."""
+    cache_dir = tmp_path / "window"
+    cache_utils.ensure_cache_structure(cache_dir)
+    for offset, repo in enumerate(REPOS):
+        base = offset * 10
+        _write_repo(
+            cache_utils,
+            cache_dir,
+            repo,
+            [
+                _commit(repo, base + 1, verified=True, prs=[base + 1]),
+                _commit(repo, base + 2, verified=False, prs=[base + 2]),
+                _commit(repo, base + 4, verified=True, prs=[]),
+            ],
+        )
+    return cache_dir
+
+
+def _findings(findings: list[Any]) -> list[str]:
+    """Serialize findings into a comparable, order-independent form."""
+    return sorted(json.dumps(f.to_dict(), sort_keys=True) for f in findings)
+
+
+def _reused(cache_dir: Path) -> tuple[int, int]:
+    """Return the (reused, total) input counts of the last run."""
+    profile = json.loads((cache_dir / "analysis_profile.json").read_text())
+    return profile["reused_inputs"], profile["total_inputs"]
+
+
+def test_unchanged_cache_reuses_every_input(
+    analyze: ModuleType, cache_dir: Path
+) -> None:
+    """A rerun over an unchanged cache recomputes nothing and returns the same findings."""
+    first = analyze.run_analysis(cache_dir)
+    second = analyze.run_analysis(cache_dir)
+
+    reused, total = _reused(cache_dir)
+    assert reused == total
+    assert first
+    assert _findings(second) == _findings(first)
+    assert _findings(second) == _findings(analyze.run_analysis(cache_dir, full=True))
+
+
+def test_changed_repo_matches_full_run(
+    analyze: ModuleType, cache_utils: ModuleType, cache_dir: Path
+) -> None:
+    """Changing one repo recomputes its passes and the fleet-wide ones only.
+
+    The changed repo drops the message the other repo replicates, so the
+    fleet-wide pass must also update the unchanged repo's findings.
+    """
+    before = analyze.run_analysis(cache_dir)
+    repo = REPOS[0]
+    _write_repo(
+        cache_utils,
+        cache_dir,
+        repo,
+        [
+            _commit(repo, 2, verified=False, prs=[]),
+            _commit(repo, 6, verified=True, prs=[6]),
+        ],
+    )
+
+    incremental = analyze.run_analysis(cache_dir)
+
+    reused, total = _reused(cache_dir)
+    assert 0 < reused < total
+    unchanged = [f for f in before if f.repo == REPOS[1]]
+    assert _findings([f for f in incremental if f.repo == REPOS[1]]) != _findings(
+        unchanged
+    )
+    assert _findings(incremental) == _findings(
+        analyze.run_analysis(cache_dir, full=True)
+    )
+
+
+def test_rewritten_object_invalidates_its_repo(
+    analyze: ModuleType, cache_utils: ModuleType, cache_dir: Path
+) -> None:
+    """An object rewritten under an unchanged key file is picked up by the rerun."""
+    before = analyze.run_analysis(cache_dir)
+    repo = REPOS[1]
+    commit = _commit(repo, 14, verified=True, prs=[14])
+    key_file = cache_dir / "commits" / f"{cache_utils.repo_cache_name(repo)}.json"
+    key_bytes = key_file.read_bytes()
+    cache_utils.write_objects(
+        cache_utils.get_objects_dir(cache_dir),
+        cache_utils.repo_object_kind("commits", repo),
+        {commit["sha"]: commit},
+    )
+    assert key_file.read_bytes() == key_bytes
+
+    incremental = analyze.run_analysis(cache_dir)
+
+    assert _findings(incremental) != _findings(before)
+    assert _findings(incremental) == _findings(
+        analyze.run_analysis(cache_dir, full=True)
+    )
+
+
+def test_code_change_invalidates_stored_findings(
+    analyze: ModuleType, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Stored findings are discarded when the analysis code fingerprint changes."""
+    first = analyze.run_analysis(cache_dir)
+    monkeypatch.setattr(analyze, "_analysis_code_fingerprint", lambda: "changed")
+
+    rerun = analyze.run_analysis(cache_dir)
+
+    reused, _ = _reused(cache_dir)
+    assert reused == 0
+    assert _findings(rerun) == _findings(first)
@@ -0,0 +1,110 @@
+"""Tests for package lookups through the supply-chain audit cache index."""
+
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+
+SCRIPTS_DIR = (
+    Path(__file__).resolve().parents[1]
+    / ".agents"
+    / "skills"
+    / "td-supply-chain-audit"
+    / "scripts"
+)
+REPO = "ansible/example"
+# (sha seed, committer day, PR number, package changed), newest first.
+HISTORY = (
+    (3, "2026-03-03", 30, "gamma"),
+    (2, "2026-03-02", 20, "beta"),
+    (1, "2026-03-01", 10, "alpha"),
+)
+
+
+def _load_script(name: str) -> ModuleType:
+    """Import a supply-chain audit script as a module."""
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    return importlib.import_module(name)
+
+
+def _sha(seed: int) -> str:
+    return f"{seed:040x}"
+
+
+def _commit_diff(endpoint: str, *, paginate: bool = False) -> dict[str, Any]:
+    """Serve a commit's diff: each commit bumps its own package."""
+    assert paginate
+    sha = endpoint.rsplit("/", 1)[-1]
+    package = next(pkg for seed, _, _, pkg in HISTORY if _sha(seed) == sha)
+    return {
+        "files": [
+            {
+                "filename": "requirements.txt",
+                "patch": f"-{package}==1.0\n+{package}==2.0\n",
+            }
+        ]
+    }
+
+
+@pytest.fixture(name="cache_dir")
+def fixture_cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """A window cache whose dependency changes were collected per commit."""
+    collect = _load_script("collect")
+    cache_utils = _load_script("cache_utils")
+    monkeypatch.setattr(collect, "gh_api", _commit_diff)
+    monkeypatch.setattr(collect, "enrich_dep_release_info", lambda _dep: None)
+
+    commits = [
+        {
+            "sha": _sha(seed),
+            "repo": REPO,
+            "date": f"{day}T10:00:00Z",
+            "committed_date": f"{day}T10:00:00Z",
+            "associated_prs": [],
+        }
+        for seed, day, _, _ in HISTORY
+    ]
+    prs = [
+        {"repo": REPO, "number": number, "merged": True, "merge_commit_sha": _sha(seed)}
+        for seed, _, number, _ in HISTORY
+    ]
+    deps = collect.collect_dep_changes(REPO, "2026-03-01", "2026-03-03", commits)
+
+    cache_dir = tmp_path / "window"
+    name = f"{cache_utils.repo_cache_name(REPO)}.json"
+    for subdir, data in (("commits", commits), ("prs", prs), ("deps", deps)):
+        cache_utils.write_cache_file(cache_dir, subdir, name, data)
+    return cache_dir
+
+
+def test_package_usage_credits_the_pr_that_changed_it(cache_dir: Path) -> None:
+    """A change is attributed to the PR that merged its own commit."""
+    cache_index = _load_script("cache_index")
+
+    with cache_index.open_cache_index(cache_dir, create=True) as index:
+        usage = index.package_usage(["alpha", "beta", "gamma"])
+
+    for seed, day, number, package in HISTORY:
+        assert usage[package].pull_requests == {(REPO, _sha(seed)): [number]}
+        assert [change["commit_date"] for change in usage[package].changes] == [day]
+
+
+def test_package_usage_filters_by_commit_day(cache_dir: Path) -> None:
+    """Date filters select changes by the day of the commit that made them."""
+    cache_index = _load_script("cache_index")
+
+    with cache_index.open_cache_index(cache_dir, create=True) as index:
+        usage = index.package_usage(
+            ["alpha", "beta", "gamma"], since="2026-03-02", until="2026-03-02"
+        )
+
+    assert {package: entry.repos for package, entry in usage.items()} == {
+        "alpha": [],
+        "beta": [REPO],
+        "gamma": [],
+    }
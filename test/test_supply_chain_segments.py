@@ -0,0 +1,300 @@
+"""Tests for assembling supply-chain audit windows from per-day segments."""
+
+import copy
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+
+SCRIPTS_DIR = (
+    Path(__file__).resolve().parents[1]
+    / ".agents"
+    / "skills"
+    / "td-supply-chain-audit"
+    / "scripts"
+)
+REPO = "ansible/example"
+# (sha seed, author day, committer day, PR number), oldest first. Commit 3 was
+# authored early but rebased onto the branch days later.
+HISTORY = (
+    (1, "2026-03-01", "2026-03-01", 101),
+    (2, "2026-03-02", "2026-03-02", 102),
+    (3, "2026-03-02", "2026-03-05", 103),
+    (4, "2026-03-04", "2026-03-04", 104),
+    (5, "2026-03-05", "2026-03-05", 104),
+    (6, "2026-03-08", "2026-03-09", 106),
+    (7, "2026-03-10", "2026-03-10", 107),
+)
+
+
+def _load_script(name: str) -> ModuleType:
+    """Import a supply-chain audit script as a module."""
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    return importlib.import_module(name)
+
+
+def _sha(seed: int) -> str:
+    return f"{seed:040x}"
+
+
+class FakeGitHub:
+    """Serves the synthetic history through the collect.py range fetchers."""
+
+    def __init__(self, collect: ModuleType) -> None:
+        """Build API-shaped commits for HISTORY."""
+        self.commits = [
+            collect.Commit.from_api(
+                {
+                    "sha": _sha(seed),
+                    "commit": {
+                        "author": {
+                            "date": f"{authored}T10:00:00Z",
+                            "email": "dev@example.com",
+                        },
+                        "committer": {
+                            "date": f"{committed}T12:00:00Z",
+                            "email": "dev@example.com",
+                        },
+                        "message": f"change {seed}",
+                    },
+                },
+                REPO,
+            ).to_dict()
+            for seed, authored, committed, _ in HISTORY
+        ]
+        self.pr_of = {_sha(seed): pr for seed, _, _, pr in HISTORY}
+        self.seed_of = {_sha(seed): seed for seed, _, _, _ in HISTORY}
+        self.ranges: list[tuple[str, str]] = []
+        self.fail_commits = False
+        self.pending: set[str] = set()
+
+    def collect_commits(
+        self, _repo: str, start_date: str, end_date: str
+    ) -> list[dict[str, Any]] | None:
+        """List commits committed in the range, newest first."""
+        self.ranges.append((start_date, end_date))
+        if self.fail_commits:
+            return None
+        listed = [
+            c
+            for c in self.commits
+            if start_date <= c["committed_date"][:10] <= end_date
+        ]
+        return copy.deepcopy(
+            sorted(listed, key=lambda c: c["committed_date"], reverse=True)
+        )
+
+    def gh_api(self, endpoint: str, *, paginate: bool = False) -> dict[str, Any]:
+        """Serve a commit's diff: each commit pins its own package."""
+        assert paginate
+        seed = self.seed_of[endpoint.rsplit("/", 1)[-1]]
+        return {
+            "files": [
+                {
+                    "filename": "requirements.txt",
+                    "patch": f"-pkg-{seed}==1.0\n+pkg-{seed}==2.0\n",
+                }
+            ]
+        }
+
+    def collect_prs_for_commits(
+        self, repo: str, commits: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Associate each commit with its PR."""
+        prs: dict[int, dict[str, Any]] = {}
+        for commit in commits:
+            number = self.pr_of[commit["sha"]]
+            commit["associated_prs"] = [number]
+            prs.setdefault(
+                number,
+                {
+                    "repo": repo,
+                    "number": number,
+                    "merged": True,
+                    "updated_at": "2026-03-11T00:00:00Z",
+                },
+            )
+        return list(prs.values()), True
+
+    def collect_check_suites(
+        self, repo: str, commits: list[dict[str, Any]]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return one suite per commit, still running for pending commits."""
+        return {
+            c["sha"]: [
+                {
+                    "repo": repo,
+                    "commit_sha": c["sha"],
+                    "status": "in_progress"
+                    if c["sha"] in self.pending
+                    else "completed",
+                    "conclusion": None if c["sha"] in self.pending else "success",
+                }
+            ]
+            for c in commits
+        }
+
+    @staticmethod
+    def collect_pr_commits_and_reviews(
+        repo: str, prs: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Return an empty audit per PR."""
+        return [
+            {
+                "repo": repo,
+                "pr_number": pr["number"],
+                "pr_updated_at": pr["updated_at"],
+                "commits": [],
+                "approvals": [],
+                "commit_count": 0,
+            }
+            for pr in prs
+        ]
+
+
+@pytest.fixture(name="collect")
+def fixture_collect(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """collect.py with its GitHub range fetchers served from HISTORY."""
+    collect = _load_script("collect")
+    fake = FakeGitHub(collect)
+    monkeypatch.setattr(collect, "collect_commits", fake.collect_commits)
+    monkeypatch.setattr(
+        collect, "collect_prs_for_commits", fake.collect_prs_for_commits
+    )
+    monkeypatch.setattr(collect, "collect_check_suites", fake.collect_check_suites)
+    monkeypatch.setattr(
+        collect, "collect_pr_commits_and_reviews", fake.collect_pr_commits_and_reviews
+    )
+    monkeypatch.setattr(collect, "gh_api", fake.gh_api)
+    monkeypatch.setattr(collect, "enrich_dep_release_info", lambda _dep: None)
+    monkeypatch.setattr(collect, "collect_protection_changes", lambda *_args: [])
+    monkeypatch.setattr(collect, "fake_github", fake, raising=False)
+    return collect
+
+
+def _assert_same_window(assembled: dict[str, Any], direct: dict[str, Any]) -> None:
+    """Assert that a window assembled from segments matches a direct fetch."""
+    assert assembled["commits"] == direct["commits"]
+    assert assembled["checks"] == direct["checks"]
+    assert assembled["deps"] == direct["deps"]
+    assert sorted(assembled["prs"], key=lambda pr: pr["number"]) == sorted(
+        direct["prs"], key=lambda pr: pr["number"]
+    )
+    assert sorted(assembled["pr_audits"], key=lambda a: a["pr_number"]) == sorted(
+        direct["pr_audits"],
+        key=lambda a: a["pr_number"],
+    )
+
+
+def _incremental(
+    collect: ModuleType, segments_dir: Path, start_date: str, end_date: str
+) -> dict[str, Any]:
+    """Collect a window through the per-day segment store."""
+    incremental = collect._collect_window_incrementally  # noqa: SLF001
+    return incremental(REPO, start_date, end_date, segments_dir)  # type: ignore[no-any-return]
+
+
+def _direct(collect: ModuleType, start_date: str, end_date: str) -> dict[str, Any]:
+    """Fetch a window directly, bypassing the segment store."""
+    window, complete = collect._collect_window_artifacts(  # noqa: SLF001
+        REPO, start_date, end_date
+    )
+    assert complete
+    return window  # type: ignore[no-any-return]
+
+
+def test_overlapping_windows_match_direct_fetch(
+    collect: ModuleType, tmp_path: Path
+) -> None:
+    """Windows assembled from reused segments equal a fresh fetch of the same days."""
+    segments_dir = tmp_path / "segments"
+    _incremental(collect, segments_dir, "2026-03-01", "2026-03-06")
+    later = _incremental(collect, segments_dir, "2026-03-04", "2026-03-10")
+    inner = _incremental(collect, segments_dir, "2026-03-03", "2026-03-05")
+
+    # Only the days not yet covered are fetched.
+    assert collect.fake_github.ranges == [
+        ("2026-03-01", "2026-03-06"),
+        ("2026-03-07", "2026-03-10"),
+    ]
+    _assert_same_window(later, _direct(collect, "2026-03-04", "2026-03-10"))
+    _assert_same_window(inner, _direct(collect, "2026-03-03", "2026-03-05"))
+
+
+def test_rebased_commit_follows_committer_date(
+    collect: ModuleType, tmp_path: Path
+) -> None:
+    """A commit authored before the window but committed inside it is part of the window."""
+    segments_dir = tmp_path / "segments"
+    _incremental(collect, segments_dir, "2026-03-01", "2026-03-10")
+
+    early = _incremental(collect, segments_dir, "2026-03-01", "2026-03-03")
+    late = _incremental(collect, segments_dir, "2026-03-05", "2026-03-08")
+
+    assert _sha(3) not in {c["sha"] for c in early["commits"]}
+    assert _sha(3) in {c["sha"] for c in late["commits"]}
+    assert len(collect.fake_github.ranges) == 1
+
+
+def test_failed_fetch_is_not_marked_covered(
+    collect: ModuleType, tmp_path: Path
+) -> None:
+    """Days whose fetch failed are refetched by the next run instead of reused as empty."""
+    segments_dir = tmp_path / "segments"
+    collect.fake_github.fail_commits = True
+    failed = _incremental(collect, segments_dir, "2026-03-01", "2026-03-05")
+    assert failed["commits"] == []
+    assert collect.read_segment_coverage(segments_dir, REPO) == set()
+
+    collect.fake_github.fail_commits = False
+    retried = _incremental(collect, segments_dir, "2026-03-01", "2026-03-05")
+    assert collect.fake_github.ranges == [("2026-03-01", "2026-03-05")] * 2
+    _assert_same_window(retried, _direct(collect, "2026-03-01", "2026-03-05"))
+    assert collect.read_segment_coverage(segments_dir, REPO) == set(
+        collect.iter_days("2026-03-01", "2026-03-05")
+    )
+
+
+def test_dep_changes_follow_their_commit(collect: ModuleType, tmp_path: Path) -> None:
+    """Each dependency change is stamped with, and filed under, its own commit."""
+    segments_dir = tmp_path / "segments"
+    _incremental(collect, segments_dir, "2026-03-01", "2026-03-06")
+
+    inner = _incremental(collect, segments_dir, "2026-03-03", "2026-03-05")
+    single = _direct(collect, "2026-03-09", "2026-03-09")
+
+    assert {d["package_name"]: d["commit_sha"] for d in inner["deps"]} == {
+        "pkg-3": _sha(3),
+        "pkg-4": _sha(4),
+        "pkg-5": _sha(5),
+    }
+    assert {d["commit_date"] for d in inner["deps"]} == {"2026-03-04", "2026-03-05"}
+    assert [d["package_name"] for d in single["deps"]] == ["pkg-6"]
+
+
+def test_day_with_running_checks_is_refetched(
+    collect: ModuleType, tmp_path: Path
+) -> None:
+    """A day whose check suites are still running is refetched until they complete."""
+    segments_dir = tmp_path / "segments"
+    collect.fake_github.pending = {_sha(4)}
+    running = _incremental(collect, segments_dir, "2026-03-03", "2026-03-05")
+    assert running["checks"][_sha(4)][0]["status"] == "in_progress"
+    assert collect.read_segment_coverage(segments_dir, REPO) == {
+        "2026-03-03",
+        "2026-03-05",
+    }
+
+    collect.fake_github.pending = set()
+    settled = _incremental(collect, segments_dir, "2026-03-03", "2026-03-05")
+    assert collect.fake_github.ranges[-1] == ("2026-03-04", "2026-03-04")
+    assert settled["checks"][_sha(4)][0]["status"] == "completed"
+    _assert_same_window(settled, _direct(collect, "2026-03-03", "2026-03-05"))
+    assert collect.read_segment_coverage(segments_dir, REPO) == set(
+        collect.iter_days("2026-03-03", "2026-03-05")
+    )
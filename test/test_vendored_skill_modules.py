@@ -0,0 +1,85 @@
+"""Tests for the GitHub client modules the guardian vendors from the audit skill."""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SKILLS_DIR = ROOT / ".agents" / "skills"
+# Addressed by SHA, so served from the cache without revalidation.
+ENDPOINT = f"repos/ansible/example/commits/{'a' * 40}"
+
+
+def _load_module(name: str, path: Path) -> ModuleType:
+    """Import a file as a module registered under ``name``."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_client(skill: str, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Import one skill's ``github_client`` bound to that skill's ``http_cache``."""
+    scripts = SKILLS_DIR / skill / "scripts"
+    monkeypatch.delitem(sys.modules, "http_cache", raising=False)
+    http_cache = _load_module(f"{skill}.http_cache", scripts / "http_cache.py")
+    monkeypatch.setitem(sys.modules, "http_cache", http_cache)
+    return _load_module(f"{skill}.github_client", scripts / "github_client.py")
+
+
+def test_vendored_copies_are_current() -> None:
+    """Every vendored copy matches what the vendoring tool generates."""
+    tool = _load_module(
+        "vendor_skill_modules", ROOT / "tools" / "vendor_skill_modules.py"
+    )
+
+    for path, content in tool.vendored_copies().items():
+        assert path.read_text(encoding="utf-8") == content, path
+
+
+@pytest.mark.parametrize(
+    ("writer", "reader"),
+    (
+        pytest.param("td-supply-chain-audit", "td-guardian", id="audit-to-guardian"),
+        pytest.param("td-guardian", "td-supply-chain-audit", id="guardian-to-audit"),
+    ),
+)
+def test_cache_entries_are_shared(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, writer: str, reader: str
+) -> None:
+    """A response cached by one skill's client is served by the other's."""
+    data = {"sha": "a" * 40, "files": []}
+    writing = _load_client(writer, monkeypatch)
+    client = writing.GitHubClient(
+        "token", http_cache=sys.modules["http_cache"].HttpCache(tmp_path)
+    )
+    monkeypatch.setattr(
+        client,
+        "_follow_redirects",
+        lambda *_args, **_kwargs: writing.GitHubResponse(
+            status=200, headers={"etag": '"v1"'}, data=data
+        ),
+    )
+    assert client.fetch(ENDPOINT).data == data
+
+    reading = _load_client(reader, monkeypatch)
+    client = reading.GitHubClient(
+        "token", http_cache=sys.modules["http_cache"].HttpCache(tmp_path)
+    )
+
+    def offline(*_args: object, **_kwargs: object) -> None:
+        pytest.fail("cached response was fetched again")
+
+    monkeypatch.setattr(client, "_follow_redirects", offline)
+    response = client.fetch(ENDPOINT)
+
+    assert response.ok
+    assert response.data == data
+    assert client.http_cache.hits == 1
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Copy shared skill modules into the skills that vendor them.
+
+Skills are synced to downstream repositories one directory at a time, so a
+skill cannot import from another. Modules several skills need live in one
+source skill and are copied verbatim, behind a generated header, into the
+others. Edit the source module and re-run this script; ``--check`` only
+reports copies that are out of date.
+
+Usage: ./tools/vendor_skill_modules.py [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+
+SKILLS_DIR = Path(__file__).resolve().parents[1] / ".agents" / "skills"
+SOURCE_SKILL = "td-supply-chain-audit"
+# Skill -> script modules it vendors from SOURCE_SKILL.
+VENDORED: dict[str, tuple[str, ...]] = {
+    "td-guardian": ("github_client.py", "http_cache.py"),
+}
+HEADER = (
+    "# Vendored from .agents/skills/{skill}/scripts/{name} by\n"
+    "# tools/vendor_skill_modules.py; edit the source and re-run it.\n"
+)
+
+
+def vendored_copies() -> dict[Path, str]:
+    """Build the expected content of every vendored copy.
+
+    Returns:
+        Expected file content keyed by the path of the copy.
+
+    """
+    source_dir = SKILLS_DIR / SOURCE_SKILL / "scripts"
+    copies = {}
+    for skill, names in VENDORED.items():
+        for name in names:
+            header = HEADER.format(skill=SOURCE_SKILL, name=name)
+            content = (source_dir / name).read_text(encoding="utf-8")
+            copies[SKILLS_DIR / skill / "scripts" / name] = header + content
+    return copies
+
+
+def main() -> int:
+    """Write or check the vendored copies.
+
+    Returns:
+        Exit code: ``1`` when a copy was rewritten or is out of date.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only report stale copies")
+    args = parser.parse_args()
+
+    stale = []
+    for path, content in vendored_copies().items():
+        if path.exists() and path.read_text(encoding="utf-8") == content:
+            continue
+        stale.append(path)
+        if not args.check:
+            path.write_text(content, encoding="utf-8")
+    for path in stale:
+        verb = "out of date" if args.check else "updated"
+        sys.stderr.write(f"{path.relative_to(SKILLS_DIR.parents[1])}: {verb}\n")
+    return 1 if stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())